@@ -0,0 +1,166 @@
+"""
+Answer Pre-Scorer - Local Scoring of Non-Answers
+
+Many submitted answers are empty, only filler words, "I don't know" or a
+pasted copy of the question. Evaluating them with the LLM costs a full generation
+and gives the same verdict every time, so these cases are recognized locally
+(content words, lexical overlap and term-frequency cosine similarity with
+the question) and scored deterministically. Anything the pre-scorer
+is not confident about returns None and is evaluated by the LLM.
+"""
+
+import unicodedata
+from typing import Dict, List, Any, Optional
+
+try:
+    from utils.config import EvaluationConfig, InterviewConfig
+    from utils.text_similarity import normalize_text, content_words, cosine_similarity
+except ImportError:
+    # Fallback for direct execution
+    import sys
+    from pathlib import Path
+    sys.path.append(str(Path(__file__).parent.parent))
+    from utils.config import EvaluationConfig, InterviewConfig
+    from utils.text_similarity import normalize_text, content_words, cosine_similarity
+
+
+# Normalized (accent-folded, lowercase, punctuation-free) non-answers in the supported languages.
+# Words that are also terse real answers ("pass", "skip", "na" for sodium) are left to the LLM.
+_DONT_KNOW_PHRASES = [
+    "i don t know", "i dont know", "don t know", "dont know", "idk", "no idea", "not sure",
+    "i have no idea", "no clue", "i m not sure", "i can t answer",
+    "no se", "no lo se", "ni idea",                   # es
+    "je ne sais pas", "je sais pas", "aucune idee",   # fr
+    "ich weiss nicht", "weiss nicht", "keine ahnung", # de
+    "non lo so", "non so", "nessuna idea",            # it
+    "nao sei", "eu nao sei", "nao faco ideia",        # pt
+]
+
+# Words that may surround a "don't know" phrase without adding an answer
+_FILLER = {
+    "sorry", "really", "honestly", "unfortunately", "actually", "um", "uh", "hmm", "well", "ok", "okay",
+    "so", "i", "m", "am", "im", "the", "answer", "to", "this", "that", "question", "one", "about", "it",
+    "yet", "at", "all", "here", "je", "suis", "desole", "lo", "siento", "mi", "dispiace", "leider", "desculpe",
+}
+
+# Deterministic scores per case; all low enough to recommend an easier level
+SCORES = {
+    "empty": 0,
+    "dont_know": 5,
+    "copied_question": 10,
+    "no_content": 20,
+}
+
+_FEEDBACK = {
+    "empty": "No answer was given. Even a partial answer or your reasoning about the question earns credit.",
+    "dont_know": "You said you did not know the answer. Try to reason aloud from related concepts you do know; partial answers earn credit.",
+    "copied_question": "The answer repeats the question instead of answering it. Explain the concept in your own words and add an example.",
+    "no_content": "The answer does not say anything about the question. Explain your reasoning and support it with a concrete example.",
+}
+
+_IMPROVEMENTS = {
+    "empty": ["Attempt an answer", "Explain your reasoning"],
+    "dont_know": ["Reason from related knowledge", "Give a partial answer"],
+    "copied_question": ["Answer in your own words", "Add specific examples"],
+    "no_content": ["Address the question directly", "Include specific examples"],
+}
+
+
+def _fold(text: str) -> str:
+    """normalize_text with accents removed (so "no lo sé" matches "no lo se")."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return normalize_text("".join(c for c in decomposed if not unicodedata.combining(c)))
+
+
+class AnswerPrescorer:
+    """Scores obvious non-answers locally and counts how many LLM evaluations were skipped."""
+    
+    def __init__(self):
+        """Initialize pre-scorer counters."""
+        self.checked = 0
+        self.skipped = {reason: 0 for reason in SCORES}
+        self._dont_know = {_fold(p) for p in _DONT_KNOW_PHRASES}
+    
+    def score(self,
+              question_text: str,
+              question_level: int,
+              answer_text: str,
+              topics: Optional[List[str]] = None,
+              **_) -> Optional[Dict[str, Any]]:
+        """
+        Score an answer locally if it is clearly not a real answer.
+        
+        Takes evaluate_answer's arguments (others are ignored).
+        
+        Returns:
+            Evaluation dictionary shaped like evaluate_answer's (plus
+            "prescored": the reason), or None if the LLM should evaluate it
+        """
+        self.checked += 1
+        reason = self._classify(question_text, answer_text)
+        if reason is None:
+            return None
+        
+        self.skipped[reason] += 1
+        score = SCORES[reason]
+        return {
+            "overall_score": score,
+            "subscores": {
+                "correctness": score,
+                "depth": score,
+                "clarity": score,
+                "relevance": score
+            },
+            "feedback": _FEEDBACK[reason],
+            "level_recommendation": "DECREASE",
+            "level_adjustment": -1 if question_level > InterviewConfig.MIN_LEVEL else 0,
+            "strengths": [],
+            "improvements": list(_IMPROVEMENTS[reason]),
+            "prescored": reason
+        }
+    
+    def _classify(self, question_text: str, answer_text: str) -> Optional[str]:
+        """Reason the answer can be scored locally, or None."""
+        folded = _fold(answer_text)
+        words = folded.split()
+        if not words:
+            return "empty"
+        
+        if len(words) <= EvaluationConfig.PRESCORE_IDK_MAX_WORDS and self._says_dont_know(folded):
+            return "dont_know"
+        
+        answer_words = content_words(answer_text)
+        if not answer_words:
+            # Only stopwords ("it is", "the same"). Terse answers with content ("PUT", "log n") go to the LLM.
+            return "no_content"
+        
+        if cosine_similarity(answer_text, question_text) >= EvaluationConfig.PRESCORE_COPY_SIMILARITY:
+            question_words = set(content_words(question_text))
+            new_words = [w for w in answer_words if w not in question_words]
+            if len(new_words) / len(answer_words) <= EvaluationConfig.PRESCORE_COPY_MAX_NEW_WORDS:
+                return "copied_question"
+        
+        return None
+    
+    def _says_dont_know(self, folded: str) -> bool:
+        """Whether a (short, folded) answer is essentially "I don't know"."""
+        if folded in self._dont_know:
+            return True
+        padded = f" {folded} "
+        # Only filler may surround the phrase ("sorry, I don't know really"); "not sure, maybe a queue" is an answer
+        for phrase in self._dont_know:
+            if f" {phrase} " in padded:
+                rest = padded.replace(f" {phrase} ", " ", 1).split()
+                if all(word in _FILLER for word in rest):
+                    return True
+        return False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Pre-scoring counters and skip rate."""
+        skipped = sum(self.skipped.values())
+        return {
+            "checked": self.checked,
+            "skipped": skipped,
+            "skip_rate": round(skipped / self.checked, 3) if self.checked else None,
+            "by_reason": dict(self.skipped)
+        }
@@ -6,13 +6,17 @@ providing detailed scoring, feedback, and recommendations for difficulty level a
 """
 
 import os
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
+import httpx
 from ollama import Client
 
 try:
     from backend.utils.config import EvaluationConfig, InterviewConfig, OllamaConfig
     from backend.utils.scoring import calculate_subscores_from_overall, update_level
     from backend.models.evaluation import calculate_overall_score
+    from backend.agents.llm_gateway import get_gateway
+    from backend.agents.stream_parsers import EvaluationStreamParser
+    from backend.agents.answer_prescorer import AnswerPrescorer
 except ImportError:
     # Fallback for direct execution
     import sys
@@ -21,6 +25,60 @@ except ImportError:
     from utils.config import EvaluationConfig, InterviewConfig, OllamaConfig
     from utils.scoring import calculate_subscores_from_overall, update_level
     from models.evaluation import calculate_overall_score
+    from agents.llm_gateway import get_gateway
+    from agents.stream_parsers import EvaluationStreamParser
+    from agents.answer_prescorer import AnswerPrescorer
+
+
+DIFFICULTY_DESCRIPTIONS = {
+    1: "entry-level/junior",
+    2: "junior",
+    3: "mid-level",
+    4: "senior",
+    5: "expert/architect"
+}
+
+# Identical for every evaluation, so the model server can reuse its cached
+# prefix; the question context and answer go in the user message.
+EVALUATION_SYSTEM_PROMPT = """You are an expert technical interviewer evaluating candidates' responses to interview questions.
+Each request gives the question with its type, difficulty, topics and position, followed by the candidate's answer.
+
+Please evaluate the answer across the following criteria and provide scores from 0-100:
+
+1. CORRECTNESS: How technically accurate and factually correct is the answer?
+2. DEPTH: How thoroughly does the answer explore the topic? Does it show deep understanding?
+3. CLARITY: How well-structured and clearly communicated is the response?
+4. RELEVANCE: How well does the answer address the specific question asked?
+
+Also consider:
+- Is the answer appropriate for the question's difficulty level?
+- Does it demonstrate the skills expected for the position?
+- What are the candidate's main strengths and areas for improvement?
+
+Please provide your response in this exact format:
+
+CORRECTNESS: [score 0-100]
+DEPTH: [score 0-100] 
+CLARITY: [score 0-100]
+RELEVANCE: [score 0-100]
+OVERALL: [score 0-100]
+LEVEL_RECOMMENDATION: [INCREASE/MAINTAIN/DECREASE]
+STRENGTHS: [bullet point list of 2-3 key strengths]
+IMPROVEMENTS: [bullet point list of 2-3 areas for improvement]
+FEEDBACK: [detailed constructive feedback paragraph]
+END
+
+Finish with the line END once the feedback is complete."""
+
+EVALUATION_PROMPT_TEMPLATE = """QUESTION CONTEXT:
+- Question: {question_text}
+- Type: {question_type}
+- Difficulty: {question_level}/5 ({difficulty})
+- Topics: {topics}
+- Position: {job_title}
+
+CANDIDATE'S ANSWER:
+{answer_text}"""
 
 
 class EvaluatorAgent:
@@ -43,8 +101,11 @@ class EvaluatorAgent:
         
         self.client = Client(
             host=OllamaConfig.OLLAMA_HOST,
-            headers=headers if headers else None
+            headers=headers if headers else None,
+            timeout=httpx.Timeout(OllamaConfig.REQUEST_TIMEOUT, connect=OllamaConfig.CONNECT_TIMEOUT)
         )
+        # Empty, "I don't know" and copied answers are scored without the LLM
+        self.prescorer = AnswerPrescorer() if EvaluationConfig.PRESCORE_ENABLED else None
     
     def evaluate_answer(self,
                        question_text: str,
@@ -73,39 +134,103 @@ class EvaluatorAgent:
             - strengths: List of identified strengths
             - improvements: List of areas for improvement
         """
+        prescored = self._prescore(question_text, question_level, answer_text, topics)
+        if prescored is not None:
+            return prescored
+        
         try:
-            # Build evaluation prompt
-            prompt = self._build_evaluation_prompt(
+            # Static instructions as the system prompt, the answer in context as a short user message
+            messages = self._build_evaluation_messages(
                 question_text, question_type, question_level, answer_text, job_title, topics
             )
             
-            # Get evaluation from Ollama
-            messages = [{"role": "user", "content": prompt}]
-            
+            # Stop reading once every field the parser needs has arrived
+            stream_parser = EvaluationStreamParser()
             response_parts = []
-            for part in self.client.chat(
-                OllamaConfig.OLLAMA_MODEL,
-                messages=messages,
-                stream=True,
-                options={
-                    "temperature": 0.3,  # Lower temperature for more consistent scoring
-                    "top_p": OllamaConfig.TOP_P,
-                    "num_predict": OllamaConfig.MAX_TOKENS
-                }
-            ):
-                if 'message' in part and 'content' in part['message']:
-                    response_parts.append(part['message']['content'])
+            # Shared circuit breaker: fails fast to the fallback while the LLM is down
+            with get_gateway().guard():
+                stream = self.client.chat(
+                    OllamaConfig.OLLAMA_MODEL,
+                    messages=messages,
+                    stream=True,
+                    options=self._generation_options()
+                )
+                for part in stream:
+                    if part.get('done'):
+                        get_gateway().record_usage("evaluation", part)
+                    if 'message' in part and 'content' in part['message']:
+                        response_parts.append(part['message']['content'])
+                        if stream_parser.feed(part['message']['content']):
+                            stream.close()
+                            break
             
-            response_text = ''.join(response_parts)
+            response_text = stream_parser.text if stream_parser.complete else ''.join(response_parts)
             
             # Parse the LLM response to extract structured evaluation data
             return self._parse_evaluation_response(response_text, question_level)
-            
+        
         except Exception as e:
             print(f"Error evaluating answer with Ollama: {e}")
             # Fallback to basic evaluation if LLM fails
             return self._generate_fallback_evaluation(answer_text, question_level)
     
+    async def aevaluate_answer(self,
+                               question_text: str,
+                               question_type: str,
+                               question_level: int,
+                               answer_text: str,
+                               job_title: str,
+                               topics: List[str] = None,
+                               on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """
+        Async variant of evaluate_answer for use from the API event loop.
+        
+        Goes through the shared LLM gateway (connection pool, concurrency
+        limit, latency-aware timeout, retries, circuit breaker); takes the
+        same arguments and returns the same dictionary, falling back to a
+        basic evaluation on error, timeout or while the breaker is open.
+        on_token, if given, receives the raw model output as it streams in.
+        """
+        prescored = self._prescore(question_text, question_level, answer_text, topics)
+        if prescored is not None:
+            return prescored
+        
+        try:
+            messages = self._build_evaluation_messages(
+                question_text, question_type, question_level, answer_text, job_title, topics
+            )
+            
+            stream_parser = EvaluationStreamParser()
+            response_text = await get_gateway().chat(
+                messages, self._generation_options(), on_token=on_token, stop=stream_parser.feed, task="evaluation"
+            )
+            if stream_parser.complete:
+                response_text = stream_parser.text
+            
+            return self._parse_evaluation_response(response_text, question_level)
+        
+        except Exception as e:
+            print(f"Error evaluating answer with Ollama: {e!r}")
+            return self._generate_fallback_evaluation(answer_text, question_level)
+    
+    def _prescore(self,
+                  question_text: str,
+                  question_level: int,
+                  answer_text: str,
+                  topics: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+        """Local evaluation of an obvious non-answer, or None to ask the LLM."""
+        if self.prescorer is None:
+            return None
+        return self.prescorer.score(question_text, question_level, answer_text, topics)
+    
+    def _generation_options(self) -> Dict[str, Any]:
+        """Ollama options for answer evaluation."""
+        return {
+            "temperature": 0.3,  # Lower temperature for more consistent scoring
+            "top_p": OllamaConfig.TOP_P,
+            "num_predict": OllamaConfig.EVALUATION_MAX_TOKENS
+        }
+    
     def _build_evaluation_prompt(self,
                                 question_text: str,
                                 question_type: str,
@@ -113,55 +238,33 @@ class EvaluatorAgent:
                                 answer_text: str,
                                 job_title: str,
                                 topics: List[str] = None) -> str:
-        """Build the prompt for answer evaluation."""
-        
-        difficulty_desc = {
-            1: "entry-level/junior",
-            2: "junior", 
-            3: "mid-level",
-            4: "senior",
-            5: "expert/architect"
-        }
-        
-        topics_str = ", ".join(topics) if topics else "general"
-        
-        prompt = f"""You are an expert technical interviewer evaluating a candidate's response for a {job_title} position.
-
-QUESTION CONTEXT:
-- Question: {question_text}
-- Type: {question_type}
-- Difficulty: {question_level}/5 ({difficulty_desc.get(question_level, 'unknown')})
-- Topics: {topics_str}
-- Position: {job_title}
-
-CANDIDATE'S ANSWER:
-{answer_text}
-
-Please evaluate this answer across the following criteria and provide scores from 0-100:
-
-1. CORRECTNESS: How technically accurate and factually correct is the answer?
-2. DEPTH: How thoroughly does the answer explore the topic? Does it show deep understanding?
-3. CLARITY: How well-structured and clearly communicated is the response?
-4. RELEVANCE: How well does the answer address the specific question asked?
-
-Also consider:
-- Is the answer appropriate for the {difficulty_desc.get(question_level, 'unknown')} level?
-- Does it demonstrate the skills expected for a {job_title}?
-- What are the candidate's main strengths and areas for improvement?
-
-Please provide your response in this exact format:
-
-CORRECTNESS: [score 0-100]
-DEPTH: [score 0-100] 
-CLARITY: [score 0-100]
-RELEVANCE: [score 0-100]
-OVERALL: [score 0-100]
-LEVEL_RECOMMENDATION: [INCREASE/MAINTAIN/DECREASE]
-STRENGTHS: [bullet point list of 2-3 key strengths]
-IMPROVEMENTS: [bullet point list of 2-3 areas for improvement]
-FEEDBACK: [detailed constructive feedback paragraph]"""
+        """Build the per-answer part of the prompt (sent after EVALUATION_SYSTEM_PROMPT)."""
         
-        return prompt
+        return EVALUATION_PROMPT_TEMPLATE.format(
+            question_text=question_text,
+            question_type=question_type,
+            question_level=question_level,
+            difficulty=DIFFICULTY_DESCRIPTIONS.get(question_level, 'unknown'),
+            topics=", ".join(topics) if topics else "general",
+            job_title=job_title,
+            answer_text=answer_text
+        )
+    
+    def _build_evaluation_messages(self,
+                                   question_text: str,
+                                   question_type: str,
+                                   question_level: int,
+                                   answer_text: str,
+                                   job_title: str,
+                                   topics: List[str] = None) -> List[Dict[str, str]]:
+        """Chat messages for an evaluation: the shared system prompt, then the answer in context."""
+        prompt = self._build_evaluation_prompt(
+            question_text, question_type, question_level, answer_text, job_title, topics
+        )
+        return [
+            {"role": "system", "content": EVALUATION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
     
     def _parse_evaluation_response(self, response: str, question_level: int) -> Dict[str, Any]:
         """Parse the LLM response into structured evaluation data."""
@@ -216,6 +319,12 @@ FEEDBACK: [detailed constructive feedback paragraph]"""
                 current_section = "improvements"
             elif line.startswith("FEEDBACK:"):
                 current_section = "feedback"
+                # Feedback often starts on the label line itself
+                inline = line.replace("FEEDBACK:", "", 1).strip()
+                if inline:
+                    feedback += inline + " "
+            elif line == "END":
+                current_section = None
             elif line.startswith("-") or line.startswith("•"):
                 # Bullet point
                 if current_section == "strengths":
@@ -267,7 +376,7 @@ FEEDBACK: [detailed constructive feedback paragraph]"""
             base_score = 70
         else:
             base_score = 80
-            
+        
         # Add some randomness but keep it reasonable
         import random
         score_variation = random.randint(-10, 10)
@@ -298,5 +407,6 @@ FEEDBACK: [detailed constructive feedback paragraph]"""
             "level_recommendation": level_recommendation,
             "level_adjustment": level_adjustment,
             "strengths": ["Clear communication", "Relevant response"],
-            "improvements": ["Add more depth", "Include specific examples"]
+            "improvements": ["Add more depth", "Include specific examples"],
+            "is_fallback": True
         }
\ No newline at end of file
@@ -6,12 +6,15 @@ based on job requirements, difficulty level, and adaptive learning context.
 """
 
 import os
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
+import httpx
 from ollama import Client
 
 try:
     from utils.config import QuestionConfig, get_job_categories, InterviewConfig, OllamaConfig
     from utils.id_utils import generate_short_id
+    from agents.llm_gateway import get_gateway
+    from agents.stream_parsers import QuestionStreamParser
 except ImportError:
     # Fallback for direct execution
     import sys
@@ -19,6 +22,51 @@ except ImportError:
     sys.path.append(str(Path(__file__).parent.parent))
     from utils.config import QuestionConfig, get_job_categories, InterviewConfig, OllamaConfig
     from utils.id_utils import generate_short_id
+    from agents.llm_gateway import get_gateway
+    from agents.stream_parsers import QuestionStreamParser
+
+
+DIFFICULTY_DESCRIPTIONS = {
+    1: "entry-level/junior",
+    2: "junior",
+    3: "mid-level",
+    4: "senior",
+    5: "expert/architect"
+}
+
+# Identical for every request, so the model server can reuse its cached
+# prefix; everything request-specific goes in the user message.
+QUESTION_SYSTEM_PROMPT = """You are an expert technical interviewer. You generate SHORT, QUIZ-LIKE interview questions.
+Each request gives the position, question type, difficulty level, focus areas and language, and may list previous questions to avoid.
+
+QUESTION STYLE REQUIREMENTS:
+1. CONCISE and DIRECT - maximum 1-2 sentences
+2. QUIZ-LIKE format - test specific knowledge, not scenarios
+3. APPROPRIATE for the requested difficulty level - not harder!
+4. Quick to read and understand
+5. Focused on ONE specific concept
+6. Written in the requested language
+
+DIFFICULTY LEVEL GUIDELINES:
+- Level 1 (entry-level): Basic definitions, simple concepts, fundamental knowledge
+- Level 2 (junior): Basic application, simple tools, common practices  
+- Level 3 (mid-level): Practical application, intermediate concepts, best practices
+- Level 4 (senior): Advanced concepts, complex scenarios, design decisions
+- Level 5 (expert): Cutting-edge technologies, architecture, leadership decisions
+
+EXAMPLES FOR REFERENCE:
+Level 1: "What is Git and why is it used in software development?"
+Level 2: "Name three common Python data types and their use cases."
+Level 3: "Explain the difference between supervised and unsupervised machine learning."
+Level 4: "How would you optimize a machine learning model that's overfitting?"
+Level 5: "Design a distributed ML pipeline architecture for real-time predictions."
+
+Please provide your response in this exact format:
+
+QUESTION: [Your SHORT quiz question here - 1-2 sentences max]
+TOPICS: [comma-separated list of 2-3 main topics]
+TIME: [estimated minutes: 2-3 for levels 1-2, 3-5 for levels 3-4, 5-7 for level 5]
+CONTEXT: [brief context if needed, or leave empty for straightforward questions]"""
 
 
 class InterviewerAgent:
@@ -42,7 +90,8 @@ class InterviewerAgent:
         
         self.client = Client(
             host=OllamaConfig.OLLAMA_HOST,
-            headers=headers if headers else None
+            headers=headers if headers else None,
+            timeout=httpx.Timeout(OllamaConfig.REQUEST_TIMEOUT, connect=OllamaConfig.CONNECT_TIMEOUT)
         )
         
     def generate_question(self, 
@@ -74,29 +123,32 @@ class InterviewerAgent:
             - context: Additional context or hints for the candidate
         """
         try:
-            # Construct the prompt for question generation
-            prompt = self._build_question_prompt(
+            # Static instructions as the system prompt, the request as a short user message
+            messages = self._build_question_messages(
                 job_title, level, keywords, question_type, language, previous_questions
             )
             
-            # Generate question using Ollama
-            messages = [{"role": "user", "content": prompt}]
-            
+            # Stop reading once every field the parser needs has arrived
+            stream_parser = QuestionStreamParser()
             response_parts = []
-            for part in self.client.chat(
-                OllamaConfig.OLLAMA_MODEL,
-                messages=messages,
-                stream=True,
-                options={
-                    "temperature": OllamaConfig.TEMPERATURE,
-                    "top_p": OllamaConfig.TOP_P,
-                    "num_predict": OllamaConfig.MAX_TOKENS
-                }
-            ):
-                if 'message' in part and 'content' in part['message']:
-                    response_parts.append(part['message']['content'])
+            # Shared circuit breaker: fails fast to the fallback while the LLM is down
+            with get_gateway().guard():
+                stream = self.client.chat(
+                    OllamaConfig.OLLAMA_MODEL,
+                    messages=messages,
+                    stream=True,
+                    options=self._generation_options()
+                )
+                for part in stream:
+                    if part.get('done'):
+                        get_gateway().record_usage("question", part)
+                    if 'message' in part and 'content' in part['message']:
+                        response_parts.append(part['message']['content'])
+                        if stream_parser.feed(part['message']['content']):
+                            stream.close()
+                            break
             
-            response_text = ''.join(response_parts)
+            response_text = stream_parser.text if stream_parser.complete else ''.join(response_parts)
             
             # Parse the LLM response to extract structured question data
             return self._parse_question_response(response_text, level, question_type)
@@ -106,6 +158,49 @@ class InterviewerAgent:
             # Fallback to a basic question if LLM fails
             return self._generate_fallback_question(job_title, level, question_type)
     
+    async def agenerate_question(self, 
+                                 job_title: str,
+                                 level: int,
+                                 keywords: List[str],
+                                 question_type: str,
+                                 language: str = "en",
+                                 previous_questions: Optional[List[str]] = None,
+                                 on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """
+        Async variant of generate_question for use from the API event loop.
+        
+        Goes through the shared LLM gateway (connection pool, concurrency
+        limit, latency-aware timeout, retries, circuit breaker); takes the
+        same arguments and returns the same dictionary, falling back to a
+        basic question on error, timeout or while the breaker is open.
+        on_token, if given, receives the raw model output as it streams in.
+        """
+        try:
+            messages = self._build_question_messages(
+                job_title, level, keywords, question_type, language, previous_questions
+            )
+            
+            stream_parser = QuestionStreamParser()
+            response_text = await get_gateway().chat(
+                messages, self._generation_options(), on_token=on_token, stop=stream_parser.feed, task="question"
+            )
+            if stream_parser.complete:
+                response_text = stream_parser.text
+            
+            return self._parse_question_response(response_text, level, question_type)
+            
+        except Exception as e:
+            print(f"Error generating question with Ollama: {e!r}")
+            return self._generate_fallback_question(job_title, level, question_type)
+    
+    def _generation_options(self) -> Dict[str, Any]:
+        """Ollama options for question generation."""
+        return {
+            "temperature": OllamaConfig.TEMPERATURE,
+            "top_p": OllamaConfig.TOP_P,
+            "num_predict": OllamaConfig.QUESTION_MAX_TOKENS
+        }
+    
     def _build_question_prompt(self, 
                               job_title: str,
                               level: int,
@@ -113,61 +208,36 @@ class InterviewerAgent:
                               question_type: str,
                               language: str,
                               previous_questions: Optional[List[str]]) -> str:
-        """Build the prompt for question generation."""
-        
-        difficulty_desc = {
-            1: "entry-level/junior",
-            2: "junior",
-            3: "mid-level",
-            4: "senior",
-            5: "expert/architect"
-        }
+        """Build the per-request part of the prompt (sent after QUESTION_SYSTEM_PROMPT)."""
         
         keywords_str = ", ".join(keywords) if keywords else "general skills"
         previous_str = ""
         if previous_questions:
             previous_str = f"\n\nPrevious questions asked (avoid similar topics):\n" + "\n".join(f"- {q}" for q in previous_questions[-3:])
         
-        prompt = f"""You are an expert technical interviewer. Generate a SHORT, QUIZ-LIKE {question_type} question for a {job_title} position.
-
-CRITICAL REQUIREMENTS:
-- Difficulty level: {level}/5 ({difficulty_desc.get(level, 'unknown')}) - STRICTLY follow this difficulty level
+        prompt = f"""Generate a {question_type} question for a {job_title} position.
+- Difficulty level: {level}/5 ({DIFFICULTY_DESCRIPTIONS.get(level, 'unknown')}) - STRICTLY follow this difficulty level
 - Focus areas: {keywords_str}
-- Question type: {question_type}
-- Language: {language}
-
-QUESTION STYLE REQUIREMENTS:
-1. CONCISE and DIRECT - maximum 1-2 sentences
-2. QUIZ-LIKE format - test specific knowledge, not scenarios
-3. APPROPRIATE for {difficulty_desc.get(level, 'unknown')} level - not harder!
-4. Quick to read and understand
-5. Focused on ONE specific concept
-
-DIFFICULTY LEVEL GUIDELINES:
-- Level 1 (entry-level): Basic definitions, simple concepts, fundamental knowledge
-- Level 2 (junior): Basic application, simple tools, common practices  
-- Level 3 (mid-level): Practical application, intermediate concepts, best practices
-- Level 4 (senior): Advanced concepts, complex scenarios, design decisions
-- Level 5 (expert): Cutting-edge technologies, architecture, leadership decisions
-
-EXAMPLES FOR REFERENCE:
-Level 1: "What is Git and why is it used in software development?"
-Level 2: "Name three common Python data types and their use cases."
-Level 3: "Explain the difference between supervised and unsupervised machine learning."
-Level 4: "How would you optimize a machine learning model that's overfitting?"
-Level 5: "Design a distributed ML pipeline architecture for real-time predictions."
-
-Please provide your response in this exact format:
-
-QUESTION: [Your SHORT quiz question here - 1-2 sentences max]
-TOPICS: [comma-separated list of 2-3 main topics]
-TIME: [estimated minutes: 2-3 for levels 1-2, 3-5 for levels 3-4, 5-7 for level 5]
-CONTEXT: [brief context if needed, or leave empty for straightforward questions]
-
-{previous_str}"""
+- Language: {language}{previous_str}"""
         
         return prompt
     
+    def _build_question_messages(self,
+                                 job_title: str,
+                                 level: int,
+                                 keywords: List[str],
+                                 question_type: str,
+                                 language: str,
+                                 previous_questions: Optional[List[str]]) -> List[Dict[str, str]]:
+        """Chat messages for a request: the shared system prompt, then the request itself."""
+        prompt = self._build_question_prompt(
+            job_title, level, keywords, question_type, language, previous_questions
+        )
+        return [
+            {"role": "system", "content": QUESTION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+    
     def _parse_question_response(self, response: str, level: int, question_type: str) -> Dict[str, Any]:
         """Parse the LLM response into structured question data."""
         
@@ -258,5 +328,6 @@ CONTEXT: [brief context if needed, or leave empty for straightforward questions]
             "level": level,
             "estimated_time": 5,
             "topics": [question_type, job_title.lower().replace(" ", "_")],
-            "context": "Please provide specific examples where possible."
+            "context": "Please provide specific examples where possible.",
+            "is_fallback": True
         }
\ No newline at end of file
@@ -0,0 +1,480 @@
+"""
+LLM Gateway - Shared Async Ollama Access
+
+The agents' synchronous ollama.Client blocks the calling thread for the whole
+generation; called from an async FastAPI handler, that freezes the event loop
+for every user. This module gives both agents one shared ollama.AsyncClient
+with a bounded connection pool, a per-process limit on concurrent
+generations and a per-call timeout, so one process can serve many interviews
+while each waits on the model.
+
+When the host is slow or down, calls should not each wait out the full
+timeout: timeouts follow the recent latency, transient errors are retried
+with jittered backoff, and a circuit breaker shared by both agents (sync and
+async paths) rejects calls outright while the error rate is high, so the
+agents go straight to their fallbacks.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, List, Optional
+
+import httpx
+from ollama import AsyncClient, ResponseError
+
+try:
+    from utils.config import OllamaConfig
+except ImportError:
+    # Fallback for direct execution
+    import sys
+    from pathlib import Path
+    sys.path.append(str(Path(__file__).parent.parent))
+    from utils.config import OllamaConfig
+
+
+class CircuitOpen(Exception):
+    """Raised instead of calling the LLM while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker.
+    
+    closed: calls go through; outcomes in the last window seconds are kept.
+    Once at least min_calls were made and failure_rate of them failed, the
+    breaker opens. open: calls are rejected for cooldown seconds. half_open:
+    one probe call is let through; its success closes the breaker, its
+    failure opens it again. Thread-safe, so the sync agent path can share it.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self,
+                 failure_rate: Optional[float] = None,
+                 min_calls: Optional[int] = None,
+                 window: Optional[float] = None,
+                 cooldown: Optional[float] = None):
+        """
+        Initialize a closed breaker.
+        
+        Args:
+            failure_rate: Share of failed calls that opens the breaker (default: OllamaConfig.BREAKER_FAILURE_RATE)
+            min_calls: Calls in the window before the rate is considered (default: OllamaConfig.BREAKER_MIN_CALLS)
+            window: Seconds of call outcomes considered (default: OllamaConfig.BREAKER_WINDOW)
+            cooldown: Seconds to stay open before probing (default: OllamaConfig.BREAKER_COOLDOWN)
+        """
+        self.failure_rate = failure_rate or OllamaConfig.BREAKER_FAILURE_RATE
+        self.min_calls = min_calls or OllamaConfig.BREAKER_MIN_CALLS
+        self.window = window or OllamaConfig.BREAKER_WINDOW
+        self.cooldown = cooldown or OllamaConfig.BREAKER_COOLDOWN
+        
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._outcomes = deque()  # (timestamp, succeeded)
+        self._opened_at = 0.0
+        self._probing = False
+        
+        self.opened = 0
+        self.rejected = 0
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+    
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.cooldown:
+            self._state = self.HALF_OPEN
+            self._probing = False
+        return self._state
+    
+    def allow(self) -> bool:
+        """
+        Check whether a call may go to the LLM.
+        
+        Every allowed call must be followed by record_success, record_failure
+        or release.
+        """
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._probing = False
+                self._outcomes.clear()
+            elif self._state == self.CLOSED:
+                self._record(True)
+    
+    def record_failure(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.HALF_OPEN:
+                self._open(now)
+            elif self._state == self.CLOSED:
+                self._record(False)
+                failures = sum(1 for _, ok in self._outcomes if not ok)
+                if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_rate:
+                    self._open(now)
+    
+    def release(self):
+        """Give back an allowed call that ended without an outcome (e.g. cancelled)."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._probing = False
+    
+    def _record(self, succeeded: bool):
+        now = time.monotonic()
+        self._outcomes.append((now, succeeded))
+        while self._outcomes and now - self._outcomes[0][0] > self.window:
+            self._outcomes.popleft()
+    
+    def _open(self, now: float):
+        self._state = self.OPEN
+        self._opened_at = now
+        self._probing = False
+        self._outcomes.clear()
+        self.opened += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Breaker state and counters."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            failures = sum(1 for t, ok in self._outcomes if not ok and now - t <= self.window)
+            calls = sum(1 for t, _ in self._outcomes if now - t <= self.window)
+            return {
+                "state": state,
+                "recent_calls": calls,
+                "recent_failures": failures,
+                "retry_in_seconds": round(max(0.0, self.cooldown - (now - self._opened_at)), 1) if state == self.OPEN else None,
+                "opened": self.opened,
+                "rejected": self.rejected
+            }
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Connection failures and overload/server errors; not timeouts or client errors."""
+    if isinstance(error, ResponseError):
+        return error.status_code in (429, 500, 502, 503, 504)
+    if isinstance(error, httpx.TimeoutException):
+        return isinstance(error, httpx.ConnectTimeout)
+    return isinstance(error, (ConnectionError, httpx.TransportError))
+
+
+class LLMGateway:
+    """
+    Shared async access to the Ollama host.
+    
+    The client and semaphore belong to the event loop they were created on;
+    if the gateway is used from a different loop (e.g. a test client that
+    starts a loop per request) they are recreated for it.
+    """
+    
+    def __init__(self,
+                 host: Optional[str] = None,
+                 api_key: Optional[str] = None,
+                 max_concurrent: Optional[int] = None,
+                 timeout: Optional[float] = None):
+        """
+        Initialize gateway settings; the client is created on first use.
+        
+        Args:
+            host: Ollama host URL (default: OllamaConfig.OLLAMA_HOST)
+            api_key: Bearer token (default: OllamaConfig.OLLAMA_API_KEY)
+            max_concurrent: Generations in flight at once (default: OllamaConfig.MAX_CONCURRENT_REQUESTS)
+            timeout: Seconds per generation (default: OllamaConfig.REQUEST_TIMEOUT)
+        """
+        self.host = host or OllamaConfig.OLLAMA_HOST
+        self.api_key = api_key if api_key is not None else OllamaConfig.OLLAMA_API_KEY
+        self.max_concurrent = max(1, max_concurrent or OllamaConfig.MAX_CONCURRENT_REQUESTS)
+        self.timeout = timeout or OllamaConfig.REQUEST_TIMEOUT
+        self.breaker = CircuitBreaker()
+        
+        self._loop = None
+        self._client: Optional[AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        
+        self.calls = 0
+        self.in_flight = 0
+        self.waiting = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.early_stops = 0
+        self.retries = 0
+        self.total_latency = 0.0
+        self._latencies: Dict[str, deque] = {}
+        self._usage: Dict[str, Dict[str, float]] = {}
+    
+    def _bind(self):
+        """Return the client and semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            headers = {}
+            if self.api_key and self.api_key.strip():
+                headers['Authorization'] = f'Bearer {self.api_key}'
+            
+            self._client = AsyncClient(
+                host=self.host,
+                headers=headers if headers else None,
+                timeout=httpx.Timeout(self.timeout, connect=OllamaConfig.CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrent,
+                    max_keepalive_connections=self.max_concurrent
+                )
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._loop = loop
+        return self._client, self._semaphore
+    
+    async def chat(self,
+                   messages: List[Dict[str, str]],
+                   options: Dict[str, Any],
+                   timeout: Optional[float] = None,
+                   on_token: Optional[Callable[[str], None]] = None,
+                   stop: Optional[Callable[[str], bool]] = None,
+                   task: str = "default") -> str:
+        """
+        Run one chat generation and return the full response text.
+        
+        Waits for a free slot first; the timeout only covers the generation.
+        If stop returns True for a piece of content, the stream is closed
+        there, which ends the generation on the server. Connection errors
+        and 429/5xx responses are retried with jittered backoff as long as
+        no content has been received.
+        
+        Args:
+            messages: Chat messages
+            options: Ollama generation options
+            timeout: Seconds for this call (default: from the task's recent latency, see call_timeout)
+            on_token: Called with each piece of content as it arrives (for streaming to clients)
+            stop: Called with each piece of content; True ends the generation early
+            task: Kind of generation ("question", "evaluation", ...); latencies are tracked per task
+            
+        Returns:
+            Concatenated response content
+            
+        Raises:
+            CircuitOpen: If the circuit breaker rejected the call
+            asyncio.TimeoutError: If the generation took longer than the timeout
+            Exception: Any client or connection error
+        """
+        if not self.breaker.allow():
+            raise CircuitOpen("LLM circuit breaker is open")
+        
+        client, semaphore = self._bind()
+        
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        except BaseException:
+            self.breaker.release()
+            raise
+        finally:
+            self.waiting -= 1
+        
+        self.calls += 1
+        self.in_flight += 1
+        started = time.monotonic()
+        call_timeout = timeout or self.call_timeout(task)
+        outcome = None
+        try:
+            attempt = 0
+            while True:
+                received = []
+                
+                def forward(content: str):
+                    received.append(content)
+                    if on_token is not None:
+                        on_token(content)
+                
+                attempt_started = time.monotonic()
+                try:
+                    text = await asyncio.wait_for(
+                        self._collect(client, messages, options, forward, stop, task),
+                        call_timeout
+                    )
+                except Exception as e:
+                    if received or attempt >= OllamaConfig.RETRY_ATTEMPTS or not _is_retryable(e):
+                        raise
+                    attempt += 1
+                    self.retries += 1
+                    await asyncio.sleep(random.uniform(0, OllamaConfig.RETRY_BACKOFF * 2 ** attempt))
+                    continue
+                
+                self._latencies.setdefault(task, deque(maxlen=OllamaConfig.LATENCY_SAMPLES)).append(
+                    time.monotonic() - attempt_started
+                )
+                outcome = True
+                return text
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            outcome = False
+            raise
+        except Exception:
+            self.errors += 1
+            outcome = False
+            raise
+        finally:
+            if outcome is True:
+                self.breaker.record_success()
+            elif outcome is False:
+                self.breaker.record_failure()
+            else:
+                self.breaker.release()
+            self.total_latency += time.monotonic() - started
+            self.in_flight -= 1
+            semaphore.release()
+    
+    def call_timeout(self, task: str = "default") -> float:
+        """
+        Timeout for the next generation of a task.
+        
+        TIMEOUT_MULTIPLIER times the p95 of the task's recent latencies,
+        clamped to [MIN_TIMEOUT, the gateway timeout]; the gateway timeout
+        until enough calls have completed.
+        """
+        samples = self._latencies.get(task)
+        if not samples or len(samples) < OllamaConfig.LATENCY_MIN_SAMPLES:
+            return self.timeout
+        ordered = sorted(samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return min(self.timeout, max(OllamaConfig.MIN_TIMEOUT, p95 * OllamaConfig.TIMEOUT_MULTIPLIER))
+    
+    def record_usage(self, task: str, part: Any):
+        """
+        Record the token counts and durations of a finished generation.
+        
+        Ollama reports them on the final chunk of a stream (durations in
+        nanoseconds); generations stopped early never get one. Prompt tokens
+        the server served from its cached prefix are not counted in
+        prompt_eval_count, so a falling average means the prefix is reused.
+        
+        Args:
+            task: Kind of generation, as passed to chat
+            part: Final stream chunk (done=True)
+        """
+        usage = self._usage.setdefault(task, {
+            "generations": 0, "prompt_tokens": 0, "prompt_eval_ns": 0, "output_tokens": 0, "eval_ns": 0
+        })
+        usage["generations"] += 1
+        usage["prompt_tokens"] += part.get('prompt_eval_count') or 0
+        usage["prompt_eval_ns"] += part.get('prompt_eval_duration') or 0
+        usage["output_tokens"] += part.get('eval_count') or 0
+        usage["eval_ns"] += part.get('eval_duration') or 0
+    
+    def get_usage(self) -> Dict[str, Any]:
+        """Average prompt/output tokens and prompt evaluation time per finished generation, by task."""
+        report = {}
+        for task, usage in self._usage.items():
+            n = usage["generations"]
+            report[task] = {
+                "generations": n,
+                "avg_prompt_tokens": round(usage["prompt_tokens"] / n, 1),
+                "avg_prompt_eval_ms": round(usage["prompt_eval_ns"] / n / 1e6, 1),
+                "avg_output_tokens": round(usage["output_tokens"] / n, 1),
+                "output_tokens_per_second": round(usage["output_tokens"] / (usage["eval_ns"] / 1e9), 1) if usage["eval_ns"] else None
+            }
+        return report
+    
+    @contextmanager
+    def guard(self):
+        """
+        Run a synchronous LLM call under the circuit breaker.
+        
+        Raises:
+            CircuitOpen: If the breaker rejected the call
+        """
+        if not self.breaker.allow():
+            raise CircuitOpen("LLM circuit breaker is open")
+        try:
+            yield
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        else:
+            self.breaker.record_success()
+    
+    async def _collect(self,
+                       client: AsyncClient,
+                       messages: List[Dict[str, str]],
+                       options: Dict[str, Any],
+                       on_token: Optional[Callable[[str], None]],
+                       stop: Optional[Callable[[str], bool]],
+                       task: str) -> str:
+        response_parts = []
+        stream = await client.chat(
+            OllamaConfig.OLLAMA_MODEL,
+            messages=messages,
+            stream=True,
+            options=options
+        )
+        async for part in stream:
+            if part.get('done'):
+                self.record_usage(task, part)
+            if 'message' in part and 'content' in part['message']:
+                content = part['message']['content'] or ""
+                response_parts.append(content)
+                if content and on_token is not None:
+                    on_token(content)
+                if content and stop is not None and stop(content):
+                    self.early_stops += 1
+                    await stream.aclose()
+                    break
+        return ''.join(response_parts)
+    
+    async def close(self):
+        """Close the pooled connections (call on shutdown, from the serving loop)."""
+        client, loop = self._client, self._loop
+        self._client, self._semaphore, self._loop = None, None, None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.close()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Concurrency, timeout, latency and circuit breaker counters."""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "timeout_seconds": self.timeout,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "calls": self.calls,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "early_stops": self.early_stops,
+            "retries": self.retries,
+            "avg_latency_seconds": round(self.total_latency / self.calls, 3) if self.calls else None,
+            "call_timeout_seconds": {task: round(self.call_timeout(task), 1) for task in self._latencies},
+            "usage": self.get_usage(),
+            "circuit": self.breaker.get_stats()
+        }
+
+
+# Global gateway instance
+_gateway_instance = None
+
+
+def get_gateway() -> LLMGateway:
+    """Get global LLM gateway instance."""
+    global _gateway_instance
+    
+    if _gateway_instance is None:
+        _gateway_instance = LLMGateway()
+    
+    return _gateway_instance
@@ -0,0 +1,138 @@
+"""
+Stream Parsers - Early Termination of Agent Generations
+
+The agents ask the model for a fixed set of labelled lines (QUESTION/TOPICS/
+TIME/CONTEXT, or the score lines plus STRENGTHS/IMPROVEMENTS/FEEDBACK), but
+the model may keep generating after the last field. These parsers consume
+the response as it streams and report when every field the agent's parser
+reads is complete and well-formed, so the generation can be closed there.
+
+They only decide when to stop; the text received up to that point is still
+parsed by _parse_question_response / _parse_evaluation_response.
+"""
+
+import re
+from typing import List, Set
+
+_DIGIT_RE = re.compile(r"\d")
+
+
+class FieldStreamParser:
+    """Base class: feeds complete lines of a streamed response to _on_line."""
+    
+    REQUIRED: Set[str] = set()
+    
+    def __init__(self):
+        self.fields: Set[str] = set()
+        self._lines: List[str] = []
+        self._partial = ""
+        self._complete = False
+    
+    @property
+    def complete(self) -> bool:
+        return self._complete
+    
+    @property
+    def text(self) -> str:
+        """Complete lines received so far (up to the line that completed the response)."""
+        return "\n".join(self._lines)
+    
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume the next piece of model output.
+        
+        Args:
+            chunk: Content as received from the stream
+            
+        Returns:
+            True once the generation can be stopped
+        """
+        if self._complete or not chunk:
+            return self._complete
+        
+        self._partial += chunk
+        if "\n" not in self._partial:
+            return False
+        
+        *lines, self._partial = self._partial.split("\n")
+        for line in lines:
+            self._lines.append(line)
+            self._on_line(line.strip())
+            if self._is_complete():
+                self._complete = True
+                break
+        return self._complete
+    
+    def _on_line(self, line: str):
+        raise NotImplementedError
+    
+    def _is_complete(self) -> bool:
+        return self.REQUIRED <= self.fields
+
+
+class QuestionStreamParser(FieldStreamParser):
+    """Complete once QUESTION, TOPICS, TIME and CONTEXT lines have been received."""
+    
+    REQUIRED = {"QUESTION", "TOPICS", "TIME", "CONTEXT"}
+    
+    def _on_line(self, line: str):
+        for label in self.REQUIRED:
+            if line.startswith(f"{label}:"):
+                value = line[len(label) + 1:].strip()
+                if label == "TIME":
+                    well_formed = bool(_DIGIT_RE.search(value))
+                elif label == "CONTEXT":
+                    well_formed = True  # may be left empty
+                else:
+                    well_formed = bool(value)
+                if well_formed:
+                    self.fields.add(label)
+                return
+
+
+class EvaluationStreamParser(FieldStreamParser):
+    """
+    Complete once every score line and the STRENGTHS, IMPROVEMENTS and
+    FEEDBACK sections have been received. A section is complete when it has
+    content and is followed by another label or the END line the prompt asks
+    for after FEEDBACK; the STRENGTHS and IMPROVEMENTS lists also end at a
+    blank line. FEEDBACK may run over several paragraphs, so without END it
+    ends with the stream.
+    """
+    
+    SCORE_LABELS = ("CORRECTNESS", "DEPTH", "CLARITY", "RELEVANCE", "OVERALL")
+    SECTION_LABELS = ("STRENGTHS", "IMPROVEMENTS", "FEEDBACK")
+    REQUIRED = set(SCORE_LABELS) | {"LEVEL_RECOMMENDATION"} | set(SECTION_LABELS)
+    
+    def __init__(self):
+        super().__init__()
+        self._section = None
+        self._section_has_text = False
+    
+    def _on_line(self, line: str):
+        label, sep, value = line.partition(":")
+        label = label.strip()
+        
+        if line == "END":
+            self._close_section()
+        elif sep and label in self.REQUIRED:
+            self._close_section()
+            if label in self.SCORE_LABELS:
+                if _DIGIT_RE.search(value):
+                    self.fields.add(label)
+            elif label == "LEVEL_RECOMMENDATION":
+                if value.strip().upper() in ("INCREASE", "MAINTAIN", "DECREASE"):
+                    self.fields.add(label)
+            else:
+                self._section = label
+                self._section_has_text = bool(value.strip())
+        elif self._section is not None:
+            if line:
+                self._section_has_text = True
+            elif self._section != "FEEDBACK":
+                self._close_section()
+    
+    def _close_section(self):
+        if self._section is not None and self._section_has_text:
+            self.fields.add(self._section)
+        self._section = None
@@ -0,0 +1,204 @@
+"""
+Multi-worker load test for the interview API.
+
+Starts router.py with each requested number of workers and runs simulated
+interviews against it for a fixed time: start an interview, then
+/next_question and /submit_answer until it completes, then start another.
+Reports completed turns per second and per-turn latency for each worker
+count, so the scaling on one machine can be compared.
+
+By default the LLM is a stub served by this script (fixed question and
+evaluation text, STUB_DELAY seconds per generation). The numbers then
+measure the API's own work (routing, sessions, parsing, storage), which is
+what the extra workers spread over cores. Point --ollama-host at a real
+server to include the model, which will usually dominate.
+
+Sessions are stored with the SQLite backend in a temporary database (the
+recommended backend with several workers). Rate limiting is disabled for the
+run, since all simulated candidates share one client address. The evaluation
+cache and question bank are disabled, so every turn generates and evaluates.
+
+Usage:
+    python benchmarks/multiworker_load.py --workers 1 2 4 --concurrency 32 --duration 30
+    python benchmarks/multiworker_load.py --workers 1 4 --ollama-host http://localhost:11434
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import uvicorn
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+QUESTION = ("QUESTION: How would you design a rate limiter for a public API?\n"
+            "TOPICS: api design, scalability\nTIME: 5\nCONTEXT: \n")
+EVALUATION = ("CORRECTNESS: 70\nDEPTH: 60\nCLARITY: 80\nRELEVANCE: 75\nOVERALL: 71\n"
+              "LEVEL_RECOMMENDATION: MAINTAIN\nSTRENGTHS:\n- Clear structure\n"
+              "IMPROVEMENTS:\n- More depth\nFEEDBACK: A solid answer that could go deeper.\n\n")
+WORDS = ("token bucket per client key stored in redis with a sliding window and burst capacity "
+         "returning 429 with retry after headers and metrics on rejections").split()
+
+
+def stub_ollama(delay: float):
+    """Minimal ASGI stand-in for Ollama's /api/chat (streamed NDJSON)."""
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        request = json.loads(body or b"{}")
+        last = (request.get("messages") or [{}])[-1].get("content", "")
+        text = EVALUATION if "CANDIDATE'S ANSWER" in last else QUESTION
+        
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/x-ndjson")]})
+        await asyncio.sleep(delay)
+        for line in text.splitlines(keepends=True):
+            chunk = {"model": "stub", "created_at": "2025-01-01T00:00:00Z",
+                     "message": {"role": "assistant", "content": line}, "done": False}
+            await send({"type": "http.response.body", "body": (json.dumps(chunk) + "\n").encode(), "more_body": True})
+        done = {"model": "stub", "created_at": "2025-01-01T00:00:00Z", "message": {"role": "assistant", "content": ""},
+                "done": True, "prompt_eval_count": 100, "eval_count": 50}
+        await send({"type": "http.response.body", "body": (json.dumps(done) + "\n").encode(), "more_body": False})
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_stub(delay: float) -> str:
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(stub_ollama(delay), host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+def start_router(workers: int, ollama_host: str, data_dir: Path):
+    port, base_port = free_port(), free_port()
+    env = dict(os.environ)
+    env.update({
+        "OLLAMA_HOST": ollama_host,
+        "STORAGE_BACKEND": "sqlite",
+        "SQLITE_PATH": str(data_dir / "interviews.db"),
+        "RATE_LIMIT": "false",
+        "EVALUATION_CACHE": "false",
+        "QUESTION_BANK": "false",
+        "ANSWER_PRESCORE": "false",
+    })
+    process = subprocess.Popen(
+        [sys.executable, "router.py", "--workers", str(workers), "--port", str(port),
+         "--host", "127.0.0.1", "--base-port", str(base_port)],
+        cwd=str(BACKEND_DIR), env=env
+    )
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 90
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url + "/router/status", timeout=1).json()["healthy"] == workers:
+                return process, url
+        except (httpx.HTTPError, ValueError, KeyError):
+            pass
+        if process.poll() is not None:
+            break
+        time.sleep(0.5)
+    process.kill()
+    raise RuntimeError(f"Router with {workers} workers did not start")
+
+
+async def candidate(client: httpx.AsyncClient, stop_at: float, questions: int, latencies: list, errors: list):
+    """Run interviews back to back until stop_at, recording per-turn latency."""
+    while time.monotonic() < stop_at:
+        try:
+            r = await client.post("/start_interview", json={
+                "job_title": "Backend Engineer", "num_questions": questions, "soft_pct": 0.0,
+                "initial_level": 3, "keywords": ["python", "apis"]
+            })
+            r.raise_for_status()
+            interview_id = r.json()["interview_id"]
+            for _ in range(questions):
+                if time.monotonic() >= stop_at:
+                    return
+                started = time.monotonic()
+                q = await client.get("/next_question", params={"interview_id": interview_id})
+                q.raise_for_status()
+                answer = " ".join(random.sample(WORDS, 12))
+                a = await client.post("/submit_answer", json={"interview_id": interview_id, "answer": answer})
+                a.raise_for_status()
+                latencies.append(time.monotonic() - started)
+        except httpx.HTTPError as e:
+            errors.append(str(e))
+            await asyncio.sleep(0.1)
+
+
+async def run_load(url: str, concurrency: int, duration: float, questions: int):
+    latencies, errors = [], []
+    limits = httpx.Limits(max_connections=concurrency * 2)
+    async with httpx.AsyncClient(base_url=url, timeout=120, limits=limits) as client:
+        # Warm up the workers' connection pools and caches
+        await asyncio.gather(*(candidate(client, time.monotonic() + 2, questions, [], []) for _ in range(concurrency)))
+        stop_at = time.monotonic() + duration
+        await asyncio.gather(*(candidate(client, stop_at, questions, latencies, errors) for _ in range(concurrency)))
+    return latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to compare")
+    parser.add_argument("--concurrency", type=int, default=32, help="Simulated candidates")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of load per worker count")
+    parser.add_argument("--questions", type=int, default=5, help="Questions per interview")
+    parser.add_argument("--ollama-host", help="Real Ollama server (default: built-in stub)")
+    parser.add_argument("--stub-delay", type=float, default=0.05, help="Stub seconds per generation")
+    args = parser.parse_args()
+    
+    ollama_host = args.ollama_host or start_stub(args.stub_delay)
+    print(f"{os.cpu_count()} CPUs, {args.concurrency} candidates, {args.duration:.0f}s per run, "
+          f"LLM: {args.ollama_host or f'stub ({args.stub_delay * 1000:.0f} ms)'}")
+    
+    baseline = None
+    for workers in args.workers:
+        with tempfile.TemporaryDirectory() as data_dir:
+            process, url = start_router(workers, ollama_host, Path(data_dir))
+            try:
+                latencies, errors = asyncio.run(run_load(url, args.concurrency, args.duration, args.questions))
+            finally:
+                process.send_signal(signal.SIGINT)
+                try:
+                    process.wait(30)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+        
+        throughput = len(latencies) / args.duration
+        baseline = baseline or throughput
+        if latencies:
+            p50 = statistics.median(latencies) * 1000
+            p95 = statistics.quantiles(latencies, n=20)[-1] * 1000 if len(latencies) > 1 else p50
+        else:
+            p50 = p95 = float("nan")
+        print(f"  {workers:2d} worker(s)  {throughput:8.1f} turns/s  x{throughput / baseline if baseline else 0:4.2f}  "
+              f"p50 {p50:7.1f} ms  p95 {p95:7.1f} ms  errors {len(errors)}")
+
+
+if __name__ == "__main__":
+    main()
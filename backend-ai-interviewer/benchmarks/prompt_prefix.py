@@ -0,0 +1,132 @@
+"""
+Prompt prefix reuse benchmark for the interview agents.
+
+Replays the prompts of a simulated interview (levels moving, previous
+questions accumulating, answers evaluated) in two layouts:
+
+  split   the agents' layout: static instructions as an identical system
+          message, the per-turn request as a short user message
+  legacy  one user message with the per-turn values first, followed by the
+          same instructions (the layout before the split), so no two turns
+          share a prefix
+
+Each prompt is sent with num_predict=1, so the timings are dominated by
+prompt evaluation. Ollama leaves tokens served from its cached prefix out of
+prompt_eval_count, so the difference per turn is the prompt work saved.
+--dry-run skips the server and reports the prefix shared by consecutive
+prompts instead (tokens estimated at 4 characters each).
+
+Usage:
+    python benchmarks/prompt_prefix.py --dry-run
+    python benchmarks/prompt_prefix.py --turns 10
+    OLLAMA_MODEL=llama3.1:8b python benchmarks/prompt_prefix.py --host http://localhost:11434 --task evaluation
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ollama import Client
+
+from utils.config import OllamaConfig
+from agents.interviewer_agent import InterviewerAgent, QUESTION_SYSTEM_PROMPT
+from agents.evaluator_agent import EvaluatorAgent, EVALUATION_SYSTEM_PROMPT
+
+TOPICS = ["generators", "decorators", "context managers", "the GIL", "dataclasses",
+          "database indexes", "SQL joins", "REST APIs", "message queues", "Docker images"]
+
+
+def interview_turns(task: str, turns: int):
+    """(system prompt, per-turn prompt) pairs of a simulated interview."""
+    interviewer, evaluator = InterviewerAgent(), EvaluatorAgent()
+    previous = []
+    for i in range(turns):
+        level = 3 + (i % 3) - 1
+        question = f"What is the purpose of {TOPICS[i % len(TOPICS)]} in backend development?"
+        if task == "question":
+            yield QUESTION_SYSTEM_PROMPT, interviewer._build_question_prompt(
+                "Backend Engineer", level, ["python", "sql"], "technical", "en", previous
+            )
+        else:
+            answer = f"{TOPICS[i % len(TOPICS)].capitalize()} help structure code; for example, turn {i} of the interview."
+            yield EVALUATION_SYSTEM_PROMPT, evaluator._build_evaluation_prompt(
+                question, "technical", level, answer, "Backend Engineer", ["python"]
+            )
+        previous.append(question)
+
+
+def layout_messages(layout: str, system: str, request: str):
+    if layout == "split":
+        return [{"role": "system", "content": system}, {"role": "user", "content": request}]
+    return [{"role": "user", "content": f"{request}\n\n{system}"}]
+
+
+def common_prefix(a: str, b: str) -> int:
+    n = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        n += 1
+    return n
+
+
+def dry_run(args):
+    print(f"{args.task}: {args.turns} turns, prefix shared with the previous prompt (~4 chars/token)")
+    for layout in ("legacy", "split"):
+        rendered = [
+            "\n".join(m["content"] for m in layout_messages(layout, system, request))
+            for system, request in interview_turns(args.task, args.turns)
+        ]
+        shared = [common_prefix(a, b) for a, b in zip(rendered, rendered[1:])]
+        total = statistics.mean(len(r) for r in rendered)
+        print(f"  {layout:6s}  prompt ~{total / 4:.0f} tokens, shared prefix ~{statistics.mean(shared) / 4:.0f} tokens "
+              f"({statistics.mean(shared) / total:.0%}), to evaluate per turn ~{(total - statistics.mean(shared)) / 4:.0f} tokens")
+
+
+def run(args):
+    headers = {'Authorization': f'Bearer {OllamaConfig.OLLAMA_API_KEY}'} if OllamaConfig.OLLAMA_API_KEY.strip() else None
+    client = Client(host=args.host, headers=headers)
+    print(f"{args.task}: {args.turns} turns against {args.host} ({OllamaConfig.OLLAMA_MODEL})")
+
+    results = {}
+    for layout in ("legacy", "split"):
+        prompt_tokens, prompt_ms, total_ms = [], [], []
+        for system, request in interview_turns(args.task, args.turns):
+            started = time.perf_counter()
+            response = client.chat(
+                OllamaConfig.OLLAMA_MODEL,
+                messages=layout_messages(layout, system, request),
+                options={"temperature": 0, "num_predict": 1}
+            )
+            total_ms.append((time.perf_counter() - started) * 1000)
+            prompt_tokens.append(response.get('prompt_eval_count') or 0)
+            prompt_ms.append((response.get('prompt_eval_duration') or 0) / 1e6)
+        # The first turn warms the cache; report the follow-up turns
+        results[layout] = [statistics.mean(v[1:] or v) for v in (prompt_tokens, prompt_ms, total_ms)]
+        tokens, p_ms, t_ms = results[layout]
+        print(f"  {layout:6s}  prompt tokens evaluated {tokens:7.1f}  prompt eval {p_ms:8.1f} ms  request {t_ms:8.1f} ms")
+
+    saved = [l - s for l, s in zip(results["legacy"], results["split"])]
+    print(f"  saved per turn: {saved[0]:.1f} prompt tokens, {saved[1]:.1f} ms prompt eval, {saved[2]:.1f} ms per request")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=os.getenv("OLLAMA_HOST", OllamaConfig.OLLAMA_HOST), help="Ollama host")
+    parser.add_argument("--task", choices=["question", "evaluation"], default="question", help="Prompts to replay")
+    parser.add_argument("--turns", type=int, default=10, help="Interview turns per layout")
+    parser.add_argument("--dry-run", action="store_true", help="Only compare prompt prefixes, without a server")
+    args = parser.parse_args()
+
+    if args.dry_run:
+        dry_run(args)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Contention benchmark for interview session storage.
+
+Runs many concurrent simulated interviews against a fresh storage directory.
+Each round is a load-modify-save for the next question followed by one for
+the answer, with the interview lock held around each pair. Threads share
+one storage instance per process; with --processes > 1 each process has its
+own instance and only the file locks keep them apart.
+
+--shared N makes every worker use the same N interviews, then checks that no
+update was lost (question count == total rounds).
+
+Usage:
+    python benchmarks/storage_contention.py                                # 200 interviews, 16 threads
+    python benchmarks/storage_contention.py --stripes 1 --no-file-locks    # old single-lock behaviour
+    python benchmarks/storage_contention.py --processes 4 --shared 4       # cross-process integrity
+    python benchmarks/storage_contention.py --backend sqlite
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def configure(args, data_dir: Path):
+    """Apply benchmark settings before any storage instance is created."""
+    from utils.config import StorageConfig
+    StorageConfig.LOCK_STRIPES = args.stripes
+    StorageConfig.FILE_LOCKS = not args.no_file_locks
+    StorageConfig.STATS_RECONCILE_INTERVAL = 0
+    StorageConfig.SQLITE_PATH = data_dir / "interviews.db"
+
+
+def open_storage(args, data_dir: Path):
+    configure(args, data_dir)
+    if args.backend == "sqlite":
+        from services.sqlite_storage import SQLiteInterviewStorage
+        return SQLiteInterviewStorage(data_dir / "interviews.db")
+    from services.storage import InterviewStorage
+    return InterviewStorage(data_dir / "interviews")
+
+
+def new_interview(interview_id: str):
+    return {
+        "interview_id": interview_id,
+        "settings": {"job_title": "Software Engineer", "num_questions": 50, "soft_pct": 0.3,
+                     "initial_level": 3, "keywords": ["python"], "language": "en", "profile_brief": None},
+        "questions": [],
+        "state": {"current_level": 3, "asked_count": 0, "recent_scores": []},
+        "summary": None,
+    }
+
+
+def run_interview(storage, interview_id: str, rounds: int, tag: str, latencies: list):
+    for r in range(rounds):
+        t0 = time.perf_counter()
+        with storage.interview_lock(interview_id):
+            data = storage.load_interview(interview_id)
+            if data is None:
+                continue  # only without file locks: another process is mid-write
+            q_id = len(data["questions"]) + 1
+            data["questions"].append({
+                "q_id": q_id, "text": f"Question {q_id} from {tag}", "type": "technical", "level": 3,
+                "topics": ["python"], "estimated_time": 5, "context": "",
+                "candidate_answer": None, "evaluation": None,
+            })
+            data["state"]["asked_count"] = q_id
+            storage.save_interview(data)
+        latencies.append(time.perf_counter() - t0)
+        
+        t0 = time.perf_counter()
+        with storage.interview_lock(interview_id):
+            data = storage.load_interview(interview_id)
+            if data is None or not data["questions"]:
+                continue
+            question = data["questions"][-1]
+            question["candidate_answer"] = "An answer " * 40
+            question["evaluation"] = {
+                "overall_score": 70.0, "subscores": {"correctness": 70, "depth": 70, "clarity": 70, "relevance": 70},
+                "feedback": "Reasonable answer. " * 10, "level_recommendation": "MAINTAIN",
+                "level_adjustment": 0, "strengths": ["clear"], "improvements": ["depth"],
+            }
+            data["state"]["recent_scores"] = (data["state"]["recent_scores"] + [70.0])[-3:]
+            storage.save_interview(data)
+        latencies.append(time.perf_counter() - t0)
+
+
+def worker_process(args, data_dir: Path, process_index: int, result_queue):
+    storage = open_storage(args, data_dir)
+    latencies = []
+    
+    def thread_main(thread_index: int):
+        tag = f"p{process_index}t{thread_index}"
+        if args.shared:
+            ids = [f"shared-{i}" for i in range(args.shared)]
+        else:
+            worker = process_index * args.threads + thread_index
+            workers = args.processes * args.threads
+            ids = [f"iv-{i}" for i in range(worker, args.interviews, workers)]
+        for interview_id in ids:
+            run_interview(storage, interview_id, args.rounds, tag, latencies)
+    
+    threads = [threading.Thread(target=thread_main, args=(i,)) for i in range(args.threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    result_queue.put(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["json", "sqlite"], default="json")
+    parser.add_argument("--interviews", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=16, help="Threads per process")
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--rounds", type=int, default=10, help="Questions per interview")
+    parser.add_argument("--stripes", type=int, default=64)
+    parser.add_argument("--no-file-locks", action="store_true")
+    parser.add_argument("--shared", type=int, default=0, help="All workers use the same N interviews")
+    args = parser.parse_args()
+    
+    data_dir = Path(tempfile.mkdtemp(prefix="storage_bench_"))
+    storage = open_storage(args, data_dir)
+    ids = [f"shared-{i}" for i in range(args.shared)] if args.shared else [f"iv-{i}" for i in range(args.interviews)]
+    for interview_id in ids:
+        storage.save_interview(new_interview(interview_id))
+    
+    print(f"{args.backend}: {len(ids)} interviews, {args.processes} process(es) x {args.threads} threads, "
+          f"{args.rounds} rounds, stripes={args.stripes}, file locks={'off' if args.no_file_locks else 'on'}")
+    print(f"Data directory: {data_dir}")
+    
+    ctx = multiprocessing.get_context("spawn" if os.name == "nt" else "fork")
+    queue = ctx.Queue()
+    t0 = time.perf_counter()
+    procs = [ctx.Process(target=worker_process, args=(args, data_dir, i, queue)) for i in range(args.processes)]
+    for p in procs:
+        p.start()
+    latencies = []
+    for _ in procs:
+        latencies.extend(queue.get())
+    for p in procs:
+        p.join()
+    elapsed = time.perf_counter() - t0
+    
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"Updates:      {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:.0f}/s)")
+    print(f"Latency:      p50 {statistics.median(latencies) * 1000:.2f} ms, p99 {p99 * 1000:.2f} ms")
+    
+    if args.shared:
+        expected = args.processes * args.threads * args.rounds
+        check = open_storage(args, data_dir)
+        loaded = [check.load_interview(i) for i in ids]
+        counts = [len(data["questions"]) if data else None for data in loaded]
+        lost = sum(expected - c for c in counts if c is not None)
+        corrupt = counts.count(None)
+        print(f"Integrity:    {counts} questions per interview, expected {expected} "
+              f"({lost} lost updates, {corrupt} unreadable)")
+        return 1 if lost or corrupt else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
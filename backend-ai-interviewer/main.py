@@ -5,6 +5,10 @@ Endpoints:
  - POST /start_interview
  - GET  /next_question?interview_id=...
  - POST /submit_answer
+ - GET  /next_question/stream, POST /submit_answer/stream (server-sent events)
+ - GET  /evaluation/{interview_id}/{q_id}, GET /evaluation/{interview_id}/{q_id}/stream
+ - POST /evaluate/batch (recorded transcripts, NDJSON)
+ - WS   /ws/interview/{interview_id} (whole interview over one connection)
  - GET  /summary/{interview_id}
 
 This module wires the InterviewManager into a simple REST API.
@@ -12,13 +16,16 @@ This module wires the InterviewManager into a simple REST API.
 
 import sys
 import os
+import asyncio
+import json
+import time
 from pathlib import Path
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from typing import Optional, List
+from typing import Any, Awaitable, Callable, Dict, Optional, List
 import uvicorn
 
 # Load environment variables FIRST before importing config
@@ -29,13 +36,25 @@ backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
 from services.interview_manager import get_manager
+from services.evaluation_queue import EvaluationJob, EvaluationPending
 from services.storage import get_storage
+from agents.llm_gateway import get_gateway
+from services.admission import (
+    AdmissionMiddleware,
+    LLM_BOUND,
+    client_key,
+    get_admission_controller,
+    retry_after_seconds,
+)
 from models.interview import (
     InterviewStartRequest,
     InterviewResponse,
     QuestionResponse,
     AnswerSubmission,
     EvaluationResponse,
+    EvaluationAccepted,
+    EvaluationStatusResponse,
+    BatchEvaluationRequest,
 )
 from utils.config import APIConfig, InterviewConfig, OllamaConfig
 
@@ -47,6 +66,9 @@ app = FastAPI(
     debug=APIConfig.DEBUG
 )
 
+# Rate limiting and admission control for LLM-bound requests (inside CORS, so rejections carry CORS headers)
+app.add_middleware(AdmissionMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -73,6 +95,11 @@ async def root():
             "/start_interview",
             "/next_question",
             "/submit_answer", 
+            "/next_question/stream",
+            "/submit_answer/stream",
+            "/evaluation/{interview_id}/{q_id}",
+            "/evaluate/batch",
+            "/ws/interview/{interview_id}",
             "/summary/{interview_id}",
             "/status/{interview_id}",
             "/interviews"
@@ -85,15 +112,25 @@ async def health_check():
     """Health check endpoint."""
     try:
         # Test storage connectivity
-        stats = storage.get_storage_stats()
+        stats = await asyncio.to_thread(storage.get_storage_stats)
+        llm_stats = get_gateway().get_stats()
         
         return {
-            "status": "healthy",
+            # Degraded: the LLM circuit breaker is open, questions and evaluations are fallbacks
+            "status": "healthy" if llm_stats["circuit"]["state"] == "closed" else "degraded",
             "timestamp": "2025-11-06T10:00:00Z",
             "storage": {
                 "status": "connected",
                 "interviews_count": stats.get("interviews_count", 0)
             },
+            "session_cache": interview_manager.sessions.get_stats(),
+            "llm": llm_stats,
+            "prefetch": interview_manager.prefetcher.get_stats(),
+            "evaluation_queue": interview_manager.evaluation_queue.get_stats(),
+            "question_bank": interview_manager.question_bank.get_stats() if interview_manager.question_bank else None,
+            "evaluation_cache": interview_manager.evaluation_cache.get_stats() if interview_manager.evaluation_cache else None,
+            "prescorer": interview_manager.evaluator.prescorer.get_stats() if interview_manager.evaluator.prescorer else None,
+            "admission": get_admission_controller().get_stats(),
             "config": {
                 "ollama_configured": bool(OllamaConfig.OLLAMA_API_KEY and OllamaConfig.OLLAMA_API_KEY.strip()),
                 "max_questions": InterviewConfig.MAX_QUESTIONS
@@ -110,6 +147,103 @@ async def health_check():
         )
 
 
+def _question_response(interview_id: str, question_data: Dict[str, Any]) -> QuestionResponse:
+    """Build the API response for a question returned by the interview manager."""
+    return QuestionResponse(
+        q_id=question_data["q_id"],
+        text=question_data["text"],
+        type=question_data["type"],
+        level=question_data["level"],
+        interview_id=interview_id,
+        topics=question_data.get("topics"),
+        estimated_time=question_data.get("estimated_time"),
+        context=question_data.get("context")
+    )
+
+
+def _evaluation_response(interview_id: str, result: Dict[str, Any]) -> EvaluationResponse:
+    """Build the API response for an evaluation returned by the interview manager."""
+    return EvaluationResponse(
+        interview_id=interview_id,
+        evaluation=result["evaluation"],
+        new_level=result["new_level"],
+        is_complete=result["is_complete"]
+    )
+
+
+def _validate_answer(submission: AnswerSubmission):
+    """Reject answers over the configured length."""
+    if len(submission.answer) > APIConfig.MAX_ANSWER_LENGTH:
+        raise HTTPException(
+            status_code=400, 
+            detail=f"Answer exceeds maximum length of {APIConfig.MAX_ANSWER_LENGTH} characters"
+        )
+
+
+async def _submit_answer(interview_id: str,
+                         answer: str,
+                         bypass_cache: bool = False,
+                         on_token: Optional[Callable[[str], None]] = None) -> Optional[Dict[str, Any]]:
+    """Evaluate an answer now; 409 while an earlier answer's background evaluation is unfinished."""
+    try:
+        return await interview_manager.asubmit_answer(
+            interview_id=interview_id,
+            answer=answer,
+            on_token=on_token,
+            bypass_cache=bypass_cache
+        )
+    except EvaluationPending as e:
+        raise HTTPException(status_code=409, detail=str(e), headers={"Retry-After": "5"})
+
+
+def _sse(event: str, data: Any) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+def _event_stream(run: Callable[[Callable[[str], None]], Awaitable[Any]], final_event: str) -> StreamingResponse:
+    """
+    Stream a manager call as server-sent events.
+    
+    Emits a "token" event ({"text": ...}) for each piece of model output,
+    then final_event with the JSON-serializable result of run, or an "error"
+    event ({"status": ..., "detail": ...}). The call runs as its own task,
+    so a client that disconnects mid-stream does not abort the turn.
+    
+    Args:
+        run: Coroutine function taking the on_token callback
+        final_event: Name of the last event
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    async def events():
+        task = asyncio.create_task(run(queue.put_nowait))
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                getter.cancel()
+                break
+            yield _sse("token", {"text": getter.result()})
+        
+        while not queue.empty():
+            yield _sse("token", {"text": queue.get_nowait()})
+        
+        try:
+            yield _sse(final_event, task.result())
+        except HTTPException as e:
+            yield _sse("error", {"status": e.status_code, "detail": e.detail})
+        except Exception as e:
+            print(f"❌ Error in {final_event} stream: {str(e)}")
+            yield _sse("error", {"status": 500, "detail": str(e)})
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.post("/start_interview", response_model=InterviewResponse)
 async def start_interview(request: InterviewStartRequest):
     """
@@ -120,7 +254,7 @@ async def start_interview(request: InterviewStartRequest):
     """
     try:
         print(f"📝 Received interview start request: {request.dict()}")
-        result = interview_manager.create_session(request.dict())
+        result = await interview_manager.acreate_session(request.dict())
         
         print(f"✅ Interview created successfully: {result['interview_id']}")
         return InterviewResponse(
@@ -129,7 +263,7 @@ async def start_interview(request: InterviewStartRequest):
             asked_count=0,  # New session starts with 0 questions asked
             settings=result["settings"]
         )
-        
+    
     except Exception as e:
         print(f"❌ Error creating interview: {str(e)}")
         print(f"Error type: {type(e).__name__}")
@@ -139,7 +273,7 @@ async def start_interview(request: InterviewStartRequest):
             status_code=500,
             detail=f"Failed to create interview: {str(e)}"
         )
-        
+    
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -156,24 +290,15 @@ async def get_next_question(interview_id: str = Query(..., description="Intervie
     """
     try:
         print(f"📝 Getting next question for interview: {interview_id}")
-        question_data = interview_manager.get_next_question(interview_id)
+        question_data = await interview_manager.aget_next_question(interview_id)
         
         if not question_data:
             print(f"❌ No question data returned for interview: {interview_id}")
             raise HTTPException(status_code=404, detail="Interview not found or no more questions available")
         
         print(f"✅ Question generated successfully: {question_data.get('text', 'N/A')[:50]}...")
-        return QuestionResponse(
-            q_id=question_data["q_id"],
-            text=question_data["text"],
-            type=question_data["type"],
-            level=question_data["level"],
-            interview_id=interview_id,
-            topics=question_data.get("topics"),
-            estimated_time=question_data.get("estimated_time"),
-            context=question_data.get("context")
-        )
-        
+        return _question_response(interview_id, question_data)
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -184,28 +309,62 @@ async def get_next_question(interview_id: str = Query(..., description="Intervie
         raise HTTPException(status_code=500, detail=f"Failed to generate question: {str(e)}")
 
 
-@app.post("/submit_answer", response_model=EvaluationResponse)
+@app.get("/next_question/stream")
+async def stream_next_question(interview_id: str = Query(..., description="Interview session ID")):
+    """
+    Generate the next question, streaming model output as server-sent events.
+    
+    Sends "token" events while the question is generated, then a "question"
+    event with the same body as /next_question (or an "error" event). A
+    prefetched or banked question arrives as the "question" event alone.
+    """
+    if not await interview_manager.aload_session(interview_id):
+        raise HTTPException(status_code=404, detail="Interview not found")
+    
+    async def run(on_token):
+        question_data = await interview_manager.aget_next_question(interview_id, on_token=on_token)
+        if not question_data:
+            raise HTTPException(status_code=404, detail="Interview not found or no more questions available")
+        return _question_response(interview_id, question_data).dict()
+    
+    return _event_stream(run, "question")
+
+
+@app.post("/submit_answer", response_model=EvaluationResponse, responses={202: {"model": EvaluationAccepted}})
 async def submit_answer(submission: AnswerSubmission):
     """
     Submit and evaluate a candidate's answer.
     
     Processes the answer through the evaluator agent, updates the session state,
-    and adjusts difficulty level based on performance.
+    and adjusts difficulty level based on performance. With async_evaluation
+    the answer is stored and 202 returned at once; the evaluation runs in the
+    background and is available from /evaluation/{interview_id}/{q_id}.
     """
     try:
         print(f"📝 Received answer submission for interview: {submission.interview_id}")
         print(f"Answer length: {len(submission.answer)} characters")
         
-        # Validate answer length
-        if len(submission.answer) > APIConfig.MAX_ANSWER_LENGTH:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Answer exceeds maximum length of {APIConfig.MAX_ANSWER_LENGTH} characters"
+        _validate_answer(submission)
+        
+        if submission.async_evaluation:
+            accepted = await interview_manager.asubmit_answer_deferred(
+                interview_id=submission.interview_id,
+                answer=submission.answer.strip(),
+                bypass_cache=submission.bypass_cache
+            )
+            if not accepted:
+                raise HTTPException(status_code=400, detail="Failed to process answer submission")
+            
+            base = f"/evaluation/{submission.interview_id}/{accepted['q_id']}"
+            return JSONResponse(
+                status_code=202,
+                content=EvaluationAccepted(**accepted, poll_url=base, stream_url=f"{base}/stream").dict()
             )
         
-        result = interview_manager.submit_answer(
+        result = await _submit_answer(
             interview_id=submission.interview_id,
-            answer=submission.answer.strip()
+            answer=submission.answer.strip(),
+            bypass_cache=submission.bypass_cache
         )
         
         if not result:
@@ -213,13 +372,8 @@ async def submit_answer(submission: AnswerSubmission):
             raise HTTPException(status_code=400, detail="Failed to process answer submission")
         
         print(f"✅ Answer evaluated successfully for interview: {submission.interview_id}")
-        return EvaluationResponse(
-            interview_id=submission.interview_id,
-            evaluation=result["evaluation"],
-            new_level=result["new_level"],
-            is_complete=result["is_complete"]
-        )
-        
+        return _evaluation_response(submission.interview_id, result)
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -230,6 +384,411 @@ async def submit_answer(submission: AnswerSubmission):
         raise HTTPException(status_code=500, detail=f"Failed to submit answer: {str(e)}")
 
 
+@app.post("/submit_answer/stream")
+async def stream_submit_answer(submission: AnswerSubmission):
+    """
+    Submit an answer, streaming the evaluation as server-sent events.
+    
+    Sends "token" events while the answer is evaluated, then an "evaluation"
+    event with the same body as /submit_answer (or an "error" event).
+    """
+    _validate_answer(submission)
+    if not await interview_manager.aload_session(submission.interview_id):
+        raise HTTPException(status_code=404, detail="Interview not found")
+    
+    async def run(on_token):
+        result = await _submit_answer(
+            interview_id=submission.interview_id,
+            answer=submission.answer.strip(),
+            bypass_cache=submission.bypass_cache,
+            on_token=on_token
+        )
+        if not result:
+            raise HTTPException(status_code=400, detail="Failed to process answer submission")
+        return _evaluation_response(submission.interview_id, result).dict()
+    
+    return _event_stream(run, "evaluation")
+
+
+@app.get("/evaluation/{interview_id}/{q_id}", response_model=EvaluationStatusResponse)
+async def get_evaluation(interview_id: str, q_id: int):
+    """
+    Get the status of an answer's evaluation (async evaluation mode).
+    
+    status is "pending" or "running" until the evaluation is recorded, then
+    "done" with the evaluation, new level and completion flag.
+    """
+    try:
+        status = await interview_manager.aget_evaluation(interview_id, q_id)
+        
+        if not status:
+            raise HTTPException(status_code=404, detail="No answer to this question")
+        
+        return status
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get evaluation: {str(e)}")
+
+
+@app.get("/evaluation/{interview_id}/{q_id}/stream")
+async def stream_evaluation(interview_id: str, q_id: int):
+    """
+    Follow an answer's background evaluation as server-sent events.
+    
+    Sends "token" events while the answer is evaluated, then an "evaluation"
+    event with the same body as /evaluation/{interview_id}/{q_id} (or an
+    "error" event). An evaluation already done arrives as the last event alone.
+    """
+    if not await interview_manager.aget_evaluation(interview_id, q_id):
+        raise HTTPException(status_code=404, detail="No answer to this question")
+    
+    async def run(on_token):
+        status = await interview_manager.await_evaluation(interview_id, q_id, on_token=on_token)
+        if not status:
+            raise HTTPException(status_code=404, detail="No answer to this question")
+        return EvaluationStatusResponse(**status).dict()
+    
+    return _event_stream(run, "evaluation")
+
+
+@app.post("/evaluate/batch")
+async def evaluate_batch(request: BatchEvaluationRequest):
+    """
+    Evaluate the answers of a recorded interview transcript.
+    
+    Streams newline-delimited JSON: one {"type": "evaluation", "index",
+    "q_id", "evaluation"} line per item as its evaluation finishes (not
+    necessarily in order), then a {"type": "summary", "interview_id",
+    "summary"} line once the transcript is stored as a completed interview
+    (unless save_transcript is false). A failure ends the stream with a
+    {"type": "error", "status", "detail"} line.
+    """
+    for item in request.items:
+        if len(item.answer) > APIConfig.MAX_ANSWER_LENGTH:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Answer exceeds maximum length of {APIConfig.MAX_ANSWER_LENGTH} characters"
+            )
+    
+    async def lines():
+        results = interview_manager.aevaluate_transcript(
+            job_title=request.job_title,
+            items=[item.dict() for item in request.items],
+            keywords=request.keywords,
+            language=request.language,
+            concurrency=request.concurrency,
+            bypass_cache=request.bypass_cache,
+            save_transcript=request.save_transcript
+        )
+        try:
+            async for line in results:
+                yield json.dumps(line, ensure_ascii=False, default=str) + "\n"
+        except Exception as e:
+            print(f"❌ Error in batch evaluation: {str(e)}")
+            yield json.dumps({"type": "error", "status": 500, "detail": str(e)}) + "\n"
+        finally:
+            await results.aclose()
+    
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+class _InterviewSocket:
+    """An interview's current WebSocket connection."""
+    
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.task = asyncio.current_task()
+        self.busy = False
+        self.replaced = False
+        self.done = asyncio.Event()
+    
+    async def send(self, message: Dict[str, Any]):
+        """Send a JSON message; a closed or replaced connection raises WebSocketDisconnect."""
+        if self.replaced:
+            raise WebSocketDisconnect(code=4409)
+        try:
+            await self.websocket.send_text(json.dumps(message, ensure_ascii=False, default=str))
+        except (RuntimeError, OSError):
+            raise WebSocketDisconnect(code=1006)
+    
+    async def replace(self):
+        """Close for a newer connection, letting a turn in progress finish first."""
+        self.replaced = True
+        try:
+            await self.websocket.close(code=4409, reason="Replaced by a newer connection")
+        except Exception:
+            pass
+        if not self.busy and self.task is not None:
+            self.task.cancel()
+        try:
+            await asyncio.wait_for(self.done.wait(), APIConfig.WS_REPLACE_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"Warning: replaced interview socket did not finish within {APIConfig.WS_REPLACE_TIMEOUT}s")
+
+
+# Open interview sockets by interview id
+_interview_sockets: Dict[str, _InterviewSocket] = {}
+
+
+@app.websocket("/ws/interview/{interview_id}")
+async def interview_socket(websocket: WebSocket, interview_id: str):
+    """
+    Run an interview over one WebSocket connection.
+    
+    Replaces the /next_question, /submit_answer and /status round-trips of
+    each turn: the session is kept in memory while connected and saved at
+    turn boundaries. Messages are JSON objects with a "type"; the server's
+    carry their body in "data".
+    
+    Server to client:
+     - state: body of /status/{interview_id} plus "question", the open
+       (asked, unanswered) question or null; sent on connect and on request
+     - token: {"task": "question" | "evaluation", "text"}, model output as it streams
+     - question: body of /next_question, sent as soon as the previous answer is evaluated
+     - evaluation: body of /submit_answer
+     - summary: body of /summary/{interview_id}; the server then closes
+     - error: {"status", "detail"} and "retry_after" when rate limited
+    
+    Client to server:
+     - answer: {"answer", "bypass_cache"?} answers the open question
+     - status: asks for a state message
+    
+    Reconnecting resumes the interview where it stopped: the state message
+    carries the open question, and answers left evaluating in the background
+    are reported first. A newer connection to the same interview closes the
+    older one (code 4409) once its turn in progress has finished.
+    """
+    await websocket.accept()
+    socket = _InterviewSocket(websocket)
+    
+    previous = _interview_sockets.get(interview_id)
+    _interview_sockets[interview_id] = socket
+    if previous is not None:
+        await previous.replace()
+    
+    interview_manager.pin_session(interview_id)
+    try:
+        await _run_interview_socket(socket, interview_id)
+    except WebSocketDisconnect:
+        pass
+    except asyncio.CancelledError:
+        if not socket.replaced:
+            raise
+    except Exception as e:
+        print(f"❌ Error in interview socket {interview_id}: {str(e)}")
+        try:
+            await socket.send({"type": "error", "status": 500, "detail": str(e)})
+            await websocket.close(code=1011)
+        except Exception:
+            pass
+    finally:
+        if _interview_sockets.get(interview_id) is socket:
+            del _interview_sockets[interview_id]
+        try:
+            await asyncio.to_thread(interview_manager.unpin_session, interview_id)
+        finally:
+            socket.done.set()
+
+
+def _open_question(interview_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """The asked question still waiting for an answer, if any."""
+    questions = interview_data.get("questions", [])
+    if questions and not questions[-1].get("candidate_answer"):
+        return questions[-1]
+    return None
+
+
+def _socket_state(interview_id: str, interview_data: Dict[str, Any]) -> Dict[str, Any]:
+    open_q = _open_question(interview_data)
+    return {
+        "type": "state",
+        "data": {
+            **_interview_status(interview_id, interview_data),
+            "question": _question_response(interview_id, open_q).dict() if open_q else None
+        }
+    }
+
+
+async def _run_interview_socket(socket: _InterviewSocket, interview_id: str):
+    """Protocol loop of an interview socket (see interview_socket)."""
+    data = await interview_manager.aload_session(interview_id)
+    if not data:
+        await socket.send({"type": "error", "status": 404, "detail": "Interview not found"})
+        await socket.websocket.close(code=4404)
+        return
+    await socket.send(_socket_state(interview_id, data))
+    
+    # Answers left to the background evaluator (async evaluation mode)
+    for q in [q for q in data.get("questions", []) if q.get("candidate_answer") and not q.get("evaluation")]:
+        status = await _socket_call(
+            socket, "evaluation",
+            lambda on_token, q_id=q["q_id"]: interview_manager.await_evaluation(interview_id, q_id, on_token=on_token),
+            admit=False
+        )
+        if status and status.get("evaluation"):
+            await socket.send({"type": "evaluation", "data": _evaluation_response(interview_id, status).dict()})
+        else:
+            await socket.send({"type": "error", "status": 500, "detail": (status or {}).get("error") or "Evaluation failed"})
+    
+    while True:
+        data = await interview_manager.aload_session(interview_id)
+        if not data:
+            await socket.send({"type": "error", "status": 404, "detail": "Interview not found"})
+            await socket.websocket.close(code=4404)
+            return
+        
+        if data.get("summary"):
+            await socket.send({"type": "summary", "data": data["summary"]})
+            await socket.websocket.close(code=1000)
+            return
+        
+        if _open_question(data) is None:
+            try:
+                question_data = await _socket_call(
+                    socket, "question",
+                    lambda on_token: interview_manager.aget_next_question(interview_id, on_token=on_token)
+                )
+            except HTTPException as e:
+                await _socket_error(socket, e)
+                await asyncio.sleep(float((e.headers or {}).get("Retry-After", 1)))
+                continue
+            
+            if question_data:
+                await socket.send({"type": "question", "data": _question_response(interview_id, question_data).dict()})
+                continue
+            await socket.send({"type": "error", "status": 409, "detail": "No question available until pending answers are evaluated"})
+        
+        try:
+            message = json.loads(await socket.websocket.receive_text())
+        except json.JSONDecodeError:
+            await socket.send({"type": "error", "status": 400, "detail": "Messages must be JSON objects"})
+            continue
+        
+        kind = message.get("type") if isinstance(message, dict) else None
+        if kind == "status":
+            await socket.send(_socket_state(interview_id, await interview_manager.aload_session(interview_id) or data))
+        elif kind == "answer":
+            await _socket_answer(socket, interview_id, message)
+        else:
+            await socket.send({"type": "error", "status": 400, "detail": f"Unknown message type: {kind}"})
+
+
+async def _socket_answer(socket: _InterviewSocket, interview_id: str, message: Dict[str, Any]):
+    """Evaluate an answer received on an interview socket; the turn ends saved."""
+    answer = str(message.get("answer") or "").strip()
+    if len(answer) > APIConfig.MAX_ANSWER_LENGTH:
+        await socket.send({
+            "type": "error",
+            "status": 400,
+            "detail": f"Answer exceeds maximum length of {APIConfig.MAX_ANSWER_LENGTH} characters"
+        })
+        return
+    
+    try:
+        result = await _socket_call(
+            socket, "evaluation",
+            lambda on_token: _submit_answer(
+                interview_id=interview_id,
+                answer=answer,
+                on_token=on_token,
+                bypass_cache=bool(message.get("bypass_cache"))
+            ),
+            charge=True
+        )
+    except HTTPException as e:
+        await _socket_error(socket, e)
+        return
+    
+    if not result:
+        await socket.send({"type": "error", "status": 400, "detail": "Failed to process answer submission"})
+        return
+    
+    # Turn boundary: persist before reporting the result
+    await interview_manager.aflush_session(interview_id)
+    await socket.send({"type": "evaluation", "data": _evaluation_response(interview_id, result).dict()})
+
+
+async def _socket_error(socket: _InterviewSocket, e: HTTPException):
+    message = {"type": "error", "status": e.status_code, "detail": e.detail}
+    if e.headers and "Retry-After" in e.headers:
+        message["retry_after"] = int(e.headers["Retry-After"])
+    await socket.send(message)
+
+
+async def _socket_call(socket: _InterviewSocket,
+                       task: str,
+                       run: Callable[[Callable[[str], None]], Awaitable[Any]],
+                       admit: bool = True,
+                       charge: bool = False) -> Any:
+    """
+    Run a manager call for an interview socket, forwarding its model output as token messages.
+    
+    LLM-bound calls go through the same admission control as the HTTP
+    endpoints. The call runs to completion even if the client disconnects,
+    so the turn is recorded and picked up on reconnect.
+    
+    Args:
+        socket: Interview socket
+        task: "question" or "evaluation", tagged on token messages
+        run: Coroutine function taking the on_token callback
+        admit: Take an LLM request slot for the call
+        charge: Also take a rate limit token from the client (one per answer)
+        
+    Raises:
+        HTTPException: 429/503 with Retry-After if the call was not admitted
+        WebSocketDisconnect: The client went away (after the call finished)
+    """
+    controller = get_admission_controller()
+    admit = admit and APIConfig.RATE_LIMIT_ENABLED
+    if admit:
+        rejection = controller.check_rate(client_key(socket.websocket.scope), LLM_BOUND) if charge else None
+        if rejection is None:
+            rejection = await controller.acquire_slot()
+        if rejection is not None:
+            status, detail, retry_after = rejection
+            raise HTTPException(status_code=status, detail=detail,
+                                headers={"Retry-After": str(retry_after_seconds(retry_after))})
+    
+    started = time.monotonic()
+    queue: asyncio.Queue = asyncio.Queue()
+    connected = True
+    socket.busy = True
+    try:
+        call = asyncio.create_task(run(queue.put_nowait))
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter, call}, return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                getter.cancel()
+                break
+            if connected:
+                try:
+                    await socket.send({"type": "token", "task": task, "text": getter.result()})
+                except WebSocketDisconnect:
+                    connected = False
+        
+        while connected and not queue.empty():
+            try:
+                await socket.send({"type": "token", "task": task, "text": queue.get_nowait()})
+            except WebSocketDisconnect:
+                connected = False
+        result = call.result()
+    finally:
+        socket.busy = False
+        if admit:
+            controller.release_slot(time.monotonic() - started)
+    
+    if not connected:
+        raise WebSocketDisconnect(code=1006)
+    return result
+
+
 @app.get("/summary/{interview_id}")
 async def get_interview_summary(interview_id: str):
     """
@@ -239,20 +798,43 @@ async def get_interview_summary(interview_id: str):
     and recommendations. Only available for completed interviews.
     """
     try:
-        summary = interview_manager.get_summary(interview_id)
+        summary = await interview_manager.aget_summary(interview_id)
         
         if not summary:
             # Interview not found or no summary available
             raise HTTPException(status_code=404, detail="Interview summary not found")
         
         return summary
-        
+    
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get summary: {str(e)}")
 
 
+def _interview_status(interview_id: str, interview_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Progress and state of an interview session."""
+    state = interview_data.get("state", {})
+    settings = interview_data.get("settings", {})
+    questions = interview_data.get("questions", [])
+    summary = interview_data.get("summary")
+    unevaluated = [q for q in questions if q.get("candidate_answer") and not q.get("evaluation")]
+    
+    return {
+        "interview_id": interview_id,
+        "current_level": state.get("current_level", 3),
+        "asked_count": state.get("asked_count", 0),
+        "total_questions": settings.get("num_questions", 10),
+        "recent_scores": state.get("recent_scores", []),
+        "is_completed": summary is not None,
+        "progress_percentage": min(100, (state.get("asked_count", 0) / settings.get("num_questions", 10)) * 100),
+        "job_title": settings.get("job_title", ""),
+        "questions_answered": len([q for q in questions if q.get("evaluation")]),
+        "pending_evaluations": len([q for q in unevaluated if q.get("evaluation_status") != EvaluationJob.FAILED]),
+        "failed_evaluations": len([q for q in unevaluated if q.get("evaluation_status") == EvaluationJob.FAILED])
+    }
+
+
 @app.get("/status/{interview_id}")
 async def get_interview_status(interview_id: str):
     """
@@ -262,32 +844,13 @@ async def get_interview_status(interview_id: str):
     for both ongoing and completed interviews.
     """
     try:
-        # Load interview data directly from storage
-        interview_data = interview_manager.storage.load_interview(interview_id)
+        interview_data = await interview_manager.aload_session(interview_id)
         
         if not interview_data:
             raise HTTPException(status_code=404, detail="Interview not found")
         
-        # Extract status information
-        state = interview_data.get("state", {})
-        settings = interview_data.get("settings", {})
-        questions = interview_data.get("questions", [])
-        summary = interview_data.get("summary")
-        
-        status = {
-            "interview_id": interview_id,
-            "current_level": state.get("current_level", 3),
-            "asked_count": state.get("asked_count", 0),
-            "total_questions": settings.get("num_questions", 10),
-            "recent_scores": state.get("recent_scores", []),
-            "is_completed": summary is not None,
-            "progress_percentage": min(100, (state.get("asked_count", 0) / settings.get("num_questions", 10)) * 100),
-            "job_title": settings.get("job_title", ""),
-            "questions_answered": len([q for q in questions if q.get("evaluation")])
-        }
-        
-        return status
-        
+        return _interview_status(interview_id, interview_data)
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -297,6 +860,7 @@ async def get_interview_status(interview_id: str):
 @app.get("/interviews")
 async def list_interviews(
     limit: Optional[int] = Query(10, ge=1, le=100, description="Maximum number of interviews to return"),
+    offset: int = Query(0, ge=0, description="Number of interviews to skip"),
     include_summary: bool = Query(False, description="Include basic summary information"),
     sort_by: str = Query("created", regex="^(created|modified|id)$", description="Sort criteria")
 ):
@@ -307,19 +871,22 @@ async def list_interviews(
     Useful for dashboard views and session management.
     """
     try:
-        interviews = storage.list_interviews(
+        interviews = await asyncio.to_thread(
+            storage.list_interviews,
             limit=limit,
             sort_by=sort_by,
-            include_summary=include_summary
+            include_summary=include_summary,
+            offset=offset
         )
         
         return {
             "interviews": interviews,
             "total_count": len(interviews),
             "limit_applied": limit,
+            "offset": offset,
             "sort_by": sort_by
         }
-        
+    
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list interviews: {str(e)}")
 
@@ -329,22 +896,104 @@ async def delete_interview(interview_id: str):
     """
     Delete an interview session.
     
-    Removes the interview data from storage. This operation cannot be undone.
+    Removes the interview data from storage. Until the next storage cleanup
+    it can still be recovered through /interviews/{interview_id}/restore.
     """
     try:
-        success = storage.delete_interview(interview_id)
+        success = await interview_manager.adelete_session(interview_id)
         
         if not success:
             raise HTTPException(status_code=404, detail="Interview not found")
         
         return {"message": f"Interview {interview_id} deleted successfully"}
-        
+    
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete interview: {str(e)}")
 
 
+@app.get("/interviews/{interview_id}/history")
+async def get_interview_history(interview_id: str):
+    """
+    List the recorded changes of an interview session.
+    
+    Each entry has a seq that can be passed to the reconstruct and restore
+    endpoints. History is kept for deleted interviews until storage cleanup.
+    """
+    try:
+        await interview_manager.aflush_session(interview_id)
+        history = await asyncio.to_thread(storage.get_history, interview_id)
+        
+        if not history:
+            raise HTTPException(status_code=404, detail="No history for this interview")
+        
+        return {"interview_id": interview_id, "events": history}
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get history: {str(e)}")
+
+
+@app.get("/interviews/{interview_id}/reconstruct")
+async def reconstruct_interview(
+    interview_id: str,
+    seq: Optional[int] = Query(None, ge=0, description="Replay history up to this seq"),
+    at: Optional[float] = Query(None, description="Replay history up to this Unix timestamp")
+):
+    """
+    Reconstruct an interview session as it was at a point in its history.
+    
+    Without seq or at, returns the latest recorded state.
+    """
+    try:
+        await interview_manager.aflush_session(interview_id)
+        interview_data = await asyncio.to_thread(storage.reconstruct_interview, interview_id, seq=seq, at=at)
+        
+        if not interview_data:
+            raise HTTPException(status_code=404, detail="Interview did not exist at that point")
+        
+        return interview_data
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to reconstruct interview: {str(e)}")
+
+
+@app.post("/interviews/{interview_id}/restore")
+async def restore_interview(
+    interview_id: str,
+    seq: int = Query(..., ge=0, description="History seq to restore")
+):
+    """
+    Restore an interview session to an earlier point in its history.
+    
+    Also recovers deleted interviews: restore to a seq before the deletion.
+    The restore itself is recorded as a new change.
+    """
+    try:
+        async with interview_manager.async_session_lock(interview_id):
+            interview_data = await asyncio.to_thread(storage.reconstruct_interview, interview_id, seq=seq)
+            
+            if not interview_data:
+                raise HTTPException(status_code=404, detail="Interview did not exist at that point")
+            
+            # Prefetched questions and queued evaluations belong to the replaced state
+            interview_manager.prefetcher.discard(interview_id)
+            interview_manager.evaluation_queue.discard(interview_id)
+            if not await interview_manager.asave_session(interview_data, flush=True):
+                raise HTTPException(status_code=500, detail="Failed to save restored interview")
+        
+        return {"message": f"Interview {interview_id} restored to seq {seq}"}
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to restore interview: {str(e)}")
+
+
 @app.post("/interviews/{interview_id}/restart")
 async def restart_interview(interview_id: str):
     """
@@ -354,32 +1003,35 @@ async def restart_interview(interview_id: str):
     preserving the original configuration.
     """
     try:
-        # Load existing interview data
-        interview_data = interview_manager.storage.load_interview(interview_id)
-        
-        if not interview_data:
-            raise HTTPException(status_code=404, detail="Interview not found")
-        
-        # Reset the interview state while preserving settings
-        settings = interview_data.get("settings", {})
-        interview_data.update({
-            "questions": [],
-            "state": {
-                "current_level": settings.get("initial_level", 3),
-                "asked_count": 0,
-                "recent_scores": []
-            },
-            "summary": None
-        })
-        
-        # Save the reset interview
-        success = interview_manager.storage.save_interview(interview_data)
+        async with interview_manager.async_session_lock(interview_id):
+            # Load existing interview data
+            interview_data = await interview_manager.aload_session(interview_id)
+            
+            if not interview_data:
+                raise HTTPException(status_code=404, detail="Interview not found")
+            
+            # Reset the interview state while preserving settings
+            settings = interview_data.get("settings", {})
+            interview_data.update({
+                "questions": [],
+                "state": {
+                    "current_level": settings.get("initial_level", 3),
+                    "asked_count": 0,
+                    "recent_scores": []
+                },
+                "summary": None
+            })
+            
+            # Save the reset interview
+            interview_manager.prefetcher.discard(interview_id)
+            interview_manager.evaluation_queue.discard(interview_id)
+            success = await interview_manager.asave_session(interview_data, flush=True)
         
         if not success:
             raise HTTPException(status_code=500, detail="Failed to save restarted interview")
         
         return {"message": f"Interview {interview_id} restarted successfully"}
-        
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -392,11 +1044,12 @@ async def get_storage_statistics():
     Get storage usage statistics.
     
     Returns information about disk usage, file counts, and storage health.
+    Served from running counters, so it is cheap enough for frequent polling.
     """
     try:
-        stats = storage.get_storage_stats()
+        stats = await asyncio.to_thread(storage.get_storage_stats)
         return stats
-        
+    
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get storage stats: {str(e)}")
 
@@ -406,17 +1059,20 @@ async def cleanup_old_backups(keep_days: int = Query(7, ge=1, le=30, description
     """
     Clean up old backup files.
     
-    Removes backup files older than specified number of days to free up storage space.
+    Removes backup files, and history of deleted interviews, older than the
+    specified number of days to free up storage space, and the lock files of
+    interviews that no longer exist.
     """
     try:
-        deleted_count = storage.cleanup_old_backups(keep_days)
+        deleted_count = await asyncio.to_thread(storage.cleanup_old_backups, keep_days)
+        deleted_count += await asyncio.to_thread(interview_manager.cleanup_session_locks)
         
         return {
             "message": f"Cleanup completed successfully",
             "deleted_backups": deleted_count,
             "keep_days": keep_days
         }
-        
+    
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to cleanup backups: {str(e)}")
 
@@ -460,6 +1116,11 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on application shutdown."""
     print("🛑 Shutting down AI Interview Simulator API")
+    
+    # Persist sessions still pending in the write-behind cache
+    await interview_manager.evaluation_queue.close()
+    interview_manager.close()
+    await get_gateway().close()
 
 
 if __name__ == "__main__":
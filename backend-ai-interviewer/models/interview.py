@@ -49,6 +49,7 @@ class Evaluation(BaseModel):
     level_adjustment: int = Field(..., description="Numeric level adjustment (-1, 0, +1)")
     strengths: List[str] = Field(..., description="Identified strengths in the answer")
     improvements: List[str] = Field(..., description="Areas for improvement")
+    is_fallback: bool = Field(default=False, description="Whether this is the fallback evaluation recorded after the LLM failed")
 
 
 class QuestionRecord(BaseModel):
@@ -113,6 +114,8 @@ class AnswerSubmission(BaseModel):
     
     interview_id: str = Field(..., description="Interview session ID")
     answer: str = Field(..., description="Candidate's answer text")
+    bypass_cache: bool = Field(default=False, description="Re-evaluate with the LLM even if an identical answer was evaluated before (e.g. audit runs)")
+    async_evaluation: bool = Field(default=False, description="Return 202 at once and evaluate in the background (poll /evaluation/{interview_id}/{q_id})")
 
 
 class InterviewResponse(BaseModel):
@@ -143,4 +146,48 @@ class EvaluationResponse(BaseModel):
     interview_id: str = Field(..., description="Interview session ID")
     evaluation: Evaluation = Field(..., description="Answer evaluation")
     new_level: int = Field(..., description="Updated difficulty level")
-    is_complete: bool = Field(..., description="Whether interview is finished")
\ No newline at end of file
+    is_complete: bool = Field(..., description="Whether interview is finished")
+
+
+class EvaluationAccepted(BaseModel):
+    """Response model for an answer accepted for background evaluation."""
+    
+    interview_id: str = Field(..., description="Interview session ID")
+    q_id: int = Field(..., description="Question ID")
+    status: str = Field(..., description="Evaluation status")
+    poll_url: str = Field(..., description="Evaluation status endpoint")
+    stream_url: str = Field(..., description="Server-sent events endpoint for the evaluation")
+
+
+class EvaluationStatusResponse(BaseModel):
+    """Response model for the status of a background evaluation."""
+    
+    interview_id: str = Field(..., description="Interview session ID")
+    q_id: int = Field(..., description="Question ID")
+    status: str = Field(..., description="pending, running, done or failed")
+    evaluation: Optional[Evaluation] = Field(default=None, description="Answer evaluation, once done")
+    new_level: Optional[int] = Field(default=None, description="Difficulty level after the evaluation, once done")
+    is_complete: Optional[bool] = Field(default=None, description="Whether interview is finished, once done")
+    error: Optional[str] = Field(default=None, description="Why the evaluation failed")
+
+
+class TranscriptItem(BaseModel):
+    """One recorded question and answer of a transcript to evaluate."""
+    
+    question: str = Field(..., min_length=1, description="Question text")
+    answer: str = Field(..., description="Candidate's answer text")
+    level: int = Field(default=3, ge=1, le=5, description="Question difficulty level")
+    topics: List[str] = Field(default=[], description="Question topics")
+    question_type: str = Field(default="technical", pattern="^(technical|soft)$", description="Question type: technical or soft")
+
+
+class BatchEvaluationRequest(BaseModel):
+    """Request model for evaluating a recorded interview transcript."""
+    
+    job_title: str = Field(..., description="Target job title")
+    items: List[TranscriptItem] = Field(..., min_items=1, max_items=50, description="Questions and answers, in interview order")
+    keywords: List[str] = Field(default=[], description="Keywords for the stored session (default: the items' topics)")
+    language: str = Field(default="en", description="Interview language")
+    concurrency: Optional[int] = Field(default=None, ge=1, le=16, description="Evaluations in flight at once")
+    save_transcript: bool = Field(default=True, description="Store the transcript as a completed interview session")
+    bypass_cache: bool = Field(default=False, description="Re-evaluate with the LLM even if an identical answer was evaluated before")
\ No newline at end of file
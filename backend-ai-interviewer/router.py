@@ -0,0 +1,477 @@
+"""
+Front router for running the API on several worker processes.
+
+    python router.py --workers 4
+
+Spawns N uvicorn workers serving main:app on WORKER_BASE_PORT + i and
+proxies every request, WebSockets included, to one of them. Requests that
+name an interview (in the path, the interview_id query parameter or the
+JSON body) always go to the same worker: the owner is picked by rendezvous
+hashing of the interview id over the live workers. That worker's session
+cache, prefetched questions, evaluation queue and socket registry therefore
+stay coherent. Other requests (new interviews, listings, health) are spread
+round-robin; the worker that creates an interview picks an id it owns
+itself (utils.id_utils.generate_interview_id).
+
+A worker that exits, or stops answering health checks (RouterConfig.HUNG_CHECKS
+in a row), is restarted with backoff. Meanwhile its interviews
+hash onto the remaining workers. Rendezvous hashing moves only those, and
+they move back once the worker is healthy again. Such a move can overlap
+with a request still in flight on the previous owner. For that case the
+workers run with cross-process session locks and revalidate cached sessions
+against storage (see StorageConfig.MULTI_WORKER).
+
+The router replaces X-Forwarded-For with the one client address it
+determined itself (the peer address, or the forwarded address when the router
+is configured to trust its own proxy), so per-client rate limits still apply
+per client and a client cannot pick its own rate-limit bucket. Deployment-wide limits (global rate, LLM
+concurrency, admission queue) are split evenly between the workers.
+
+Several workers require the SQLite storage backend, which they then use by
+default: the JSON backend keeps its metadata index in each process and
+rewrites one shared index file, so workers would list different interviews
+and overwrite each other's index.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs
+
+import httpx
+import uvicorn
+
+try:
+    from websockets.asyncio.client import connect as ws_connect  # websockets >= 13
+    from websockets.exceptions import ConnectionClosed
+    _WS_HEADERS_ARG = "additional_headers"
+except ImportError:
+    try:
+        from websockets import connect as ws_connect
+        from websockets.exceptions import ConnectionClosed
+        _WS_HEADERS_ARG = "extra_headers"
+    except ImportError:
+        ws_connect = None
+
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from utils.config import APIConfig, OllamaConfig, RouterConfig
+from utils.id_utils import rendezvous_pick
+from services.admission import client_key
+
+
+# Paths whose second segment is an interview id
+_INTERVIEW_PATH = re.compile(r"^/(?:status|summary|evaluation|interviews|ws/interview)/([^/]+)")
+
+# Headers that describe one connection and are not forwarded
+_HOP_BY_HOP = {b"connection", b"keep-alive", b"proxy-authenticate", b"proxy-authorization",
+               b"te", b"trailers", b"transfer-encoding", b"upgrade", b"host"}
+
+# Deployment-wide limits divided between the workers: env name -> configured total
+_SHARED_LIMITS = {
+    "OLLAMA_MAX_CONCURRENT": OllamaConfig.MAX_CONCURRENT_REQUESTS,
+    "GLOBAL_RATE_LIMIT_PER_MINUTE": APIConfig.GLOBAL_RATE_LIMIT_PER_MINUTE,
+    "GLOBAL_RATE_LIMIT_BURST": APIConfig.GLOBAL_RATE_LIMIT_BURST,
+    "ADMISSION_MAX_IN_FLIGHT": APIConfig.ADMISSION_MAX_IN_FLIGHT,
+    "ADMISSION_MAX_QUEUED": APIConfig.ADMISSION_MAX_QUEUED,
+}
+
+
+def interview_key(scope: Dict[str, Any], body: bytes = b"") -> Optional[str]:
+    """
+    Interview id a request is about, if any.
+    
+    Looked up in the path (/status/{id}, /ws/interview/{id}, ...), then the
+    interview_id query parameter, then a JSON body's interview_id.
+    """
+    match = _INTERVIEW_PATH.match(scope.get("path", ""))
+    if match:
+        return match.group(1)
+    
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    if query.get("interview_id"):
+        return query["interview_id"][0]
+    
+    if body and body.lstrip()[:1] == b"{":
+        try:
+            value = json.loads(body).get("interview_id")
+            return str(value) if value else None
+        except (ValueError, AttributeError):
+            return None
+    return None
+
+
+class Worker:
+    """One uvicorn worker process and its health."""
+    
+    def __init__(self, index: int, count: int, port: int):
+        self.index = index
+        self.count = count
+        self.port = port
+        self.url = f"http://{RouterConfig.WORKER_HOST}:{port}"
+        self.process: Optional[subprocess.Popen] = None
+        self.healthy = False
+        self.restarts = 0
+        self.backoff = RouterConfig.RESTART_BACKOFF
+        self.restart_at: Optional[float] = None
+        self.started_at = 0.0
+        self.ready = False  # answered a health check since it was started
+        self.failed_checks = 0
+        self.requests = 0
+    
+    def environment(self) -> Dict[str, str]:
+        """Worker environment: multi-worker mode, trusted forwarding, a share of the limits."""
+        env = dict(os.environ)
+        env["INTERVIEWER_WORKERS"] = str(self.count)
+        env["INTERVIEWER_WORKER_INDEX"] = str(self.index)
+        env["TRUST_FORWARDED_FOR"] = "true"
+        env["TRUSTED_PROXY_HOPS"] = "1"  # the router is the only hop in front of a worker
+        for name, total in _SHARED_LIMITS.items():
+            env[name] = str(max(1, math.ceil(total / self.count)))
+        return env
+    
+    def start(self):
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app",
+             "--host", RouterConfig.WORKER_HOST, "--port", str(self.port), "--log-level", "warning"],
+            cwd=str(backend_dir),
+            env=self.environment()
+        )
+        self.restart_at = None
+        self.started_at = time.monotonic()
+        self.ready = False
+        self.failed_checks = 0
+    
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+    
+    def hung(self, now: float) -> bool:
+        """Running but failing health checks: after it was ready, or for longer than startup may take."""
+        return (self.alive and self.failed_checks >= RouterConfig.HUNG_CHECKS
+                and (self.ready or now - self.started_at > RouterConfig.STARTUP_TIMEOUT))
+    
+    def stop(self, timeout: float = 15.0):
+        """Terminate gracefully (the worker flushes its sessions), killing it after timeout."""
+        if not self.alive:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "port": self.port,
+            "pid": self.process.pid if self.process else None,
+            "alive": self.alive,
+            "healthy": self.healthy,
+            "restarts": self.restarts,
+            "failed_checks": self.failed_checks,
+            "requests": self.requests
+        }
+
+
+class Router:
+    """ASGI app proxying requests to the worker that owns their interview."""
+    
+    def __init__(self, workers: Optional[int] = None, base_port: Optional[int] = None):
+        """
+        Initialize the worker pool; processes start with the ASGI lifespan.
+        
+        Args:
+            workers: Number of worker processes (default: RouterConfig.WORKERS)
+            base_port: Port of worker 0 (default: RouterConfig.WORKER_BASE_PORT)
+        """
+        count = max(1, workers or RouterConfig.WORKERS)
+        base_port = base_port or RouterConfig.WORKER_BASE_PORT
+        self.workers = [Worker(i, count, base_port + i) for i in range(count)]
+        self._round_robin = itertools.cycle(range(count))
+        self._client: Optional[httpx.AsyncClient] = None
+        self._monitor: Optional[asyncio.Task] = None
+        self.failovers = 0
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "websocket":
+            await self._proxy_websocket(scope, receive, send)
+        elif scope.get("path") == "/router/status":
+            await _send_json(send, 200, self.get_stats())
+        else:
+            await self._proxy_http(scope, receive, send)
+    
+    def pick(self, key: Optional[str]) -> Optional[Worker]:
+        """Worker for a request: the interview's owner among healthy workers, else round-robin."""
+        healthy = [w.index for w in self.workers if w.healthy]
+        if not healthy:
+            return None
+        if key is None:
+            for _ in range(len(self.workers)):
+                index = next(self._round_robin)
+                if self.workers[index].healthy:
+                    return self.workers[index]
+        index = rendezvous_pick(key, healthy)
+        if key is not None and index != rendezvous_pick(key, [w.index for w in self.workers]):
+            self.failovers += 1
+        return self.workers[index]
+    
+    async def _proxy_http(self, scope, receive, send):
+        body = await _read_body(receive)
+        key = interview_key(scope, body)
+        url_path = scope.get("raw_path") or scope["path"].encode("utf-8")
+        query = scope.get("query_string", b"")
+        headers = _forward_headers(scope)
+        
+        response = None
+        for attempt in range(2):
+            worker = self.pick(key)
+            if worker is None:
+                await _send_json(send, 503, {"detail": "No worker available"}, retry_after=RouterConfig.HEALTH_INTERVAL)
+                return
+            url = worker.url + url_path.decode("latin-1") + (f"?{query.decode('latin-1')}" if query else "")
+            request = self._client.build_request(scope["method"], url, headers=headers, content=body)
+            try:
+                worker.requests += 1
+                response = await self._client.send(request, stream=True)
+                break
+            except httpx.ConnectError:
+                # Not sent, so safe to retry on the next owner
+                worker.healthy = False
+            except httpx.TimeoutException:
+                await _send_json(send, 504, {"detail": "Worker timed out"})
+                return
+            except httpx.HTTPError as e:
+                print(f"❌ Router: request to worker {worker.index} failed: {e!r}")
+                worker.healthy = False
+                await _send_json(send, 502, {"detail": "Worker failed to respond"})
+                return
+        if response is None:
+            await _send_json(send, 503, {"detail": "No worker available"}, retry_after=RouterConfig.HEALTH_INTERVAL)
+            return
+        
+        try:
+            await send({
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": [(k, v) for k, v in response.headers.raw if k.lower() not in _HOP_BY_HOP]
+            })
+            async for chunk in response.aiter_raw():
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        except httpx.HTTPError as e:
+            # The status line is already sent; end the body so the client sees the response finish
+            print(f"❌ Router: response from worker {worker.index} broke off: {e!r}")
+            if not isinstance(e, httpx.TimeoutException):
+                worker.healthy = False
+        finally:
+            await response.aclose()
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+    
+    async def _proxy_websocket(self, scope, receive, send):
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            return
+        worker = self.pick(interview_key(scope))
+        if ws_connect is None or worker is None:
+            if ws_connect is None:
+                print("❌ WebSocket proxying needs the websockets package (pip install websockets)")
+            await send({"type": "websocket.close", "code": 1013})
+            return
+        
+        url = f"ws://{RouterConfig.WORKER_HOST}:{worker.port}{scope['path']}"
+        if scope.get("query_string"):
+            url += "?" + scope["query_string"].decode("latin-1")
+        forwarded = [(k.decode("latin-1"), v.decode("latin-1")) for k, v in _forward_headers(scope)
+                     if k in (b"x-forwarded-for", b"authorization", b"cookie")]
+        try:
+            worker.requests += 1
+            upstream = await ws_connect(url, max_size=None, **{_WS_HEADERS_ARG: forwarded})
+        except Exception as e:
+            print(f"❌ WebSocket proxy could not reach worker {worker.index}: {e}")
+            await send({"type": "websocket.close", "code": 1011})
+            return
+        await send({"type": "websocket.accept"})
+        
+        async def client_to_worker():
+            while True:
+                message = await receive()
+                if message["type"] == "websocket.disconnect":
+                    await upstream.close()
+                    return
+                if message.get("text") is not None:
+                    await upstream.send(message["text"])
+                elif message.get("bytes") is not None:
+                    await upstream.send(message["bytes"])
+        
+        async def worker_to_client():
+            try:
+                async for data in upstream:
+                    if isinstance(data, str):
+                        await send({"type": "websocket.send", "text": data})
+                    else:
+                        await send({"type": "websocket.send", "bytes": data})
+            except ConnectionClosed:
+                pass
+            await send({"type": "websocket.close", "code": upstream.close_code or 1000,
+                        "reason": upstream.close_reason or ""})
+        
+        tasks = [asyncio.create_task(client_to_worker()), asyncio.create_task(worker_to_client())]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await upstream.close()
+    
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.start()
+                    await send({"type": "lifespan.startup.complete"})
+                except Exception as e:
+                    await self.stop()
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+    
+    async def start(self):
+        """Start the workers and wait until they all answer /health."""
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(RouterConfig.PROXY_TIMEOUT, connect=5.0),
+            limits=httpx.Limits(max_connections=RouterConfig.MAX_CONNECTIONS,
+                                max_keepalive_connections=RouterConfig.MAX_CONNECTIONS)
+        )
+        for worker in self.workers:
+            worker.start()
+        
+        deadline = time.monotonic() + RouterConfig.STARTUP_TIMEOUT
+        while not all(w.healthy for w in self.workers):
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Workers not ready after {RouterConfig.STARTUP_TIMEOUT}s")
+            for worker in self.workers:
+                if not worker.alive:
+                    raise RuntimeError(f"Worker {worker.index} exited during startup")
+            await asyncio.gather(*(self._check(w) for w in self.workers if not w.healthy))
+            await asyncio.sleep(0.2)
+        
+        print(f"🚀 Router: {len(self.workers)} workers on ports "
+              f"{self.workers[0].port}-{self.workers[-1].port}")
+        self._monitor = asyncio.create_task(self._monitor_loop())
+    
+    async def stop(self):
+        """Stop monitoring and terminate the workers."""
+        if self._monitor is not None:
+            self._monitor.cancel()
+            await asyncio.gather(self._monitor, return_exceptions=True)
+        await asyncio.gather(*(asyncio.to_thread(w.stop) for w in self.workers))
+        if self._client is not None:
+            await self._client.aclose()
+    
+    async def _check(self, worker: Worker):
+        """Mark a worker healthy if it answers /health at all, counting failures in a row."""
+        try:
+            await self._client.get(worker.url + "/health", timeout=2.0)
+            worker.healthy = worker.ready = True
+            worker.failed_checks = 0
+        except httpx.HTTPError:
+            worker.healthy = False
+            worker.failed_checks += 1
+    
+    async def _monitor_loop(self):
+        while True:
+            await asyncio.sleep(RouterConfig.HEALTH_INTERVAL)
+            now = time.monotonic()
+            for worker in self.workers:
+                if worker.alive:
+                    was_healthy = worker.healthy
+                    await self._check(worker)
+                    if worker.healthy and not was_healthy:
+                        worker.backoff = RouterConfig.RESTART_BACKOFF
+                        print(f"✅ Router: worker {worker.index} is back")
+                    if not worker.hung(time.monotonic()):
+                        continue
+                    print(f"🛑 Router: worker {worker.index} failed {worker.failed_checks} health checks; stopping it")
+                    await asyncio.to_thread(worker.stop, 5.0)
+                
+                worker.healthy = False
+                if worker.restart_at is None:
+                    print(f"🛑 Router: worker {worker.index} exited; restarting in {worker.backoff:.0f}s")
+                    worker.restart_at = now + worker.backoff
+                    worker.backoff = min(worker.backoff * 2, 30.0)
+                elif now >= worker.restart_at:
+                    worker.restarts += 1
+                    worker.start()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Worker states and routing counters."""
+        return {
+            "workers": [w.get_stats() for w in self.workers],
+            "healthy": sum(1 for w in self.workers if w.healthy),
+            "failover_requests": self.failovers
+        }
+
+
+def _forward_headers(scope) -> List[tuple]:
+    """
+    Request headers for the worker, with X-Forwarded-For set to the client address alone.
+    
+    The workers trust that header, so an inbound one is never passed on.
+    """
+    headers = [(k, v) for k, v in scope.get("headers", []) if k.lower() not in _HOP_BY_HOP and k != b"x-forwarded-for"]
+    headers.append((b"x-forwarded-for", client_key(scope).encode("latin-1")))
+    return headers
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+
+async def _send_json(send, status: int, content: Dict[str, Any], retry_after: Optional[float] = None):
+    body = json.dumps(content).encode("utf-8")
+    headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("latin-1"))]
+    if retry_after is not None:
+        headers.append((b"retry-after", str(max(1, math.ceil(retry_after))).encode("latin-1")))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the API on several workers behind an interview-affine router")
+    parser.add_argument("--workers", type=int, default=RouterConfig.WORKERS, help="Worker processes")
+    parser.add_argument("--host", default=RouterConfig.HOST, help="Router listen address")
+    parser.add_argument("--port", type=int, default=RouterConfig.PORT, help="Router port")
+    parser.add_argument("--base-port", type=int, default=RouterConfig.WORKER_BASE_PORT, help="Port of worker 0")
+    args = parser.parse_args()
+    if args.workers > 1 and os.getenv("STORAGE_BACKEND", "sqlite").lower() != "sqlite":
+        parser.error("several workers need STORAGE_BACKEND=sqlite (migrate JSON sessions with "
+                     "scripts/migrate_json_to_sqlite.py), or run with --workers 1")
+    
+    uvicorn.run(Router(workers=args.workers, base_port=args.base_port),
+                host=args.host, port=args.port, lifespan="on", log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
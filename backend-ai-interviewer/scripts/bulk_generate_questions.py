@@ -0,0 +1,104 @@
+"""
+Fill the question bank ahead of time.
+
+Generates questions for every combination of the given levels and question
+types, with at most --concurrency LLM calls in flight, and banks them.
+Near-duplicates and fallback questions (LLM unavailable) are not banked.
+Sessions with the same job title, keywords and language are then served
+from the bank without waiting for the LLM.
+
+Usage:
+    python scripts/bulk_generate_questions.py --job-title "Backend Engineer" --keywords python,sql
+    python scripts/bulk_generate_questions.py --job-title "Data Scientist" --levels 2-4 --types technical --count 30 --concurrency 4
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.config import InterviewConfig, QuestionConfig
+from agents.interviewer_agent import InterviewerAgent
+from services.question_bank import QuestionBank
+
+
+def parse_levels(value: str):
+    """Parse "3", "2-4" or "1,3,5" into a list of levels."""
+    levels = set()
+    for part in value.split(","):
+        if "-" in part:
+            low, high = part.split("-", 1)
+            levels.update(range(int(low), int(high) + 1))
+        elif part.strip():
+            levels.add(int(part))
+    invalid = [l for l in levels if not InterviewConfig.MIN_LEVEL <= l <= InterviewConfig.MAX_LEVEL]
+    if invalid:
+        raise argparse.ArgumentTypeError(f"Levels must be between {InterviewConfig.MIN_LEVEL} and {InterviewConfig.MAX_LEVEL}")
+    return sorted(levels)
+
+
+async def generate(args, bank: QuestionBank):
+    agent = InterviewerAgent()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    totals = {"added": 0, "duplicates": 0, "fallbacks": 0}
+
+    async def one(level: int, question_type: str, previous: list):
+        # Build the request once a slot is free, so it lists the questions banked while waiting
+        async with semaphore:
+            request = {
+                "job_title": args.job_title,
+                "level": level,
+                "keywords": args.keywords,
+                "question_type": question_type,
+                "language": args.language,
+                "previous_questions": previous[-10:],
+            }
+            question = await agent.agenerate_question(**request)
+
+            if question.get("is_fallback"):
+                totals["fallbacks"] += 1
+            elif bank.add(request, question, source="bulk"):
+                totals["added"] += 1
+                previous.append(question["question_text"])
+            else:
+                totals["duplicates"] += 1
+
+    for level in args.levels:
+        for question_type in args.types:
+            # Recent questions of the combination steer the model away from repeats
+            previous = []
+            await asyncio.gather(*[one(level, question_type, previous) for _ in range(args.count)])
+            print(f"✓ level {level} {question_type}: {len(previous)} new questions")
+
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--job-title", required=True, help="Job title the questions are for")
+    parser.add_argument("--keywords", type=lambda v: [k.strip() for k in v.split(",") if k.strip()], default=[],
+                        help="Comma-separated keywords, as sessions will send them")
+    parser.add_argument("--language", default=InterviewConfig.DEFAULT_LANGUAGE, help="Question language")
+    parser.add_argument("--levels", type=parse_levels, default=parse_levels("1-5"), help="Levels, e.g. 3, 2-4 or 1,3,5")
+    parser.add_argument("--types", type=lambda v: [t.strip() for t in v.split(",")], default=QuestionConfig.QUESTION_TYPES,
+                        help="Comma-separated question types")
+    parser.add_argument("--count", type=int, default=20, help="Questions to generate per level and type")
+    parser.add_argument("--concurrency", type=int, default=4, help="LLM calls in flight at once")
+    parser.add_argument("--db", type=Path, default=QuestionConfig.BANK_PATH, help="Question bank database")
+    args = parser.parse_args()
+
+    unknown = [t for t in args.types if t not in QuestionConfig.QUESTION_TYPES]
+    if unknown:
+        parser.error(f"Unknown question types: {', '.join(unknown)}")
+
+    bank = QuestionBank(args.db)
+    totals = asyncio.run(generate(args, bank))
+
+    print(f"\nBanked {totals['added']} questions in {args.db}: "
+          f"{totals['duplicates']} near-duplicates and {totals['fallbacks']} fallbacks skipped")
+    return 0 if totals["fallbacks"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Migrate interview sessions from the JSON file backend to SQLite.
+
+Loads every session of the JSON file backend (its data/interviews/*.json
+snapshot plus the journal events written since), validates it and saves it
+into the SQLite database with its original creation and last change times.
+Sessions already present in the database are overwritten, so the migration
+can be re-run safely.
+
+Usage:
+    python scripts/migrate_json_to_sqlite.py
+    python scripts/migrate_json_to_sqlite.py --source data/interviews --db data/interviews.db --dry-run
+
+Afterwards set STORAGE_BACKEND=sqlite (and SQLITE_PATH if --db was changed).
+"""
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.config import InterviewConfig, StorageConfig
+from services.storage import InterviewStorage
+from utils.id_utils import get_interview_filename
+from services.sqlite_storage import SQLiteInterviewStorage
+
+
+def session_times(source: InterviewStorage, interview_id: str) -> Tuple[float, float]:
+    """Creation and last change time of a JSON-backed session, as the JSON backend reports them."""
+    entry = source.index.get(interview_id)
+    if entry:
+        return datetime.fromisoformat(entry["created"]).timestamp(), entry["modified_ts"]
+    
+    stat = (source.storage_dir / get_interview_filename(interview_id)).stat()
+    journal_path = source.journal.path(interview_id)
+    modified = max(stat.st_mtime, journal_path.stat().st_mtime) if journal_path.exists() else stat.st_mtime
+    return stat.st_ctime, modified
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--source", type=Path, default=InterviewConfig.INTERVIEWS_DIR,
+                        help="Directory with <interview_id>.json files")
+    parser.add_argument("--db", type=Path, default=StorageConfig.SQLITE_PATH, help="SQLite database file")
+    parser.add_argument("--dry-run", action="store_true", help="Validate files without writing")
+    args = parser.parse_args()
+    
+    source = InterviewStorage(args.source)
+    target = None if args.dry_run else SQLiteInterviewStorage(args.db)
+    migrated, skipped = 0, 0
+    
+    for filepath in sorted(args.source.glob("*.json")):
+        data = source.load_interview(filepath.stem)
+        if data is None:
+            print(f"✗ {filepath.name}: unreadable or invalid")
+            skipped += 1
+            continue
+        
+        created_at, updated_at = session_times(source, filepath.stem)
+        if target is not None and not target.save_interview(data, created_at=created_at, updated_at=updated_at):
+            print(f"✗ {filepath.name}: failed to save")
+            skipped += 1
+            continue
+        
+        migrated += 1
+        print(f"✓ {data['interview_id']} ({len(data.get('questions') or [])} questions)")
+    
+    action = "Validated" if args.dry_run else f"Migrated into {args.db}:"
+    print(f"\n{action} {migrated} interviews, {skipped} skipped")
+    return 0 if skipped == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,348 @@
+"""
+Admission control for the API.
+
+One client looping on /next_question could otherwise keep the LLM busy for
+everyone. A request goes through three checks before it reaches the app:
+
+1. The client's token bucket (APIConfig.RATE_LIMIT_PER_MINUTE, with bursts
+   of RATE_LIMIT_BURST). A request over it gets 429.
+2. A global token bucket shared by all clients (GLOBAL_RATE_LIMIT_PER_MINUTE).
+   A request over it gets 503.
+3. LLM-bound requests (APIConfig.LLM_BOUND_PATHS) take one of
+   ADMISSION_MAX_IN_FLIGHT slots. When all slots are taken they wait in a
+   bounded FIFO queue. A request gets 503 if the queue is full or its wait
+   exceeds ADMISSION_QUEUE_TIMEOUT.
+
+An LLM-bound request costs a whole token. Any other request costs
+RATE_LIMIT_LIGHT_COST, so polling a status does not use up a client's
+budget. Every rejection carries Retry-After. While LLM-bound requests are
+queued, new interviews are refused, so the capacity goes to interviews
+already in progress.
+
+This is plain ASGI middleware rather than BaseHTTPMiddleware. That way a
+slot is held until a streamed response has been sent completely. All state
+lives on the event loop, so no locks are needed.
+"""
+
+import asyncio
+import json
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+try:
+    from utils.config import APIConfig
+except ImportError:
+    # Fallback for direct execution
+    import sys
+    from pathlib import Path
+    sys.path.append(str(Path(__file__).parent.parent))
+    from utils.config import APIConfig
+
+
+# Paths starting a new interview, refused while LLM-bound requests are queued
+NEW_INTERVIEW_PATHS = ("/start_interview",)
+
+# Request classes
+EXEMPT = "exempt"
+LIGHT = "light"
+LLM_BOUND = "llm"
+
+# (status code, detail, retry after seconds)
+Rejection = Tuple[int, str, float]
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+    
+    def __init__(self, per_minute: float, burst: float):
+        """
+        Initialize a full bucket.
+        
+        Args:
+            per_minute: Tokens added per minute
+            burst: Bucket capacity
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+    
+    def take(self, cost: float = 1.0) -> float:
+        """
+        Take tokens if available.
+        
+        Args:
+            cost: Tokens the request costs
+            
+        Returns:
+            0 if the tokens were taken, else seconds until they will be available
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+        return (cost - self.tokens) / self.rate
+    
+    def refund(self, cost: float = 1.0):
+        """Return tokens taken for a request that was not served after all."""
+        self.tokens = min(self.capacity, self.tokens + cost)
+
+
+class AdmissionController:
+    """Token buckets and the bounded in-flight queue for LLM-bound requests."""
+    
+    def __init__(self,
+                 per_minute: Optional[float] = None,
+                 burst: Optional[float] = None,
+                 global_per_minute: Optional[float] = None,
+                 global_burst: Optional[float] = None,
+                 max_in_flight: Optional[int] = None,
+                 max_queued: Optional[int] = None,
+                 queue_timeout: Optional[float] = None):
+        """
+        Initialize admission limits (defaults from APIConfig).
+        
+        Args:
+            per_minute: LLM-bound requests per client per minute (0 disables the per-client limit)
+            burst: Requests a client may send at once
+            global_per_minute: LLM-bound requests per minute over all clients (0 disables the global limit)
+            global_burst: Requests all clients may send at once
+            max_in_flight: LLM-bound requests served at once
+            max_queued: LLM-bound requests allowed to wait for a slot
+            queue_timeout: Seconds a request waits for a slot
+        """
+        self.per_minute = APIConfig.RATE_LIMIT_PER_MINUTE if per_minute is None else per_minute
+        self.burst = burst or APIConfig.RATE_LIMIT_BURST
+        global_per_minute = APIConfig.GLOBAL_RATE_LIMIT_PER_MINUTE if global_per_minute is None else global_per_minute
+        self.max_in_flight = max(1, max_in_flight or APIConfig.ADMISSION_MAX_IN_FLIGHT)
+        self.max_queued = APIConfig.ADMISSION_MAX_QUEUED if max_queued is None else max_queued
+        self.queue_timeout = queue_timeout or APIConfig.ADMISSION_QUEUE_TIMEOUT
+        
+        self._clients: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._global = TokenBucket(global_per_minute, global_burst or APIConfig.GLOBAL_RATE_LIMIT_BURST) if global_per_minute > 0 else None
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.in_flight = 0
+        self._avg_duration: Optional[float] = None
+        
+        self.admitted = 0
+        self.rate_limited = 0
+        self.global_limited = 0
+        self.queue_full = 0
+        self.queue_timeouts = 0
+        self.shed = 0
+    
+    def classify(self, path: str) -> str:
+        """Request class of a path: EXEMPT, LIGHT or LLM_BOUND."""
+        if path in APIConfig.RATE_LIMIT_EXEMPT_PATHS:
+            return EXEMPT
+        for prefix in APIConfig.LLM_BOUND_PATHS:
+            if path == prefix or path.startswith(prefix + "/"):
+                return LLM_BOUND
+        return LIGHT
+    
+    def check_rate(self, client: str, kind: str) -> Optional[Rejection]:
+        """Take a request's tokens from the client and global buckets, or say why not."""
+        cost = 1.0 if kind == LLM_BOUND else APIConfig.RATE_LIMIT_LIGHT_COST
+        
+        bucket = None
+        if self.per_minute > 0:
+            bucket = self._clients.get(client)
+            if bucket is None:
+                bucket = self._clients[client] = TokenBucket(self.per_minute, self.burst)
+                if len(self._clients) > APIConfig.RATE_LIMIT_MAX_CLIENTS:
+                    self._clients.popitem(last=False)
+            else:
+                self._clients.move_to_end(client)
+            
+            wait = bucket.take(cost)
+            if wait:
+                self.rate_limited += 1
+                return 429, "Rate limit exceeded, slow down", wait
+        
+        if self._global is not None:
+            wait = self._global.take(cost)
+            if wait:
+                if bucket is not None:
+                    bucket.refund(cost)
+                self.global_limited += 1
+                return 503, "Server is at capacity, try again shortly", wait
+        
+        return None
+    
+    def check_new_interview(self) -> Optional[Rejection]:
+        """Refuse a new interview while LLM-bound requests are queued."""
+        if APIConfig.ADMISSION_SHED_NEW_INTERVIEWS and self._waiters:
+            self.shed += 1
+            return 503, "Server is busy with interviews in progress, try again shortly", self._queue_retry_after()
+        return None
+    
+    async def acquire_slot(self) -> Optional[Rejection]:
+        """Wait for an LLM-bound request slot; the caller must release_slot() once served."""
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            self.admitted += 1
+            return None
+        
+        if len(self._waiters) >= self.max_queued:
+            self.queue_full += 1
+            return 503, "Too many requests waiting for the LLM, try again shortly", self._queue_retry_after()
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait({waiter}, timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+        
+        if waiter.done():
+            self.admitted += 1
+            return None
+        self._abandon(waiter)
+        self.queue_timeouts += 1
+        return 503, "Timed out waiting for the LLM, try again shortly", self._queue_retry_after()
+    
+    def release_slot(self, duration: Optional[float] = None):
+        """Hand a finished request's slot to the next waiter, if any."""
+        if duration is not None:
+            self._avg_duration = duration if self._avg_duration is None else 0.8 * self._avg_duration + 0.2 * duration
+        
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+    
+    def _abandon(self, waiter: asyncio.Future):
+        """Leave the queue; a slot handed over meanwhile is passed on."""
+        if waiter.done():
+            self.release_slot()
+            return
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+    
+    def _queue_retry_after(self) -> float:
+        """Estimated seconds until the queue has drained enough for a new request."""
+        per_request = self._avg_duration or 1.0
+        return per_request * (len(self._waiters) + 1) / self.max_in_flight
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Admission counters and queue state."""
+        return {
+            "enabled": APIConfig.RATE_LIMIT_ENABLED,
+            "per_client_per_minute": self.per_minute,
+            "clients_tracked": len(self._clients),
+            "global_tokens": round(self._global.tokens, 1) if self._global is not None else None,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "queued": len(self._waiters),
+            "max_queued": self.max_queued,
+            "avg_llm_request_seconds": round(self._avg_duration, 3) if self._avg_duration is not None else None,
+            "admitted": self.admitted,
+            "rate_limited": self.rate_limited,
+            "global_limited": self.global_limited,
+            "queue_full": self.queue_full,
+            "queue_timeouts": self.queue_timeouts,
+            "shed_new_interviews": self.shed
+        }
+
+
+def retry_after_seconds(seconds: float) -> int:
+    """Retry-After value (whole seconds, at least 1) for an estimated wait."""
+    return max(1, math.ceil(seconds))
+
+
+def client_key(scope: Dict[str, Any]) -> str:
+    """
+    Identify the client of a request (X-Forwarded-For only if trusted).
+    
+    Each proxy appends the address it received the request from, so the
+    entries a client could forge are on the left. The client is the entry
+    TRUSTED_PROXY_HOPS from the right: the one the outermost trusted proxy
+    added.
+    """
+    if APIConfig.TRUST_FORWARDED_FOR:
+        entries = []
+        for name, value in scope.get("headers", []):
+            if name == b"x-forwarded-for":
+                entries += [e.strip() for e in value.decode("latin-1").split(",") if e.strip()]
+        if entries:
+            return entries[-min(max(1, APIConfig.TRUSTED_PROXY_HOPS), len(entries))]
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class AdmissionMiddleware:
+    """ASGI middleware applying an AdmissionController to HTTP requests."""
+    
+    def __init__(self, app, controller: Optional[AdmissionController] = None):
+        self.app = app
+        self.controller = controller or get_admission_controller()
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not APIConfig.RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        
+        controller = self.controller
+        path = scope.get("path", "")
+        kind = controller.classify(path)
+        if kind == EXEMPT:
+            await self.app(scope, receive, send)
+            return
+        
+        rejection = controller.check_rate(client_key(scope), kind)
+        if rejection is None and path in NEW_INTERVIEW_PATHS:
+            rejection = controller.check_new_interview()
+        if rejection is None and kind == LLM_BOUND:
+            rejection = await controller.acquire_slot()
+        if rejection is not None:
+            await _reject(send, *rejection)
+            return
+        
+        if kind != LLM_BOUND:
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release_slot(time.monotonic() - started)
+
+
+async def _reject(send, status: int, detail: str, retry_after: float):
+    """Send an error response shaped like FastAPI's, with Retry-After."""
+    body = json.dumps({"detail": detail}).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"retry-after", str(retry_after_seconds(retry_after)).encode("latin-1")),
+        ]
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+# Global controller instance
+_controller_instance = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get global admission controller instance."""
+    global _controller_instance
+    
+    if _controller_instance is None:
+        _controller_instance = AdmissionController()
+    
+    return _controller_instance
@@ -0,0 +1,255 @@
+"""
+Persistent cache of answer evaluations.
+
+Restarted interviews, retakes and practice users often submit the same
+answer to the same (banked) question. The evaluation of an answer depends
+only on the question text, type and level, the job title and the answer, so
+a stored evaluation is reused for an identical submission instead of paying
+for another LLM call. Keys are hashes of those fields after case and
+whitespace normalization; punctuation is kept, since it can change the
+meaning of a technical answer. The model and a hash of the evaluation
+prompts are part of the key, so changing either stops reusing old entries.
+
+Stored in SQLite (WAL mode) next to the interview data. Entries expire after
+EvaluationConfig.CACHE_TTL and the least recently used are dropped beyond
+CACHE_MAX_ENTRIES; fallback evaluations (LLM unavailable) are never cached.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+try:
+    from utils.config import EvaluationConfig, OllamaConfig, StorageConfig
+    from agents.evaluator_agent import EVALUATION_PROMPT_TEMPLATE, EVALUATION_SYSTEM_PROMPT
+except ImportError:
+    # Fallback for direct execution
+    import sys
+    sys.path.append(str(Path(__file__).parent.parent))
+    from utils.config import EvaluationConfig, OllamaConfig, StorageConfig
+    from agents.evaluator_agent import EVALUATION_PROMPT_TEMPLATE, EVALUATION_SYSTEM_PROMPT
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluation_cache (
+    key        TEXT PRIMARY KEY,
+    evaluation TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used  REAL NOT NULL,
+    hits       INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_evaluation_cache_last_used ON evaluation_cache(last_used);
+"""
+
+PROMPT_HASH = hashlib.sha1(
+    (EVALUATION_SYSTEM_PROMPT + "\0" + EVALUATION_PROMPT_TEMPLATE).encode("utf-8")
+).hexdigest()[:16]
+
+
+def _normalize(text: Any) -> str:
+    """Lowercase and collapse whitespace; trailing sentence punctuation is ignored."""
+    return " ".join(str(text or "").lower().split()).rstrip(".!? ")
+
+
+def evaluation_key(question_text: str,
+                   question_type: str,
+                   question_level: int,
+                   answer_text: str,
+                   job_title: str,
+                   **_) -> str:
+    """
+    Cache key for an evaluation request.
+    
+    Takes evaluate_answer's arguments; others (topics) are ignored. The
+    model and PROMPT_HASH are included, so entries from another model or
+    prompt version miss.
+    """
+    normalized = [
+        OllamaConfig.OLLAMA_MODEL,
+        PROMPT_HASH,
+        _normalize(question_text),
+        _normalize(question_type),
+        int(question_level),
+        _normalize(job_title),
+        _normalize(answer_text),
+    ]
+    payload = json.dumps(normalized, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class EvaluationCache:
+    """SQLite-backed evaluation cache with TTL and LRU size bound."""
+    
+    def __init__(self,
+                 db_path: Optional[Path] = None,
+                 ttl: Optional[float] = None,
+                 max_entries: Optional[int] = None):
+        """
+        Initialize cache and create the schema if needed.
+        
+        Args:
+            db_path: SQLite database file (defaults to EvaluationConfig.CACHE_PATH)
+            ttl: Seconds an evaluation is reused (default: EvaluationConfig.CACHE_TTL)
+            max_entries: Entries kept (default: EvaluationConfig.CACHE_MAX_ENTRIES)
+        """
+        self.db_path = Path(db_path or EvaluationConfig.CACHE_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl or EvaluationConfig.CACHE_TTL
+        self.max_entries = max_entries or EvaluationConfig.CACHE_MAX_ENTRIES
+        self._local = threading.local()
+        
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.stores = 0
+        self.fallbacks_skipped = 0
+        self.expired = 0
+        self.evicted = 0
+        
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+        self.prune()
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=StorageConfig.SQLITE_BUSY_TIMEOUT_MS / 1000,
+                isolation_level=None,  # autocommit; every statement stands alone
+                check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def get(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Look up the stored evaluation for a request.
+        
+        Args:
+            request: evaluate_answer arguments
+            
+        Returns:
+            Evaluation dictionary as returned by evaluate_answer, or None on a miss
+        """
+        try:
+            key = evaluation_key(**request)
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT evaluation, created_at FROM evaluation_cache WHERE key = ?", (key,)
+            ).fetchone()
+            now = time.time()
+            
+            if row is not None and now - row[1] > self.ttl:
+                conn.execute("DELETE FROM evaluation_cache WHERE key = ?", (key,))
+                self.expired += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            
+            conn.execute("UPDATE evaluation_cache SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key))
+            self.hits += 1
+            return json.loads(row[0])
+        
+        except Exception as e:
+            print(f"Error reading evaluation cache: {e}")
+            self.misses += 1
+            return None
+    
+    def put(self, request: Dict[str, Any], evaluation: Dict[str, Any]) -> bool:
+        """
+        Store an evaluation unless it is a fallback or was pre-scored locally.
+        
+        Args:
+            request: evaluate_answer arguments the evaluation was made with
+            evaluation: Evaluation dictionary as returned by evaluate_answer
+            
+        Returns:
+            True if the evaluation was stored
+        """
+        if evaluation.get("is_fallback"):
+            self.fallbacks_skipped += 1
+            return False
+        if evaluation.get("prescored"):
+            # Scored locally without the LLM; nothing to save by caching it
+            return False
+        
+        try:
+            now = time.time()
+            self._connection().execute(
+                """INSERT OR REPLACE INTO evaluation_cache (key, evaluation, created_at, last_used)
+                   VALUES (?, ?, ?, ?)""",
+                (evaluation_key(**request), json.dumps(evaluation), now, now)
+            )
+            self.stores += 1
+            if self.stores % EvaluationConfig.CACHE_PRUNE_EVERY == 0:
+                self.prune()
+            return True
+        
+        except Exception as e:
+            print(f"Error writing evaluation cache: {e}")
+            return False
+    
+    def prune(self):
+        """Drop expired entries and the least recently used beyond max_entries."""
+        try:
+            conn = self._connection()
+            self.expired += conn.execute(
+                "DELETE FROM evaluation_cache WHERE created_at < ?", (time.time() - self.ttl,)
+            ).rowcount
+            excess = conn.execute("SELECT COUNT(*) FROM evaluation_cache").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self.evicted += conn.execute(
+                    """DELETE FROM evaluation_cache WHERE key IN
+                       (SELECT key FROM evaluation_cache ORDER BY last_used ASC LIMIT ?)""",
+                    (excess,)
+                ).rowcount
+        except Exception as e:
+            print(f"Error pruning evaluation cache: {e}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size and hit counters."""
+        try:
+            entries = self._connection().execute("SELECT COUNT(*) FROM evaluation_cache").fetchone()[0]
+        except Exception as e:
+            print(f"Error reading evaluation cache stats: {e}")
+            entries = None
+        
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "bypassed": self.bypassed,
+            "stores": self.stores,
+            "fallbacks_skipped": self.fallbacks_skipped,
+            "expired": self.expired,
+            "evicted": self.evicted
+        }
+
+
+# Global cache instance
+_cache_instance = None
+_cache_lock = threading.Lock()
+
+
+def get_evaluation_cache() -> EvaluationCache:
+    """Get global evaluation cache instance."""
+    global _cache_instance
+    
+    with _cache_lock:
+        if _cache_instance is None:
+            _cache_instance = EvaluationCache()
+    
+    return _cache_instance
@@ -0,0 +1,235 @@
+"""
+Deferred answer evaluation.
+
+In async evaluation mode /submit_answer stores the answer and returns at
+once; the evaluation is queued here and run by a pool of worker tasks on the
+serving event loop. Each job keeps its result for polling and forwards model
+output to any subscribers while it runs. Jobs of the same interview are
+recorded in submission order (each waits for its predecessor), since every
+evaluation updates the interview's recent scores and level.
+
+Jobs live in memory only; answers whose evaluation was lost (e.g. on a
+restart) are recognized from the session and queued again. Failed jobs are
+not: the run function retries them and records the final failure.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Any, List, Optional
+
+
+class EvaluationPending(Exception):
+    """An earlier answer of the interview is still being evaluated."""
+    
+    def __init__(self, interview_id: str, q_id: int):
+        super().__init__(f"The answer to question {q_id} is still being evaluated; retry when it is done")
+        self.interview_id = interview_id
+        self.q_id = q_id
+
+
+class EvaluationJob:
+    """One queued evaluation and its outcome."""
+    
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    
+    def __init__(self,
+                 interview_id: str,
+                 q_id: int,
+                 question_id: str,
+                 request: Dict[str, Any],
+                 bypass_cache: bool = False,
+                 previous: Optional["EvaluationJob"] = None):
+        self.interview_id = interview_id
+        self.q_id = q_id
+        self.question_id = question_id
+        self.request = request
+        self.bypass_cache = bypass_cache
+        self.previous = previous
+        
+        self.status = self.PENDING
+        self.attempts = 0
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.created_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self._done = asyncio.Event()
+        self._listeners: List[Callable[[str], None]] = []
+    
+    @property
+    def finished(self) -> bool:
+        return self._done.is_set()
+    
+    def emit(self, content: str):
+        """Forward a piece of model output to the subscribers."""
+        for listener in list(self._listeners):
+            listener(content)
+    
+    def subscribe(self, listener: Callable[[str], None]):
+        self._listeners.append(listener)
+    
+    def unsubscribe(self, listener: Callable[[str], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the job to finish; False on timeout."""
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    def finish(self, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        self.status = self.FAILED if error else self.DONE
+        self.result = result
+        self.error = error
+        self.finished_at = time.monotonic()
+        self.previous = None
+        self._done.set()
+
+
+class EvaluationQueue:
+    """Worker pool running EvaluationJobs on the serving event loop."""
+    
+    def __init__(self,
+                 run: Callable[[EvaluationJob], Awaitable[Optional[Dict[str, Any]]]],
+                 workers: int = 4,
+                 keep_finished: int = 1024):
+        """
+        Initialize queue settings; workers start with the first job.
+        
+        Args:
+            run: Coroutine function that evaluates a job and returns its result
+            workers: Evaluations run at once
+            keep_finished: Finished jobs kept for polling (oldest dropped first)
+        """
+        self.run = run
+        self.workers = max(1, workers)
+        self.keep_finished = keep_finished
+        
+        self._loop = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._jobs: "OrderedDict[tuple, EvaluationJob]" = OrderedDict()
+        self._latest: Dict[str, EvaluationJob] = {}
+        
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_wait = 0.0
+    
+    def _bind(self) -> asyncio.Queue:
+        """Return the job queue for the running loop, starting the workers on first use."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Jobs of a previous loop cannot be awaited here; forget them
+            self._jobs.clear()
+            self._latest.clear()
+            self._queue = asyncio.Queue()
+            self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+            self._loop = loop
+        return self._queue
+    
+    def submit(self,
+               interview_id: str,
+               q_id: int,
+               question_id: str,
+               request: Dict[str, Any],
+               bypass_cache: bool = False) -> EvaluationJob:
+        """
+        Queue the evaluation of an answer.
+        
+        Args:
+            interview_id: Interview session identifier
+            q_id: Question number within the interview
+            question_id: Unique question id (guards against a restarted interview reusing q_id)
+            request: evaluate_answer arguments
+            bypass_cache: Evaluate with the LLM even if a cached evaluation exists
+            
+        Returns:
+            The queued job (an existing unfinished job for the same question is returned as is)
+        """
+        queue = self._bind()
+        existing = self._jobs.get((interview_id, q_id))
+        if existing is not None and existing.question_id == question_id and not existing.finished:
+            return existing
+        
+        previous = self._latest.get(interview_id)
+        job = EvaluationJob(interview_id, q_id, question_id, request, bypass_cache,
+                            previous if previous is not None and not previous.finished else None)
+        self._jobs[(interview_id, q_id)] = job
+        self._jobs.move_to_end((interview_id, q_id))
+        self._latest[interview_id] = job
+        self.submitted += 1
+        queue.put_nowait(job)
+        self._trim()
+        return job
+    
+    def get(self, interview_id: str, q_id: int) -> Optional[EvaluationJob]:
+        """Job for a question, if it is queued, running or recently finished."""
+        if self._loop is not None and self._loop is not asyncio.get_running_loop():
+            return None
+        return self._jobs.get((interview_id, q_id))
+    
+    def pending(self, interview_id: str) -> List[EvaluationJob]:
+        """Unfinished jobs of an interview, oldest first."""
+        if self._loop is not None and self._loop is not asyncio.get_running_loop():
+            return []
+        return [job for (iid, _), job in self._jobs.items() if iid == interview_id and not job.finished]
+    
+    def discard(self, interview_id: str):
+        """Forget an interview's jobs; running ones finish but are no longer tracked."""
+        for key in [key for key in self._jobs if key[0] == interview_id]:
+            del self._jobs[key]
+        self._latest.pop(interview_id, None)
+    
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                job.status = EvaluationJob.RUNNING
+                result = await self.run(job)
+                job.finish(result=result)
+                self.completed += 1
+                self.total_wait += job.finished_at - job.created_at
+            except asyncio.CancelledError:
+                job.finish(error="Evaluation cancelled")
+                raise
+            except Exception as e:
+                print(f"Error in deferred evaluation for {job.interview_id}: {e}")
+                job.finish(error=str(e))
+                self.failed += 1
+            finally:
+                self._queue.task_done()
+    
+    def _trim(self):
+        finished = [key for key, job in self._jobs.items() if job.finished]
+        for key in finished[:max(0, len(self._jobs) - self.keep_finished)]:
+            job = self._jobs.pop(key)
+            if self._latest.get(job.interview_id) is job:
+                del self._latest[job.interview_id]
+    
+    async def close(self):
+        """Cancel the workers (call on shutdown, from the serving loop)."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        if tasks and self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth and job counters."""
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "pending": sum(1 for job in self._jobs.values() if not job.finished),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_seconds_to_result": round(self.total_wait / self.completed, 3) if self.completed else None
+        }
@@ -5,17 +5,27 @@ This module orchestrates the interview workflow, managing sessions and coordinat
 between the interviewer agent (question generation) and evaluator agent (answer evaluation).
 """
 
-from typing import Dict, List, Any, Optional
+import asyncio
+import random
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional
 from datetime import datetime
 
 try:
     from models.interview import InterviewSession, InterviewSettings
     from agents.interviewer_agent import InterviewerAgent
     from agents.evaluator_agent import EvaluatorAgent
-    from services.storage import InterviewStorage, get_storage
-    from utils.config import InterviewConfig
-    from utils.scoring import update_level
-    from utils.id_utils import generate_interview_id
+    from services.storage import get_storage
+    from services.storage_backend import StorageBackend
+    from services.session_cache import SessionCache
+    from services.locking import SessionLocks
+    from services.question_prefetcher import QuestionPrefetcher
+    from services.question_bank import get_question_bank
+    from services.evaluation_cache import get_evaluation_cache
+    from services.evaluation_queue import EvaluationQueue, EvaluationJob, EvaluationPending
+    from agents.llm_gateway import get_gateway
+    from utils.config import InterviewConfig, StorageConfig, QuestionConfig, EvaluationConfig, RouterConfig
+    from utils.scoring import update_level, reachable_levels
+    from utils.id_utils import generate_interview_id, generate_short_id
 except ImportError:
     # Fallback for direct execution
     import sys
@@ -24,10 +34,18 @@ except ImportError:
     from models.interview import InterviewSession, InterviewSettings
     from agents.interviewer_agent import InterviewerAgent
     from agents.evaluator_agent import EvaluatorAgent
-    from services.storage import InterviewStorage, get_storage
-    from utils.config import InterviewConfig
-    from utils.scoring import update_level
-    from utils.id_utils import generate_interview_id
+    from services.storage import get_storage
+    from services.storage_backend import StorageBackend
+    from services.session_cache import SessionCache
+    from services.locking import SessionLocks
+    from services.question_prefetcher import QuestionPrefetcher
+    from services.question_bank import get_question_bank
+    from services.evaluation_cache import get_evaluation_cache
+    from services.evaluation_queue import EvaluationQueue, EvaluationJob, EvaluationPending
+    from agents.llm_gateway import get_gateway
+    from utils.config import InterviewConfig, StorageConfig, QuestionConfig, EvaluationConfig, RouterConfig
+    from utils.scoring import update_level, reachable_levels
+    from utils.id_utils import generate_interview_id, generate_short_id
 
 
 class InterviewManager:
@@ -40,14 +58,134 @@ class InterviewManager:
     - Answer evaluation through evaluator agent
     - Adaptive difficulty adjustment
     - Progress tracking and summarization
+    
+    Sessions are read and written through a SessionCache; a per-session
+    lock serializes concurrent requests for the same interview.
     """
     
-    def __init__(self, storage: Optional[InterviewStorage] = None):
+    def __init__(self, storage: Optional[StorageBackend] = None, cache: Optional[SessionCache] = None):
         """Initialize interview manager."""
         self.storage = storage or get_storage()
+        self.sessions = cache or SessionCache(
+            self.storage,
+            max_sessions=StorageConfig.SESSION_CACHE_SIZE,
+            durability=StorageConfig.SESSION_DURABILITY,
+            flush_interval=StorageConfig.SESSION_FLUSH_INTERVAL,
+            revalidate=StorageConfig.SESSION_REVALIDATE
+        )
+        # Held across LLM calls, so never the storage's own lock files (they must not block writes).
+        # One lock per interview for the sync and async paths alike; with several workers sharing
+        # the storage also locks/sessions/<interview_id>.lock.
+        self._session_locks = SessionLocks(
+            InterviewConfig.INTERVIEWS_DIR / "locks" / "sessions" if StorageConfig.SESSION_FILE_LOCKS else None,
+            timeout=300.0
+        )
         self.interviewer = InterviewerAgent()
         self.evaluator = EvaluatorAgent()
-
+        self.question_bank = get_question_bank() if QuestionConfig.BANK_ENABLED else None
+        self.evaluation_cache = get_evaluation_cache() if EvaluationConfig.CACHE_ENABLED else None
+        self.prefetcher = QuestionPrefetcher(
+            self._aproduce_question,
+            max_sessions=QuestionConfig.PREFETCH_MAX_SESSIONS,
+            ttl=QuestionConfig.PREFETCH_TTL,
+            is_busy=lambda: get_gateway().waiting > 0
+        )
+        self.evaluation_queue = EvaluationQueue(self._run_deferred_evaluation, workers=EvaluationConfig.ASYNC_WORKERS)
+    
+    def load_session(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a session through the cache.
+        
+        Args:
+            interview_id: Interview session identifier
+            
+        Returns:
+            Private copy of the interview data, or None if not found
+        """
+        return self.sessions.get(interview_id)
+    
+    def save_session(self, data: Dict[str, Any], flush: bool = False) -> bool:
+        """
+        Save a session through the cache.
+        
+        Args:
+            data: Interview data (not to be modified afterwards)
+            flush: Persist before returning, whatever the durability mode
+            
+        Returns:
+            False if a synchronous save failed
+        """
+        return self.sessions.put(data, flush=flush)
+    
+    async def acreate_session(self, settings_payload: Dict[str, Any]) -> Dict[str, Any]:
+        """create_session from a worker thread (it saves the new session at once)."""
+        return await asyncio.to_thread(self.create_session, settings_payload)
+    
+    async def aload_session(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        """load_session from a worker thread, so storage reads and lock waits do not block the event loop."""
+        return await asyncio.to_thread(self.load_session, interview_id)
+    
+    async def asave_session(self, data: Dict[str, Any], flush: bool = False) -> bool:
+        """save_session from a worker thread (see aload_session)."""
+        return await asyncio.to_thread(self.save_session, data, flush)
+    
+    async def aflush_session(self, interview_id: str) -> bool:
+        """flush_session from a worker thread (see aload_session)."""
+        return await asyncio.to_thread(self.flush_session, interview_id)
+    
+    def session_lock(self, interview_id: str):
+        """Context manager serializing changes to one session (from a worker thread)."""
+        return self._session_locks.lock(interview_id)
+    
+    def async_session_lock(self, interview_id: str):
+        """
+        Async context manager serializing changes to one session (from the event loop).
+        
+        Same lock as session_lock, so the sync and async paths exclude each
+        other, but waiting for it does not block the loop. With session file
+        locks (multi-worker mode) the cross-process lock is taken too; the
+        router keeps an interview on one worker, so it is uncontended unless a
+        failover moved the interview while a request was in flight.
+        """
+        return self._session_locks.alock(interview_id)
+    
+    def flush_session(self, interview_id: str) -> bool:
+        """Persist any unsaved changes of a session now."""
+        return self.sessions.flush(interview_id)
+    
+    def pin_session(self, interview_id: str):
+        """Keep a session in memory while a connection works on it; it is then saved by flush_session."""
+        self.sessions.pin(interview_id)
+    
+    def unpin_session(self, interview_id: str) -> bool:
+        """Release a pinned session, persisting its unsaved changes."""
+        return self.sessions.unpin(interview_id)
+    
+    async def aevict_session(self, interview_id: str):
+        """Forget a cached session, e.g. before it is deleted or replaced in storage."""
+        self.prefetcher.discard(interview_id)
+        self.evaluation_queue.discard(interview_id)
+        # Waits for a save in progress, so off the event loop
+        await asyncio.to_thread(self.sessions.evict, interview_id)
+    
+    async def adelete_session(self, interview_id: str) -> bool:
+        """Delete a session from the cache and storage, with its session lock file."""
+        # Under the session lock, so a turn in progress cannot save the session back afterwards
+        async with self.async_session_lock(interview_id):
+            await self.aevict_session(interview_id)
+            deleted = await asyncio.to_thread(self.storage.delete_interview, interview_id)
+            if deleted:
+                self._session_locks.remove(interview_id)
+        return deleted
+    
+    def cleanup_session_locks(self) -> int:
+        """Remove the session lock files of interviews that no longer exist; returns how many."""
+        return self._session_locks.prune(self.storage.exists)
+    
+    def close(self):
+        """Flush all cached sessions (call on shutdown)."""
+        self.sessions.close()
+    
     def create_session(self, settings_payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create a new interview session.
@@ -59,7 +197,7 @@ class InterviewManager:
             Dictionary with interview_id and initial state
         """
         settings = InterviewSettings(**settings_payload)
-
+        
         # Create InterviewState object instead of dictionary
         from models.interview import InterviewState
         state = InterviewState(
@@ -67,25 +205,28 @@ class InterviewManager:
             asked_count=0,
             recent_scores=[]
         )
-
+        
         session = InterviewSession(
-            interview_id=generate_interview_id(),
+            interview_id=generate_interview_id(
+                RouterConfig.WORKER_INDEX if StorageConfig.MULTI_WORKER and RouterConfig.WORKER_INDEX >= 0 else None,
+                RouterConfig.WORKERS
+            ),
             settings=settings,
             questions=[],
             state=state,
             summary=None,
         )
-
-        ok = self.storage.save_interview(session.dict())
+        
+        ok = self.save_session(session.dict(), flush=True)
         if not ok:
             raise RuntimeError("Failed to persist interview session")
-
+        
         return {
             "interview_id": session.interview_id, 
             "current_level": session.state.current_level,  # Use dot notation for Pydantic model
             "settings": session.settings  # Return the actual InterviewSettings object
         }
-
+    
     def get_next_question(self, interview_id: str) -> Optional[Dict[str, Any]]:
         """
         Get the next question for an interview session.
@@ -96,13 +237,92 @@ class InterviewManager:
         Returns:
             Question data or None if interview is complete/invalid
         """
-        data = self.storage.load_interview(interview_id)
+        with self.session_lock(interview_id):
+            data = self.load_session(interview_id)
+            request = self._question_request(data)
+            if request is None:
+                return None
+            
+            q = self._draw_banked(request)
+            if q is None:
+                q = self.interviewer.generate_question(**request)
+                self._bank(request, q)
+            return self._record_question(interview_id, data, q)
+    
+    async def aget_next_question(self,
+                                 interview_id: str,
+                                 on_token: Optional[Callable[[str], None]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of get_next_question used by the API.
+        
+        The LLM call is awaited through the shared gateway, so the event loop
+        keeps serving other interviews meanwhile. A question prefetched while
+        the previous answer was evaluated is served instead when available.
+        If answers are still being evaluated in the background, waits for
+        them only when their scores could change the next question's level.
+        
+        Args:
+            interview_id: Interview session identifier
+            on_token: Receives raw model output as it streams in (not called
+                when the question comes from a prefetch or the bank)
+        """
+        await self._await_level_evaluations(interview_id)
+        
+        async with self.async_session_lock(interview_id):
+            data = await self.aload_session(interview_id)
+            if not data:
+                return None
+            
+            asked_count = data["state"]["asked_count"]
+            request = self._question_request(data, self.prefetcher.question_type(interview_id, asked_count))
+            if request is None:
+                self.prefetcher.discard(interview_id)
+                return None
+            
+            q = None
+            if asked_count > 0:
+                q = await self.prefetcher.take(interview_id, asked_count, request["level"])
+            if q is None:
+                q = await self._aproduce_question(on_token=on_token, **request)
+            return await asyncio.to_thread(self._record_question, interview_id, data, q)
+    
+    async def _aproduce_question(self, on_token: Optional[Callable[[str], None]] = None, **request) -> Dict[str, Any]:
+        """
+        Serve a question from the bank if possible, else generate (and bank) one.
+        
+        Bank reads and writes run in a worker thread: the bank is SQLite,
+        shared by all workers, and a write may wait out another's transaction.
+        """
+        q = await asyncio.to_thread(self._draw_banked, request)
+        if q is None:
+            q = await self.interviewer.agenerate_question(on_token=on_token, **request)
+            await asyncio.to_thread(self._bank, request, q)
+        return q
+    
+    def _draw_banked(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Draw an unseen banked question for the request, or None to generate one."""
+        if self.question_bank is None or random.random() < QuestionConfig.BANK_EXPLORE_RATE:
+            return None
+        return self.question_bank.draw(**request)
+    
+    def _bank(self, request: Dict[str, Any], q: Dict[str, Any]):
+        """Keep a freshly generated question for later sessions (fallbacks are skipped)."""
+        if self.question_bank is not None:
+            self.question_bank.add(request, q)
+    
+    def _question_request(self, data: Optional[Dict[str, Any]], question_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Arguments for generate_question, or None if no question is due.
+        
+        question_type overrides the soft_pct choice (used to keep a prefetched
+        question's type when the ratio left the choice to chance).
+        """
         if not data:
             return None
-
+        
         if data.get("summary"):
             return None
-
+        
         settings = data["settings"]
         state = data["state"]
         
@@ -110,10 +330,10 @@ class InterviewManager:
         current_level = state.get("current_level", settings.get("initial_level", 1))
         print(f"🔧 Debug - Current level for question generation: {current_level}")
         print(f"🔧 Debug - Question count: {state['asked_count']}/{settings['num_questions']}")
-
+        
         if state["asked_count"] >= settings["num_questions"]:
             return None
-
+        
         # Determine question type based on soft_pct
         previous_question_texts = [q.get("text", "") for q in data.get("questions", [])]
         soft_count = sum(1 for q in data.get("questions", []) if q.get("type") == "soft")
@@ -121,24 +341,27 @@ class InterviewManager:
         current_soft_ratio = soft_count / total_count if total_count > 0 else 0
         target_soft_pct = settings.get("soft_pct", 0.3)
         
-        if current_soft_ratio < target_soft_pct:
+        if question_type is not None:
+            pass
+        elif current_soft_ratio < target_soft_pct:
             question_type = "soft"
         elif current_soft_ratio > target_soft_pct:
             question_type = "technical"
         else:
-            import random
             question_type = "soft" if random.random() < target_soft_pct else "technical"
-
-        q = self.interviewer.generate_question(
-            job_title=settings["job_title"],
-            level=current_level,  # Use the debugged current_level
-            keywords=settings.get("keywords", []),
-            question_type=question_type,
-            language=settings.get("language", "en"),
-            previous_questions=previous_question_texts,
-        )
-
-        q_id = state["asked_count"] + 1
+        
+        return {
+            "job_title": settings["job_title"],
+            "level": current_level,  # Use the debugged current_level
+            "keywords": settings.get("keywords", []),
+            "question_type": question_type,
+            "language": settings.get("language", "en"),
+            "previous_questions": previous_question_texts,
+        }
+    
+    def _record_question(self, interview_id: str, data: Dict[str, Any], q: Dict[str, Any]) -> Dict[str, Any]:
+        """Append a generated question to the session, save it and build the response."""
+        q_id = data["state"]["asked_count"] + 1
         question_record = {
             "q_id": q_id,
             "question_id": q["question_id"],
@@ -151,11 +374,14 @@ class InterviewManager:
             "candidate_answer": None,
             "evaluation": None,
         }
-
+        
         data.setdefault("questions", []).append(question_record)
         data["state"]["asked_count"] = q_id
-        self.storage.save_interview(data)
-
+        self.save_session(data)
+        
+        if q.get("bank_id") and self.question_bank is not None:
+            self.question_bank.mark_served(q["bank_id"])
+        
         return {
             "q_id": q_id,
             "text": q["question_text"],
@@ -166,45 +392,408 @@ class InterviewManager:
             "context": q.get("context", ""),
             "interview_id": interview_id
         }
-
-    def submit_answer(self, interview_id: str, answer: str) -> Optional[Dict[str, Any]]:
+    
+    def submit_answer(self, interview_id: str, answer: str, bypass_cache: bool = False) -> Optional[Dict[str, Any]]:
         """
         Submit and evaluate a candidate's answer.
         
         Args:
             interview_id: Interview session identifier
             answer: Candidate's response text
+            bypass_cache: Evaluate with the LLM even if a cached evaluation exists
             
         Returns:
             Evaluation results or None if invalid
         """
-        data = self.storage.load_interview(interview_id)
+        with self.session_lock(interview_id):
+            data = self.load_session(interview_id)
+            last_q = self._answer_target(data, answer)
+            if last_q is None:
+                return None
+            
+            request = self._evaluation_request(data, last_q)
+            eval_result = self._cached_evaluation(request, bypass_cache)
+            if eval_result is None:
+                eval_result = self.evaluator.evaluate_answer(**request)
+                self._cache_evaluation(request, eval_result)
+            return self._record_evaluation(interview_id, data, last_q, eval_result)
+    
+    async def asubmit_answer(self,
+                             interview_id: str,
+                             answer: str,
+                             on_token: Optional[Callable[[str], None]] = None,
+                             bypass_cache: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of submit_answer used by the API.
+        
+        The LLM call is awaited through the shared gateway, so the event loop
+        keeps serving other interviews meanwhile. Candidate next questions are
+        prefetched while the evaluation runs.
+        
+        Args:
+            interview_id: Interview session identifier
+            answer: Candidate's response text
+            on_token: Receives raw evaluation output as it streams in (nothing on a cache hit)
+            bypass_cache: Evaluate with the LLM even if a cached evaluation exists
+            
+        Raises:
+            EvaluationPending: An earlier deferred evaluation did not finish
+                within ASYNC_WAIT_TIMEOUT
+        """
+        # Evaluations are recorded in answer order
+        for job in self._pending_evaluations(interview_id, await self.aload_session(interview_id)):
+            if not await job.wait(EvaluationConfig.ASYNC_WAIT_TIMEOUT):
+                raise EvaluationPending(interview_id, job.q_id)
+        
+        async with self.async_session_lock(interview_id):
+            data = await self.aload_session(interview_id)
+            last_q = self._answer_target(data, answer)
+            if last_q is None:
+                return None
+            
+            if QuestionConfig.PREFETCH_ENABLED:
+                self._start_prefetch(interview_id, data)
+            
+            request = self._evaluation_request(data, last_q)
+            eval_result = await self._acached_evaluation(request, bypass_cache)
+            if eval_result is None:
+                eval_result = await self.evaluator.aevaluate_answer(on_token=on_token, **request)
+                await self._acache_evaluation(request, eval_result)
+            result = await asyncio.to_thread(self._record_evaluation, interview_id, data, last_q, eval_result)
+            
+            self.prefetcher.settle(interview_id, None if result["is_complete"] else result["new_level"])
+            return result
+    
+    async def asubmit_answer_deferred(self,
+                                      interview_id: str,
+                                      answer: str,
+                                      bypass_cache: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Store an answer and queue its evaluation (async evaluation mode).
+        
+        The answer is saved before returning; the evaluation, level update
+        and summary follow when a background worker finishes it. Poll it with
+        get_evaluation or follow it with await_evaluation.
+        
+        Args:
+            interview_id: Interview session identifier
+            answer: Candidate's response text
+            bypass_cache: Evaluate with the LLM even if a cached evaluation exists
+            
+        Returns:
+            interview_id, q_id and status of the queued evaluation, or None if invalid
+        """
+        async with self.async_session_lock(interview_id):
+            data = await self.aload_session(interview_id)
+            last_q = self._answer_target(data, answer)
+            if last_q is None:
+                return None
+            
+            last_q["evaluation_status"] = EvaluationJob.PENDING
+            # The answer must survive a crash until it is evaluated
+            await self.asave_session(data, flush=True)
+            
+            if QuestionConfig.PREFETCH_ENABLED:
+                self._start_prefetch(interview_id, data)
+            job = self._queue_evaluation(interview_id, data, last_q, bypass_cache)
+        
+        return {"interview_id": interview_id, "q_id": job.q_id, "status": job.status}
+    
+    def _queue_evaluation(self,
+                          interview_id: str,
+                          data: Dict[str, Any],
+                          question: Dict[str, Any],
+                          bypass_cache: bool = False) -> EvaluationJob:
+        return self.evaluation_queue.submit(
+            interview_id, question["q_id"], question["question_id"],
+            self._evaluation_request(data, question), bypass_cache
+        )
+    
+    async def _run_deferred_evaluation(self, job: EvaluationJob) -> Dict[str, Any]:
+        """
+        Run a queued evaluation, retrying up to EvaluationConfig.ASYNC_MAX_ATTEMPTS times.
+        
+        After the last attempt the evaluator's fallback evaluation is recorded
+        so the interview can still complete; only if that cannot be recorded
+        either is the question marked failed in the session.
+        """
+        while True:
+            job.attempts += 1
+            try:
+                return await self._evaluate_deferred(job)
+            except LookupError:
+                raise
+            except Exception as e:
+                if job.attempts >= EvaluationConfig.ASYNC_MAX_ATTEMPTS:
+                    print(f"❌ Evaluation of {job.interview_id} q{job.q_id} failed ({e}); "
+                          f"recording a fallback evaluation")
+                    return await self._record_fallback_evaluation(job, str(e))
+                print(f"⚠️ Evaluation of {job.interview_id} q{job.q_id} failed ({e}); "
+                      f"retrying ({job.attempts}/{EvaluationConfig.ASYNC_MAX_ATTEMPTS})")
+                await asyncio.sleep(job.attempts)
+    
+    async def _evaluate_deferred(self, job: EvaluationJob) -> Dict[str, Any]:
+        """Evaluate a queued answer and record it once earlier answers of the interview are recorded."""
+        eval_result = await self._acached_evaluation(job.request, job.bypass_cache)
+        if eval_result is None:
+            eval_result = await self.evaluator.aevaluate_answer(on_token=job.emit, **job.request)
+            await self._acache_evaluation(job.request, eval_result)
+        return await self._record_deferred(job, eval_result)
+    
+    async def _record_deferred(self, job: EvaluationJob, eval_result: Dict[str, Any],
+                               error: Optional[str] = None) -> Dict[str, Any]:
+        """Record a queued answer's evaluation once earlier answers of the interview are recorded."""
+        if job.previous is not None:
+            await job.previous.wait()
+        
+        async with self.async_session_lock(job.interview_id):
+            data = await self.aload_session(job.interview_id)
+            question = self._find_question(data, job.q_id, job.question_id)
+            if question is None or question.get("evaluation"):
+                raise LookupError("Interview was restarted or deleted before the evaluation finished")
+            
+            question.pop("evaluation_status", None)
+            if error:
+                question["evaluation_error"] = error
+            result = await asyncio.to_thread(self._record_evaluation, job.interview_id, data, question, eval_result)
+        
+        self.prefetcher.settle(job.interview_id, None if result["is_complete"] else result["new_level"], asked_count=job.q_id)
+        return result
+    
+    async def _record_fallback_evaluation(self, job: EvaluationJob, error: str) -> Dict[str, Any]:
+        """Record the evaluator's fallback evaluation for an answer whose retries are exhausted."""
+        fallback = self.evaluator._generate_fallback_evaluation(
+            job.request["answer_text"], job.request["question_level"]
+        )
+        try:
+            return await self._record_deferred(job, fallback, error)
+        except LookupError:
+            raise
+        except Exception as e:
+            await self._mark_evaluation_failed(job, f"{error}; fallback not recorded: {e}")
+            raise
+    
+    async def _mark_evaluation_failed(self, job: EvaluationJob, error: str):
+        """Record in the session that a deferred evaluation gave up."""
+        async with self.async_session_lock(job.interview_id):
+            data = await self.aload_session(job.interview_id)
+            question = self._find_question(data, job.q_id, job.question_id)
+            if question is None or question.get("evaluation"):
+                return
+            question["evaluation_status"] = EvaluationJob.FAILED
+            question["evaluation_error"] = error
+            await self.asave_session(data, flush=True)
+    
+    def _pending_evaluations(self, interview_id: str, data: Optional[Dict[str, Any]]) -> List[EvaluationJob]:
+        """
+        Unfinished deferred evaluations of an interview, oldest first.
+        
+        Answers marked pending in the session without any job (lost on a
+        restart) are queued again; failed jobs are left as they are.
+        """
+        jobs = self.evaluation_queue.pending(interview_id)
         if not data:
+            return jobs
+        
+        for question in data.get("questions", []):
+            if question.get("evaluation_status") != EvaluationJob.PENDING or question.get("evaluation"):
+                continue
+            known = self.evaluation_queue.get(interview_id, question["q_id"])
+            if known is None or known.question_id != question["question_id"]:
+                jobs.append(self._queue_evaluation(interview_id, data, question))
+        return sorted(jobs, key=lambda job: job.q_id)
+    
+    async def _await_level_evaluations(self, interview_id: str):
+        """Wait for pending evaluations if the next question's level depends on them."""
+        data = await self.aload_session(interview_id)
+        jobs = self._pending_evaluations(interview_id, data)
+        if not jobs:
+            return
+        
+        if len(jobs) == 1:
+            state = data["state"]
+            levels = reachable_levels(state.get("current_level", InterviewConfig.DEFAULT_INITIAL_LEVEL),
+                                      state.get("recent_scores", []))
+            if len(levels) == 1:
+                # Whatever the score, the level stays; no need to wait
+                return
+        
+        if not await jobs[-1].wait(EvaluationConfig.ASYNC_WAIT_TIMEOUT):
+            print(f"⚠️ Evaluation for {interview_id} still pending; choosing the next question at the current level")
+    
+    async def aget_evaluation(self, interview_id: str, q_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Evaluation status of an answered question.
+        
+        Args:
+            interview_id: Interview session identifier
+            q_id: Question number
+            
+        Returns:
+            interview_id, q_id, status ("pending", "running", "done" or
+            "failed") and, once done, evaluation, new_level and is_complete;
+            None if the interview or an answer to the question does not exist
+        """
+        data = await self.aload_session(interview_id)
+        question = self._find_question(data, q_id)
+        if question is None or not question.get("candidate_answer"):
             return None
-
+        
+        status = {"interview_id": interview_id, "q_id": q_id}
+        if question.get("evaluation"):
+            return {
+                **status,
+                "status": EvaluationJob.DONE,
+                "evaluation": question["evaluation"],
+                "new_level": data["state"]["current_level"],
+                "is_complete": data.get("summary") is not None,
+                "error": question.get("evaluation_error")
+            }
+        if question.get("evaluation_status") == EvaluationJob.FAILED:
+            return {**status, "status": EvaluationJob.FAILED, "error": question.get("evaluation_error")}
+        
+        job = self.evaluation_queue.get(interview_id, q_id)
+        if job is None or (job.finished and not job.error):
+            job = next((j for j in self._pending_evaluations(interview_id, data) if j.q_id == q_id), None)
+        if job is None:
+            return None
+        return {**status, "status": job.status, "error": job.error}
+    
+    async def await_evaluation(self,
+                               interview_id: str,
+                               q_id: int,
+                               on_token: Optional[Callable[[str], None]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a deferred evaluation, forwarding its model output.
+        
+        Args:
+            interview_id: Interview session identifier
+            q_id: Question number
+            on_token: Receives raw evaluation output from now on
+            
+        Returns:
+            The aget_evaluation result once the evaluation is done or failed
+        """
+        status = await self.aget_evaluation(interview_id, q_id)
+        if status is None or status["status"] in (EvaluationJob.DONE, EvaluationJob.FAILED):
+            return status
+        
+        job = self.evaluation_queue.get(interview_id, q_id)
+        if on_token is not None:
+            job.subscribe(on_token)
+        try:
+            await job.wait()
+        finally:
+            if on_token is not None:
+                job.unsubscribe(on_token)
+        return await self.aget_evaluation(interview_id, q_id) or {
+            "interview_id": interview_id, "q_id": q_id, "status": job.status, "error": job.error
+        }
+    
+    def _find_question(self,
+                       data: Optional[Dict[str, Any]],
+                       q_id: int,
+                       question_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Question q_id of a session (and with that question_id, if given)."""
+        if not data:
+            return None
+        for question in data.get("questions", []):
+            if question.get("q_id") == q_id and (question_id is None or question.get("question_id") == question_id):
+                return question
+        return None
+    
+    def _start_prefetch(self, interview_id: str, data: Dict[str, Any]):
+        """Start generating the next question for every level the pending evaluation could lead to."""
+        state = data["state"]
+        if state["asked_count"] >= data["settings"]["num_questions"]:
+            return
+        
+        request = self._question_request(data)
+        if request is None:
+            return
+        
+        levels = reachable_levels(request["level"], state.get("recent_scores", []))
+        self.prefetcher.start(interview_id, request, levels, state["asked_count"])
+    
+    def _answer_target(self, data: Optional[Dict[str, Any]], answer: str) -> Optional[Dict[str, Any]]:
+        """Record the answer on the open question and return it (None if the session is missing or complete)."""
+        if not data:
+            return None
+        
         if data.get("summary"):
             return None
-
+        
         questions = data.setdefault("questions", [])
         if not questions:
             raise RuntimeError("No active question to answer")
-
+        
         last_q = questions[-1]
         if last_q.get("candidate_answer"):
             raise RuntimeError("Question already answered")
-
+        
         last_q["candidate_answer"] = answer
-
-        eval_result = self.evaluator.evaluate_answer(
-            question_text=last_q["text"],
-            question_type=last_q["type"],
-            question_level=last_q["level"],
-            answer_text=answer,
-            job_title=data["settings"]["job_title"],
-            topics=last_q.get("topics", [])
-        )
-
-        last_q["evaluation"] = {
+        return last_q
+    
+    def _evaluation_request(self, data: Dict[str, Any], last_q: Dict[str, Any]) -> Dict[str, Any]:
+        """Arguments for evaluate_answer."""
+        return {
+            "question_text": last_q["text"],
+            "question_type": last_q["type"],
+            "question_level": last_q["level"],
+            "answer_text": last_q["candidate_answer"],
+            "job_title": data["settings"]["job_title"],
+            "topics": last_q.get("topics", [])
+        }
+    
+    def _cached_evaluation(self, request: Dict[str, Any], bypass_cache: bool) -> Optional[Dict[str, Any]]:
+        """Stored evaluation for the request, or None to evaluate it."""
+        if self.evaluation_cache is None:
+            return None
+        if bypass_cache:
+            self.evaluation_cache.bypassed += 1
+            return None
+        return self.evaluation_cache.get(request)
+    
+    def _cache_evaluation(self, request: Dict[str, Any], eval_result: Dict[str, Any]):
+        """Keep a fresh evaluation for identical submissions (fallbacks are skipped)."""
+        if self.evaluation_cache is not None:
+            self.evaluation_cache.put(request, eval_result)
+    
+    async def _acached_evaluation(self, request: Dict[str, Any], bypass_cache: bool) -> Optional[Dict[str, Any]]:
+        """_cached_evaluation from a worker thread (the cache is SQLite and updates on every hit)."""
+        return await asyncio.to_thread(self._cached_evaluation, request, bypass_cache)
+    
+    async def _acache_evaluation(self, request: Dict[str, Any], eval_result: Dict[str, Any]):
+        """_cache_evaluation from a worker thread (writes, and every CACHE_PRUNE_EVERY puts prunes)."""
+        await asyncio.to_thread(self._cache_evaluation, request, eval_result)
+    
+    def _record_evaluation(self,
+                           interview_id: str,
+                           data: Dict[str, Any],
+                           last_q: Dict[str, Any],
+                           eval_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Store an evaluation, adapt the level, finalize if done and save the turn."""
+        last_q["evaluation"] = self._evaluation_record(eval_result)
+        new_level = self._apply_score(data, last_q["evaluation"]["overall_score"])
+        
+        # One save per turn; completion is flushed immediately whatever the durability mode.
+        # With deferred evaluations the last question may be asked before earlier answers are scored.
+        if (data["state"]["asked_count"] >= data["settings"]["num_questions"]
+                and all(q.get("evaluation") for q in data.get("questions", []))):
+            self._finalize_summary(data)
+        self.save_session(data, flush=data.get("summary") is not None)
+        
+        return {
+            "interview_id": interview_id,
+            "evaluation": last_q["evaluation"],
+            "new_level": new_level,
+            "is_complete": data.get("summary") is not None
+        }
+    
+    @staticmethod
+    def _evaluation_record(eval_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Evaluation fields stored with a question."""
+        record = {
             "overall_score": float(eval_result.get("overall_score", 0.0)),
             "subscores": eval_result.get("subscores", {}),
             "feedback": eval_result.get("feedback", ""),
@@ -213,30 +802,140 @@ class InterviewManager:
             "strengths": eval_result.get("strengths", []),
             "improvements": eval_result.get("improvements", [])
         }
-
+        if eval_result.get("is_fallback"):
+            record["is_fallback"] = True
+        return record
+    
+    @staticmethod
+    def _apply_score(data: Dict[str, Any], score: float) -> int:
+        """Add a score to the recent window and return the adapted current level."""
         recent = data["state"].setdefault("recent_scores", [])
-        recent.append(last_q["evaluation"]["overall_score"])
+        recent.append(score)
         if len(recent) > InterviewConfig.SCORE_WINDOW_SIZE:
             recent = recent[-InterviewConfig.SCORE_WINDOW_SIZE:]
             data["state"]["recent_scores"] = recent
-
+        
         current_level = data["state"].get("current_level", data["settings"].get("initial_level", InterviewConfig.DEFAULT_INITIAL_LEVEL))
         new_level, reason = update_level(current_level, data["state"]["recent_scores"])
         data["state"]["current_level"] = new_level
-
-        self.storage.save_interview(data)
-
-        if data["state"]["asked_count"] >= data["settings"]["num_questions"]:
-            self._finalize_summary(data)
-            self.storage.save_interview(data)
-
-        return {
-            "interview_id": interview_id,
-            "evaluation": last_q["evaluation"],
-            "new_level": new_level,
-            "is_complete": data.get("summary") is not None
-        }
-
+        return new_level
+    
+    async def aevaluate_transcript(self,
+                                   job_title: str,
+                                   items: List[Dict[str, Any]],
+                                   keywords: Optional[List[str]] = None,
+                                   language: str = "en",
+                                   concurrency: Optional[int] = None,
+                                   bypass_cache: bool = False,
+                                   save_transcript: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Evaluate the answers of a recorded interview transcript.
+        
+        The evaluations run concurrently (at most `concurrency` at once, and
+        within the LLM gateway's own limit) and are yielded as they finish,
+        so they may arrive out of order. Once all are done the transcript is
+        stored as one completed interview session with a single save. Closing
+        the generator early cancels the evaluations still running and stores
+        nothing.
+        
+        Args:
+            job_title: Target job title of the interview
+            items: Dicts with question, answer, level, topics and question_type, in interview order
+            keywords: Keywords of the stored session (default: the items' topics)
+            language: Interview language
+            concurrency: Evaluations in flight at once (default: EvaluationConfig.BATCH_CONCURRENCY)
+            bypass_cache: Evaluate with the LLM even if a cached evaluation exists
+            save_transcript: Store the transcript as an interview session
+            
+        Yields:
+            {"type": "evaluation", "index", "q_id", "evaluation"} per item, then
+            {"type": "summary", "interview_id", "summary"} if the transcript was stored
+        """
+        limit = max(1, min(concurrency or EvaluationConfig.BATCH_CONCURRENCY, EvaluationConfig.BATCH_MAX_CONCURRENCY))
+        semaphore = asyncio.Semaphore(limit)
+        requests = [{
+            "question_text": item["question"],
+            "question_type": item.get("question_type", "technical"),
+            "question_level": item.get("level", InterviewConfig.DEFAULT_INITIAL_LEVEL),
+            "answer_text": item["answer"],
+            "job_title": job_title,
+            "topics": item.get("topics", [])
+        } for item in items]
+        
+        async def evaluate(index: int, request: Dict[str, Any]):
+            async with semaphore:
+                eval_result = await self._acached_evaluation(request, bypass_cache)
+                if eval_result is None:
+                    eval_result = await self.evaluator.aevaluate_answer(**request)
+                    await self._acache_evaluation(request, eval_result)
+                return index, self._evaluation_record(eval_result)
+        
+        tasks = [asyncio.ensure_future(evaluate(i, request)) for i, request in enumerate(requests)]
+        evaluations: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, evaluation = await next_done
+                evaluations[index] = evaluation
+                yield {"type": "evaluation", "index": index, "q_id": index + 1, "evaluation": evaluation}
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        if not save_transcript:
+            return
+        
+        data = self._transcript_session(job_title, requests, evaluations, keywords, language)
+        if not await self.asave_session(data, flush=True):
+            raise RuntimeError("Failed to persist transcript session")
+        yield {"type": "summary", "interview_id": data["interview_id"], "summary": data["summary"]}
+    
+    def _transcript_session(self,
+                            job_title: str,
+                            requests: List[Dict[str, Any]],
+                            evaluations: List[Dict[str, Any]],
+                            keywords: Optional[List[str]],
+                            language: str) -> Dict[str, Any]:
+        """Completed interview session for an evaluated transcript, levels replayed in order."""
+        if not keywords:
+            keywords = list(dict.fromkeys(t for request in requests for t in request["topics"])) or [job_title]
+        settings = InterviewSettings(
+            job_title=job_title,
+            num_questions=len(requests),
+            soft_pct=round(sum(1 for r in requests if r["question_type"] == "soft") / len(requests), 3),
+            initial_level=requests[0]["question_level"],
+            keywords=keywords,
+            language=language
+        )
+        from models.interview import InterviewState
+        data = InterviewSession(
+            interview_id=generate_interview_id(
+                RouterConfig.WORKER_INDEX if StorageConfig.MULTI_WORKER and RouterConfig.WORKER_INDEX >= 0 else None,
+                RouterConfig.WORKERS
+            ),
+            settings=settings,
+            questions=[],
+            state=InterviewState(current_level=settings.initial_level, asked_count=len(requests), recent_scores=[]),
+            summary=None,
+        ).dict()
+        
+        for q_id, (request, evaluation) in enumerate(zip(requests, evaluations), start=1):
+            data["questions"].append({
+                "q_id": q_id,
+                "question_id": generate_short_id(),
+                "text": request["question_text"],
+                "type": request["question_type"],
+                "level": request["question_level"],
+                "topics": request["topics"],
+                "estimated_time": 5,
+                "context": "",
+                "candidate_answer": request["answer_text"],
+                "evaluation": evaluation,
+            })
+            self._apply_score(data, evaluation["overall_score"])
+        
+        self._finalize_summary(data)
+        return data
+    
     def get_summary(self, interview_id: str) -> Optional[Dict[str, Any]]:
         """
         Get interview summary.
@@ -247,11 +946,12 @@ class InterviewManager:
         Returns:
             Summary data or None if not found
         """
-        data = self.storage.load_interview(interview_id)
-        if not data:
-            return None
-        return data.get("summary")
-
+        return self.storage.load_summary(interview_id)
+    
+    async def aget_summary(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        """get_summary from a worker thread (see aload_session)."""
+        return await asyncio.to_thread(self.get_summary, interview_id)
+    
     def _finalize_summary(self, data: Dict[str, Any]) -> None:
         """Generate final interview summary."""
         questions = data.get("questions", [])
@@ -259,7 +959,7 @@ class InterviewManager:
         
         if not answered_questions:
             return
-
+        
         total_score = sum(q["evaluation"]["overall_score"] for q in answered_questions)
         avg_score = total_score / len(answered_questions)
         
@@ -281,7 +981,7 @@ class InterviewManager:
         from collections import Counter
         top_strengths = [item for item, count in Counter(all_strengths).most_common(3)]
         top_improvements = [item for item, count in Counter(all_improvements).most_common(3)]
-
+        
         data["summary"] = {
             "overall_score": round(avg_score, 2),
             "technical_score": round(tech_avg, 2),
@@ -293,7 +993,7 @@ class InterviewManager:
             "recommendation": self._generate_recommendation(avg_score),
             "completed_at": datetime.utcnow().isoformat()
         }
-
+    
     def _generate_recommendation(self, avg_score: float) -> str:
         """Generate hiring recommendation based on score."""
         if avg_score >= 80:
@@ -0,0 +1,378 @@
+"""
+Append-only event journal for interview sessions.
+
+Each interview gets a JSON Lines file with one event per state change
+(question asked, answer submitted, evaluation recorded, level changed, ...).
+A save appends a few hundred bytes instead of copying the whole session, and
+the full history stays available for recovery and point-in-time
+reconstruction.
+
+Every event is a "set" operation (position, field or whole section), so
+replaying an event that a snapshot already contains is harmless. This keeps
+compaction simple: write the snapshot first, then record which seq it covers.
+
+Compaction also starts a new segment: the events so far move to
+segments/<interview_id>.<last seq>.jsonl, and the live journal restarts with
+the marker of the snapshot it follows. Loading reads only the live journal;
+history and reconstruction read the segments too.
+"""
+
+import copy
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+# Event types
+SESSION_CREATED = "session_created"
+SNAPSHOT_REPLACED = "snapshot_replaced"
+QUESTION_ASKED = "question_asked"
+QUESTION_UPDATED = "question_updated"
+QUESTIONS_TRUNCATED = "questions_truncated"
+ANSWER_SUBMITTED = "answer_submitted"
+EVALUATION_RECORDED = "evaluation_recorded"
+LEVEL_CHANGED = "level_changed"
+STATE_UPDATED = "state_updated"
+SUMMARY_RECORDED = "summary_recorded"
+SESSION_UPDATED = "session_updated"
+SESSION_DELETED = "session_deleted"
+SNAPSHOT_WRITTEN = "snapshot_written"
+
+# Question fields with their own event type; any other change is QUESTION_UPDATED
+_QUESTION_FIELD_EVENTS = {
+    "candidate_answer": ANSWER_SUBMITTED,
+    "evaluation": EVALUATION_RECORDED,
+}
+
+
+def diff_events(old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Describe the change from old to new interview data as journal events.
+    
+    Args:
+        old: Last persisted interview data (None for a new session)
+        new: Interview data being saved
+        
+    Returns:
+        List of events (without seq/ts), empty if nothing changed
+    """
+    if old is None:
+        return [{"type": SESSION_CREATED, "data": copy.deepcopy(new)}]
+    
+    events = []
+    old_questions = old.get("questions") or []
+    new_questions = new.get("questions") or []
+    
+    for position, question in enumerate(new_questions):
+        if position >= len(old_questions):
+            events.append({"type": QUESTION_ASKED, "position": position, "question": copy.deepcopy(question)})
+            continue
+        
+        previous = old_questions[position]
+        if previous == question:
+            continue
+        
+        changed = {k for k in set(previous) | set(question) if previous.get(k) != question.get(k)}
+        if changed <= set(_QUESTION_FIELD_EVENTS):
+            for field in sorted(changed):
+                events.append({
+                    "type": _QUESTION_FIELD_EVENTS[field],
+                    "position": position,
+                    "value": copy.deepcopy(question.get(field))
+                })
+        else:
+            events.append({"type": QUESTION_UPDATED, "position": position, "question": copy.deepcopy(question)})
+    
+    if len(new_questions) < len(old_questions):
+        events.append({"type": QUESTIONS_TRUNCATED, "length": len(new_questions)})
+    
+    old_state = old.get("state") or {}
+    new_state = new.get("state") or {}
+    if old_state != new_state:
+        if old_state.get("current_level") != new_state.get("current_level"):
+            events.append({
+                "type": LEVEL_CHANGED,
+                "from": old_state.get("current_level"),
+                "to": new_state.get("current_level"),
+                "state": copy.deepcopy(new_state)
+            })
+        else:
+            events.append({"type": STATE_UPDATED, "state": copy.deepcopy(new_state)})
+    
+    if old.get("summary") != new.get("summary"):
+        events.append({"type": SUMMARY_RECORDED, "summary": copy.deepcopy(new.get("summary"))})
+    
+    # Settings and any other top-level keys
+    for key in sorted(set(old) | set(new)):
+        if key in ("interview_id", "questions", "state", "summary"):
+            continue
+        if old.get(key) != new.get(key):
+            events.append({"type": SESSION_UPDATED, "key": key, "value": copy.deepcopy(new.get(key))})
+    
+    return events
+
+
+def apply_event(data: Optional[Dict[str, Any]], event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Apply one journal event to interview data (modified in place when possible).
+    
+    Returns:
+        The resulting interview data, or None once the session is deleted
+    """
+    kind = event.get("type")
+    
+    if kind in (SESSION_CREATED, SNAPSHOT_REPLACED):
+        return copy.deepcopy(event["data"])
+    if kind == SESSION_DELETED:
+        return None
+    if data is None or kind == SNAPSHOT_WRITTEN:
+        return data
+    
+    questions = data.setdefault("questions", [])
+    if kind in (QUESTION_ASKED, QUESTION_UPDATED):
+        position = event["position"]
+        question = copy.deepcopy(event["question"])
+        if position < len(questions):
+            questions[position] = question
+        else:
+            questions.append(question)
+    elif kind in (ANSWER_SUBMITTED, EVALUATION_RECORDED):
+        field = "candidate_answer" if kind == ANSWER_SUBMITTED else "evaluation"
+        position = event["position"]
+        if position < len(questions):
+            questions[position][field] = copy.deepcopy(event["value"])
+    elif kind == QUESTIONS_TRUNCATED:
+        del questions[event["length"]:]
+    elif kind in (LEVEL_CHANGED, STATE_UPDATED):
+        data["state"] = copy.deepcopy(event["state"])
+    elif kind == SUMMARY_RECORDED:
+        data["summary"] = copy.deepcopy(event["summary"])
+    elif kind == SESSION_UPDATED:
+        data[event["key"]] = copy.deepcopy(event["value"])
+    
+    return data
+
+
+def replay(events: List[Dict[str, Any]],
+           base: Optional[Dict[str, Any]] = None,
+           upto_seq: Optional[int] = None,
+           upto_time: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    Rebuild interview data by applying events on top of base.
+    
+    Args:
+        events: Journal events in seq order
+        base: Starting data (e.g. a snapshot), or None to start from scratch
+        upto_seq: Stop after the event with this seq
+        upto_time: Stop after the last event recorded at or before this Unix time
+        
+    Returns:
+        Reconstructed interview data, or None if the session did not exist
+    """
+    data = copy.deepcopy(base)
+    for event in events:
+        if upto_seq is not None and event["seq"] > upto_seq:
+            break
+        if upto_time is not None and event["ts"] > upto_time:
+            break
+        data = apply_event(data, event)
+    return data
+
+
+class InterviewJournal:
+    """
+    Per-interview JSON Lines journals in one directory.
+    
+    Not thread-safe on its own; InterviewStorage calls it while holding the
+    interview's lock.
+    """
+    
+    def __init__(self, journal_dir: Path, fsync: bool = False,
+                 on_change: Optional[Callable[[int, int], None]] = None):
+        """
+        Initialize journal directory.
+        
+        Args:
+            journal_dir: Directory for <interview_id>.jsonl files
+            fsync: fsync after every append (slower, survives power loss)
+            on_change: Called with (file count delta, byte delta) on every write
+        """
+        self.journal_dir = journal_dir
+        self.segment_dir = journal_dir / "segments"
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self.on_change = on_change
+        self._last_seq: Dict[str, int] = {}
+        # (size, inode) of the live journal after this process's last read or append,
+        # to detect writes (and segment starts) by other processes
+        self._size: Dict[str, Tuple[int, int]] = {}
+    
+    def path(self, interview_id: str) -> Path:
+        """Live journal file path for an interview."""
+        return self.journal_dir / f"{interview_id}.jsonl"
+    
+    def segment_paths(self, interview_id: str) -> List[Path]:
+        """Closed segments of an interview's journal, oldest first."""
+        segments = []
+        for path in self.segment_dir.glob(f"{interview_id}.*.jsonl"):
+            try:
+                segments.append((int(path.name[len(interview_id) + 1:-len(".jsonl")]), path))
+            except ValueError:
+                continue
+        return [path for _, path in sorted(segments)]
+    
+    def exists(self, interview_id: str) -> bool:
+        return self.path(interview_id).exists() or bool(self.segment_paths(interview_id))
+    
+    def read(self, interview_id: str) -> List[Dict[str, Any]]:
+        """
+        Read the events of the live journal (since the last segment start).
+        
+        A torn final line (crash during append) is cut off so later appends
+        start on a clean line.
+        """
+        path = self.path(interview_id)
+        if not path.exists():
+            # After a crash between closing a segment and starting the next one, continue its numbering
+            segments = self.segment_paths(interview_id)
+            self._last_seq[interview_id] = int(segments[-1].name.split(".")[1]) if segments else 0
+            self._size[interview_id] = (0, 0)
+            return []
+        
+        events = []
+        valid_bytes = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    break
+                valid_bytes += len(line)
+        
+        stat = path.stat()
+        if valid_bytes < stat.st_size:
+            with open(path, 'r+b') as f:
+                f.truncate(valid_bytes)
+            self._changed(0, valid_bytes - stat.st_size)
+        
+        self._last_seq[interview_id] = events[-1]["seq"] if events else 0
+        self._size[interview_id] = (valid_bytes, stat.st_ino)
+        return events
+    
+    def read_all(self, interview_id: str) -> List[Dict[str, Any]]:
+        """Read every event of an interview: the closed segments, then the live journal."""
+        events = []
+        for path in self.segment_paths(interview_id):
+            with open(path, 'rb') as f:
+                for line in f:
+                    try:
+                        events.append(json.loads(line))
+                    except ValueError:
+                        break
+        return events + self.read(interview_id)
+    
+    def append(self, interview_id: str, events: List[Dict[str, Any]]) -> int:
+        """
+        Append events, assigning seq numbers and timestamps.
+        
+        Returns:
+            seq of the last event in the journal
+        """
+        if interview_id not in self._last_seq:
+            self.read(interview_id)
+        seq = self._last_seq[interview_id]
+        if not events:
+            return seq
+        
+        now = time.time()
+        lines = []
+        for event in events:
+            seq += 1
+            lines.append(json.dumps({"seq": seq, "ts": now, **event}, ensure_ascii=False))
+        
+        path = self.path(interview_id)
+        is_new = self._last_seq[interview_id] == 0 and not path.exists()
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        with open(path, 'ab') as f:
+            f.write(payload)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        
+        self._last_seq[interview_id] = seq
+        size, inode = self._size[interview_id]
+        self._size[interview_id] = (size + len(payload), inode or path.stat().st_ino)
+        self._changed(1 if is_new else 0, len(payload))
+        return seq
+    
+    def start_segment(self, interview_id: str, covers: int) -> int:
+        """
+        Close the live journal as a segment and restart it after a snapshot.
+        
+        The new live journal holds only the SNAPSHOT_WRITTEN marker, so the
+        next load replays nothing older. Call after the snapshot covering
+        seq `covers` has been written.
+        
+        Returns:
+            seq of the marker
+        """
+        if interview_id not in self._last_seq:
+            self.read(interview_id)
+        last = self._last_seq[interview_id]
+        path = self.path(interview_id)
+        
+        marker = json.dumps({"seq": last + 1, "ts": time.time(), "type": SNAPSHOT_WRITTEN, "covers": covers},
+                            ensure_ascii=False)
+        payload = (marker + "\n").encode("utf-8")
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        
+        had_live = path.exists()
+        if had_live:
+            os.replace(path, self.segment_dir / f"{interview_id}.{last}.jsonl")
+        os.replace(temp_path, path)
+        
+        self._last_seq[interview_id] = last + 1
+        self._size[interview_id] = (len(payload), path.stat().st_ino)
+        self._changed(1, len(payload))
+        return last + 1
+    
+    def is_current(self, interview_id: str) -> bool:
+        """
+        Check that nobody else wrote to the journal since this process did.
+        
+        Costs one stat; False for journals this process has not read yet.
+        """
+        if interview_id not in self._size:
+            return False
+        try:
+            stat = self.path(interview_id).stat()
+            current = (stat.st_size, stat.st_ino)
+        except FileNotFoundError:
+            current = (0, 0)
+        return current == self._size[interview_id]
+    
+    def forget(self, interview_id: str):
+        """Drop cached seq/size so the next access re-reads the journal."""
+        self._last_seq.pop(interview_id, None)
+        self._size.pop(interview_id, None)
+    
+    def delete(self, interview_id: str):
+        """Remove an interview's journal and its segments."""
+        self.forget(interview_id)
+        for path in [self.path(interview_id)] + self.segment_paths(interview_id):
+            if path.exists():
+                size = path.stat().st_size
+                path.unlink()
+                self._changed(-1, -size)
+    
+    def _changed(self, files: int, size: int):
+        if self.on_change is not None:
+            self.on_change(files, size)
@@ -0,0 +1,355 @@
+"""
+Per-interview locking for session storage.
+
+Two layers, always taken in the same order:
+1. A striped threading.RLock (interview_id hashed onto a fixed pool), so
+   threads working on unrelated interviews rarely wait for each other.
+2. An OS-level advisory lock on locks/<interview_id>.lock, so several
+   worker processes cannot interleave writes to the same session. Uses
+   fcntl.flock, else the filelock package (Windows); on platforms with
+   neither, only the in-process lock applies.
+
+Lock files are removed with the interview (remove, prune). Removal happens
+under the lock, and a process that then acquires the removed file notices
+(no links left) and locks the new file instead, so removal cannot let two
+processes hold the same interview.
+
+Both layers are reentrant per thread. Async code takes the OS-level lock
+alone through async_os_lock, which polls instead of blocking the event loop
+(in-process ordering is then up to the caller).
+
+Stripes suit the storage's short critical sections. Locks held across LLM
+calls use SessionLocks instead: one lock per interview, taken by threads and
+coroutines alike, so unrelated interviews never wait on each other's
+generations.
+"""
+
+import asyncio
+import os
+import threading
+import time
+import zlib
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+try:
+    from filelock import FileLock, Timeout as FileLockTimeout
+except ImportError:
+    FileLock = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class LockTimeout(TimeoutError):
+    """Raised when an interview lock cannot be acquired in time."""
+
+
+def _try_flock(path: Path) -> Optional[int]:
+    """Open and flock a lock file without waiting; the locked fd, or None if held elsewhere."""
+    fd = os.open(str(path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    if os.fstat(fd).st_nlink == 0:
+        # Removed by its holder while we waited; the next try opens the new file
+        os.close(fd)
+        return None
+    return fd
+
+
+def _release_flock(fd: int):
+    try:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+class InterviewLocks:
+    """Striped in-process locks plus per-interview advisory file locks."""
+    
+    def __init__(self, lock_dir: Optional[Path], stripes: int = 64, timeout: float = 30.0, file_locks: bool = True):
+        """
+        Initialize lock pool.
+        
+        Args:
+            lock_dir: Directory for <interview_id>.lock files (None for in-process locks only)
+            stripes: Number of in-process locks interview ids are hashed onto
+            timeout: Seconds to wait for a lock before raising LockTimeout
+            file_locks: Also take OS-level locks (disable for single-process use)
+        """
+        self.lock_dir = lock_dir
+        self.timeout = timeout
+        self.file_locks = lock_dir is not None and file_locks and (FileLock is not None or fcntl is not None)
+        if self.file_locks:
+            self.lock_dir.mkdir(parents=True, exist_ok=True)
+        self._stripes = [threading.RLock() for _ in range(max(1, stripes))]
+        self._held = threading.local()
+    
+    @property
+    def backend(self) -> str:
+        """Name of the cross-process locking mechanism in use."""
+        if not self.file_locks:
+            return "none"
+        return "fcntl" if fcntl is not None else "filelock"
+    
+    def _stripe(self, interview_id: str) -> threading.RLock:
+        return self._stripes[zlib.crc32(interview_id.encode("utf-8")) % len(self._stripes)]
+    
+    @contextmanager
+    def lock(self, interview_id: str):
+        """Hold the in-process and OS-level locks for one interview."""
+        stripe = self._stripe(interview_id)
+        if not stripe.acquire(timeout=self.timeout):
+            raise LockTimeout(f"Timed out waiting for lock on interview {interview_id}")
+        try:
+            held: Dict[str, int] = self._held.__dict__.setdefault("depth", {})
+            if held.get(interview_id) or not self.file_locks:
+                held[interview_id] = held.get(interview_id, 0) + 1
+                try:
+                    yield
+                finally:
+                    held[interview_id] -= 1
+                return
+            
+            with self.os_lock(interview_id):
+                held[interview_id] = 1
+                try:
+                    yield
+                finally:
+                    held[interview_id] = 0
+        finally:
+            stripe.release()
+    
+    @asynccontextmanager
+    async def async_os_lock(self, interview_id: str):
+        """
+        Hold only the OS-level lock for one interview from async code.
+        
+        Not reentrant; a no-op when file locks are disabled. Waits by polling
+        with asyncio.sleep, so other requests keep being served meanwhile.
+        """
+        if not self.file_locks:
+            yield
+            return
+        
+        path = self.lock_dir / f"{interview_id}.lock"
+        deadline = time.monotonic() + self.timeout
+        delay = 0.001
+        
+        if fcntl is None:
+            lock = FileLock(str(path))
+            while True:
+                try:
+                    lock.acquire(timeout=0)
+                    break
+                except FileLockTimeout:
+                    if time.monotonic() >= deadline:
+                        raise LockTimeout(f"Timed out waiting for file lock on interview {interview_id}")
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 0.05)
+            try:
+                yield
+            finally:
+                lock.release()
+            return
+        
+        while (fd := _try_flock(path)) is None:
+            if time.monotonic() >= deadline:
+                raise LockTimeout(f"Timed out waiting for file lock on interview {interview_id}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        try:
+            yield
+        finally:
+            _release_flock(fd)
+    
+    def os_lock(self, interview_id: str):
+        """Hold only the OS-level lock for one interview (not reentrant; a no-op when file locks are disabled)."""
+        if not self.file_locks:
+            return nullcontext()
+        return self._os_lock(interview_id)
+    
+    @contextmanager
+    def _os_lock(self, interview_id: str):
+        path = self.lock_dir / f"{interview_id}.lock"
+        
+        if fcntl is None:
+            try:
+                with FileLock(str(path), timeout=self.timeout):
+                    yield
+            except FileLockTimeout:
+                raise LockTimeout(f"Timed out waiting for file lock on interview {interview_id}")
+            return
+        
+        deadline = time.monotonic() + self.timeout
+        delay = 0.001
+        while (fd := _try_flock(path)) is None:
+            if time.monotonic() >= deadline:
+                raise LockTimeout(f"Timed out waiting for file lock on interview {interview_id}")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        try:
+            yield
+        finally:
+            _release_flock(fd)
+    
+    def remove(self, interview_id: str):
+        """
+        Delete an interview's lock file; call while holding its lock.
+        
+        A no-op with the filelock backend, which removes its files itself.
+        """
+        if not self.file_locks or fcntl is None:
+            return
+        try:
+            (self.lock_dir / f"{interview_id}.lock").unlink()
+        except FileNotFoundError:
+            pass
+    
+    def prune(self, keep: Callable[[str], bool]) -> int:
+        """
+        Remove the lock files of interviews for which keep(interview_id) is False.
+        
+        Returns:
+            Number of lock files removed
+        """
+        if not self.file_locks or fcntl is None:
+            return 0
+        removed = 0
+        for path in self.lock_dir.glob("*.lock"):
+            interview_id = path.stem
+            if keep(interview_id):
+                continue
+            with self.lock(interview_id):
+                if not keep(interview_id) and path.exists():
+                    self.remove(interview_id)
+                    removed += 1
+        return removed
+
+
+class _SessionLock:
+    """Lock of one interview and its bookkeeping (see SessionLocks)."""
+    
+    __slots__ = ("lock", "owner", "depth", "users")
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.owner: Optional[int] = None  # thread holding it through SessionLocks.lock (None for a coroutine)
+        self.depth = 0
+        self.users = 0
+
+
+class SessionLocks:
+    """
+    One lock per interview, shared by threads and coroutines.
+    
+    Threads take it with lock() (reentrant per thread); coroutines with
+    alock(), which polls instead of blocking the event loop. A lock exists
+    only while in use. With a lock_dir, the OS-level lock of InterviewLocks
+    is taken too, so several worker processes also exclude each other.
+    """
+    
+    def __init__(self, lock_dir: Optional[Path], timeout: float = 300.0, file_locks: bool = True):
+        """
+        Initialize lock table.
+        
+        Args:
+            lock_dir: Directory for <interview_id>.lock files (None for in-process locks only)
+            timeout: Seconds to wait for a lock before raising LockTimeout
+            file_locks: Also take OS-level locks
+        """
+        self.timeout = timeout
+        self._files = InterviewLocks(lock_dir, stripes=1, timeout=timeout, file_locks=file_locks)
+        self._guard = threading.Lock()
+        self._locks: Dict[str, _SessionLock] = {}
+    
+    def _ref(self, interview_id: str) -> _SessionLock:
+        with self._guard:
+            entry = self._locks.get(interview_id)
+            if entry is None:
+                entry = self._locks[interview_id] = _SessionLock()
+            entry.users += 1
+            return entry
+    
+    def _unref(self, interview_id: str, entry: _SessionLock):
+        with self._guard:
+            entry.users -= 1
+            if entry.users == 0 and self._locks.get(interview_id) is entry:
+                del self._locks[interview_id]
+    
+    @contextmanager
+    def lock(self, interview_id: str):
+        """Hold an interview's lock from a thread (must not be the event loop's)."""
+        entry = self._ref(interview_id)
+        try:
+            me = threading.get_ident()
+            if entry.owner == me:
+                entry.depth += 1
+                try:
+                    yield
+                finally:
+                    entry.depth -= 1
+                return
+            
+            if not entry.lock.acquire(timeout=self.timeout):
+                raise LockTimeout(f"Timed out waiting for lock on interview {interview_id}")
+            try:
+                entry.owner, entry.depth = me, 1
+                with self._files.os_lock(interview_id):
+                    yield
+            finally:
+                entry.owner, entry.depth = None, 0
+                entry.lock.release()
+        finally:
+            self._unref(interview_id, entry)
+    
+    @asynccontextmanager
+    async def alock(self, interview_id: str):
+        """Hold an interview's lock from a coroutine (not reentrant)."""
+        entry = self._ref(interview_id)
+        try:
+            deadline = time.monotonic() + self.timeout
+            delay = 0.001
+            while not entry.lock.acquire(blocking=False):
+                if time.monotonic() >= deadline:
+                    raise LockTimeout(f"Timed out waiting for lock on interview {interview_id}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.05)
+            try:
+                async with self._files.async_os_lock(interview_id):
+                    yield
+            finally:
+                entry.lock.release()
+        finally:
+            self._unref(interview_id, entry)
+    
+    def remove(self, interview_id: str):
+        """Delete an interview's lock file; call while holding its lock."""
+        self._files.remove(interview_id)
+    
+    def prune(self, keep: Callable[[str], bool]) -> int:
+        """
+        Remove the lock files of interviews for which keep(interview_id) is False.
+        
+        Returns:
+            Number of lock files removed
+        """
+        if not self._files.file_locks or fcntl is None:
+            return 0
+        removed = 0
+        for path in self._files.lock_dir.glob("*.lock"):
+            interview_id = path.stem
+            if keep(interview_id):
+                continue
+            with self.lock(interview_id):
+                if not keep(interview_id) and path.exists():
+                    self.remove(interview_id)
+                    removed += 1
+        return removed
+
@@ -0,0 +1,208 @@
+"""
+In-memory metadata index for the JSON storage backend.
+
+Keeps one small entry per interview (job title, counts, level, completion,
+summary score, timestamps and the final summary) so listing, sorting,
+pagination and summary reads never open interview files. Entries are
+updated on every save and persisted to index/metadata.json after a short
+debounce; the file is reconciled against the interview files at startup.
+"""
+
+import heapq
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional
+
+# Keys returned by list_interviews without / with include_summary
+BASE_FIELDS = ("interview_id", "filename", "created", "modified", "size_bytes")
+SUMMARY_FIELDS = ("job_title", "num_questions", "questions_answered", "current_level",
+                  "is_complete", "summary_score", "completed_at")
+
+# Sort key and direction (True = newest / largest first)
+SORT_KEYS = {
+    "created": ("created", True),
+    "modified": ("modified", True),
+    "id": ("interview_id", False),
+}
+
+
+def build_entry(interview_data: Dict[str, Any],
+                filename: str,
+                created: str,
+                modified_ts: float,
+                size_bytes: int) -> Dict[str, Any]:
+    """
+    Build the index entry for an interview.
+    
+    Args:
+        interview_data: Interview session dictionary
+        filename: Snapshot file name
+        created: ISO creation time
+        modified_ts: Unix time of the last save
+        size_bytes: Snapshot file size
+        
+    Returns:
+        Index entry dictionary
+    """
+    settings = interview_data.get("settings") or {}
+    state = interview_data.get("state") or {}
+    summary = interview_data.get("summary")
+    
+    return {
+        "interview_id": interview_data["interview_id"],
+        "filename": filename,
+        "created": created,
+        "modified": datetime.fromtimestamp(modified_ts).isoformat(),
+        "modified_ts": modified_ts,
+        "size_bytes": size_bytes,
+        "job_title": settings.get("job_title"),
+        "num_questions": settings.get("num_questions"),
+        "questions_answered": len(interview_data.get("questions") or []),
+        "current_level": state.get("current_level"),
+        "is_complete": summary is not None,
+        "summary_score": summary.get("overall_score") if isinstance(summary, dict) else None,
+        "completed_at": summary.get("completed_at") if isinstance(summary, dict) else None,
+        "summary": summary,
+    }
+
+
+class MetadataIndex:
+    """Thread-safe interview metadata index with debounced persistence."""
+    
+    def __init__(self, index_path: Path, flush_delay: float = 2.0):
+        """
+        Initialize index and load the persisted copy if present.
+        
+        Args:
+            index_path: File the index is persisted to
+            flush_delay: Seconds to wait after a change before writing the file
+        """
+        self.index_path = index_path
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_delay = flush_delay
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f).get("entries", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Ignoring unreadable metadata index {self.index_path}: {e}")
+    
+    def get(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(interview_id)
+    
+    def put(self, entry: Dict[str, Any]):
+        with self._lock:
+            self._entries[entry["interview_id"]] = entry
+        self._schedule_flush()
+    
+    def update(self, interview_id: str, **fields):
+        with self._lock:
+            if interview_id in self._entries:
+                self._entries[interview_id].update(fields)
+        self._schedule_flush()
+    
+    def remove(self, interview_id: str):
+        with self._lock:
+            self._entries.pop(interview_id, None)
+        self._schedule_flush()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def query(self,
+              limit: Optional[int] = None,
+              offset: int = 0,
+              sort_by: str = "created",
+              include_summary: bool = False) -> List[Dict[str, Any]]:
+        """
+        Return one page of entries, sorted.
+        
+        Uses a bounded heap, so the cost is O(n log(offset + limit)) with no
+        file access.
+        """
+        key, newest_first = SORT_KEYS.get(sort_by, SORT_KEYS["created"])
+        fields = BASE_FIELDS + SUMMARY_FIELDS if include_summary else BASE_FIELDS
+        
+        with self._lock:
+            entries = list(self._entries.values())
+        
+        sort_key = lambda e: e.get(key) or ""
+        if limit:
+            select = heapq.nlargest if newest_first else heapq.nsmallest
+            page = select(offset + limit, entries, key=sort_key)[offset:]
+        else:
+            page = sorted(entries, key=sort_key, reverse=newest_first)[offset:]
+        
+        return [{field: entry.get(field) for field in fields} for entry in page]
+    
+    def reconcile(self, snapshot_files: Dict[str, Path],
+                  last_change: Callable[[str], float],
+                  rebuild: Callable[[str], Optional[Dict[str, Any]]]) -> int:
+        """
+        Bring the index in line with the files on disk.
+        
+        Drops entries without a snapshot and rebuilds entries that are
+        missing or older than the interview's last change on disk.
+        
+        Args:
+            snapshot_files: interview_id -> snapshot path
+            last_change: interview_id -> Unix time of its last on-disk change
+            rebuild: interview_id -> fresh entry (None to skip)
+            
+        Returns:
+            Number of entries added, rebuilt or removed
+        """
+        changed = 0
+        with self._lock:
+            stale_ids = [i for i in self._entries if i not in snapshot_files]
+            for interview_id in stale_ids:
+                del self._entries[interview_id]
+            changed += len(stale_ids)
+            current = dict(self._entries)
+        
+        for interview_id in snapshot_files:
+            entry = current.get(interview_id)
+            if entry is not None and entry.get("modified_ts", 0) >= last_change(interview_id):
+                continue
+            fresh = rebuild(interview_id)
+            if fresh is not None:
+                with self._lock:
+                    self._entries[interview_id] = fresh
+                changed += 1
+        
+        if changed:
+            self._schedule_flush()
+        return changed
+    
+    def _schedule_flush(self):
+        """Write the index after flush_delay, coalescing changes in between."""
+        with self._lock:
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(self.flush_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+    
+    def flush(self):
+        """Write the index to disk now (atomic replace)."""
+        with self._lock:
+            self._timer = None
+            payload = json.dumps({"version": 1, "entries": self._entries}, ensure_ascii=False)
+        
+        try:
+            with self._write_lock:
+                temp_path = self.index_path.with_suffix('.tmp')
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                temp_path.replace(self.index_path)
+        except Exception as e:
+            print(f"Error writing metadata index {self.index_path}: {e}")
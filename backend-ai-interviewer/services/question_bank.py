@@ -0,0 +1,307 @@
+"""
+Persistent bank of generated interview questions.
+
+Many candidates interview with the same job title, level, question type,
+keywords and language, so questions generated for one session are kept and
+served to later sessions without an LLM call. Each bank key (the normalized
+settings) holds its own questions. A MinHash signature per question keeps
+near-duplicates out of the bank and out of a session that has already asked
+a similar question (see utils/text_similarity.py).
+
+Stored in SQLite (WAL mode) next to the interview data; fallback questions
+are never banked.
+"""
+
+import hashlib
+import json
+import sqlite3
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+try:
+    from utils.config import QuestionConfig, StorageConfig
+    from utils.id_utils import generate_short_id
+    from utils.text_similarity import NUM_PERM, minhash, is_near_duplicate, lsh_bands
+except ImportError:
+    # Fallback for direct execution
+    import sys
+    sys.path.append(str(Path(__file__).parent.parent))
+    from utils.config import QuestionConfig, StorageConfig
+    from utils.id_utils import generate_short_id
+    from utils.text_similarity import NUM_PERM, minhash, is_near_duplicate, lsh_bands
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bank_questions (
+    id             INTEGER PRIMARY KEY,
+    bank_key       TEXT NOT NULL,
+    question_text  TEXT NOT NULL,
+    question_type  TEXT NOT NULL,
+    level          INTEGER NOT NULL,
+    topics         TEXT NOT NULL,
+    estimated_time INTEGER NOT NULL,
+    context        TEXT NOT NULL,
+    signature      BLOB NOT NULL,
+    source         TEXT NOT NULL,
+    served_count   INTEGER NOT NULL DEFAULT 0,
+    created_at     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_bank_questions_key ON bank_questions(bank_key, served_count);
+CREATE TABLE IF NOT EXISTS bank_bands (
+    bank_key    TEXT NOT NULL,
+    band        TEXT NOT NULL,
+    question_id INTEGER NOT NULL REFERENCES bank_questions(id) ON DELETE CASCADE,
+    PRIMARY KEY (bank_key, band, question_id)
+) WITHOUT ROWID;
+"""
+
+_SIGNATURE_FORMAT = f"<{NUM_PERM}I"
+
+
+def bank_key(job_title: str,
+             level: int,
+             question_type: str,
+             keywords: Optional[List[str]],
+             language: str) -> str:
+    """
+    Key of the bank partition for a set of question settings.
+    
+    Job title, keywords and language are case- and whitespace-insensitive;
+    keyword order does not matter.
+    """
+    normalized = {
+        "job_title": " ".join((job_title or "").lower().split()),
+        "level": int(level),
+        "question_type": (question_type or "").lower(),
+        "keywords": sorted({" ".join(k.lower().split()) for k in keywords or [] if k and k.strip()}),
+        "language": (language or "en").lower(),
+    }
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class QuestionBank:
+    """SQLite-backed question bank with MinHash near-duplicate filtering."""
+    
+    def __init__(self, db_path: Optional[Path] = None, duplicate_threshold: Optional[float] = None):
+        """
+        Initialize bank and create the schema if needed.
+        
+        Args:
+            db_path: SQLite database file (defaults to QuestionConfig.BANK_PATH)
+            duplicate_threshold: Estimated Jaccard similarity at which two questions count as duplicates
+        """
+        self.db_path = Path(db_path or QuestionConfig.BANK_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.duplicate_threshold = duplicate_threshold or QuestionConfig.BANK_DUPLICATE_THRESHOLD
+        self._local = threading.local()
+        
+        self.added = 0
+        self.duplicates_rejected = 0
+        self.fallbacks_rejected = 0
+        self.draws = 0
+        self.draw_hits = 0
+        
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=StorageConfig.SQLITE_BUSY_TIMEOUT_MS / 1000,
+                isolation_level=None,  # transactions are managed explicitly
+                check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+    
+    @contextmanager
+    def _transaction(self):
+        """Run a block in a write transaction, rolling back on error."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+    
+    def add(self, settings: Dict[str, Any], question: Dict[str, Any], source: str = "generated") -> bool:
+        """
+        Bank a generated question unless it is a fallback or a near-duplicate.
+        
+        Args:
+            settings: generate_question arguments the question was generated with
+                (job_title, level, question_type, keywords, language)
+            question: Question dictionary as returned by generate_question
+            source: Where the question came from ("generated", "prefetch", "bulk", ...)
+            
+        Returns:
+            True if the question was added
+        """
+        if question.get("is_fallback") or question.get("bank_id") or not question.get("question_text"):
+            if question.get("is_fallback"):
+                self.fallbacks_rejected += 1
+            return False
+        
+        try:
+            key = bank_key(settings["job_title"], question.get("level", settings["level"]),
+                           question.get("question_type", settings["question_type"]),
+                           settings.get("keywords"), settings.get("language", "en"))
+            signature = minhash(question["question_text"])
+            bands = lsh_bands(signature)
+            
+            with self._transaction() as conn:
+                placeholders = ",".join("?" * len(bands))
+                rows = conn.execute(
+                    f"""SELECT DISTINCT q.signature FROM bank_bands b
+                        JOIN bank_questions q ON q.id = b.question_id
+                        WHERE b.bank_key = ? AND b.band IN ({placeholders})""",
+                    (key, *bands)
+                ).fetchall()
+                if is_near_duplicate(signature, [self._unpack(r[0]) for r in rows], self.duplicate_threshold):
+                    self.duplicates_rejected += 1
+                    return False
+                
+                cursor = conn.execute(
+                    """INSERT INTO bank_questions (bank_key, question_text, question_type, level, topics,
+                                                   estimated_time, context, signature, source, created_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (key, question["question_text"], question["question_type"], question["level"],
+                     json.dumps(question.get("topics") or []), int(question.get("estimated_time") or 5),
+                     question.get("context") or "", struct.pack(_SIGNATURE_FORMAT, *signature),
+                     source, time.time())
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO bank_bands (bank_key, band, question_id) VALUES (?, ?, ?)",
+                    [(key, band, cursor.lastrowid) for band in bands]
+                )
+            
+            self.added += 1
+            return True
+        
+        except Exception as e:
+            print(f"Error adding question to bank: {e}")
+            return False
+    
+    def draw(self,
+             job_title: str,
+             level: int,
+             question_type: str,
+             keywords: Optional[List[str]] = None,
+             language: str = "en",
+             previous_questions: Optional[List[str]] = None,
+             min_unseen: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Pick a banked question the session has not seen (nor anything similar).
+        
+        Takes the same arguments as generate_question. Least-served questions
+        are preferred; the draw does not count as served until mark_served.
+        
+        Args:
+            min_unseen: Only serve when at least this many suitable questions
+                remain, so sessions keep some variety (default: QuestionConfig.BANK_MIN_UNSEEN)
+                
+        Returns:
+            Question dictionary shaped like generate_question's (plus bank_id),
+            or None if the bank cannot serve this request
+        """
+        self.draws += 1
+        min_unseen = QuestionConfig.BANK_MIN_UNSEEN if min_unseen is None else min_unseen
+        
+        try:
+            key = bank_key(job_title, level, question_type, keywords, language)
+            rows = self._connection().execute(
+                """SELECT id, question_text, question_type, level, topics, estimated_time, context, signature
+                   FROM bank_questions WHERE bank_key = ?
+                   ORDER BY served_count ASC, random() LIMIT ?""",
+                (key, QuestionConfig.BANK_CANDIDATES)
+            ).fetchall()
+            if len(rows) < min_unseen:
+                return None
+            
+            seen = [minhash(text) for text in previous_questions or [] if text]
+            unseen = [row for row in rows if not is_near_duplicate(self._unpack(row[7]), seen, self.duplicate_threshold)]
+            if not unseen or len(unseen) < min_unseen:
+                return None
+            
+            # Rows come least-served first, ties in random order
+            row = unseen[0]
+            
+            self.draw_hits += 1
+            return {
+                "question_id": generate_short_id(),
+                "question_text": row[1],
+                "question_type": row[2],
+                "level": row[3],
+                "estimated_time": row[5],
+                "topics": json.loads(row[4]) or ["general"],
+                "context": row[6],
+                "bank_id": row[0]
+            }
+        
+        except Exception as e:
+            print(f"Error drawing question from bank: {e}")
+            return None
+    
+    def mark_served(self, bank_id: int):
+        """Count a banked question as served to a session."""
+        try:
+            with self._transaction() as conn:
+                conn.execute("UPDATE bank_questions SET served_count = served_count + 1 WHERE id = ?", (bank_id,))
+        except Exception as e:
+            print(f"Error updating question bank: {e}")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Bank size and usage counters."""
+        try:
+            questions, keys, served = self._connection().execute(
+                "SELECT COUNT(*), COUNT(DISTINCT bank_key), COALESCE(SUM(served_count), 0) FROM bank_questions"
+            ).fetchone()
+        except Exception as e:
+            print(f"Error reading question bank stats: {e}")
+            questions = keys = served = None
+        
+        return {
+            "questions": questions,
+            "keys": keys,
+            "served": served,
+            "added": self.added,
+            "duplicates_rejected": self.duplicates_rejected,
+            "fallbacks_rejected": self.fallbacks_rejected,
+            "draws": self.draws,
+            "draw_hits": self.draw_hits,
+            "hit_rate": round(self.draw_hits / self.draws, 3) if self.draws else None
+        }
+    
+    @staticmethod
+    def _unpack(blob: bytes) -> List[int]:
+        return list(struct.unpack(_SIGNATURE_FORMAT, blob))
+
+
+# Global bank instance
+_bank_instance = None
+_bank_lock = threading.Lock()
+
+
+def get_question_bank() -> QuestionBank:
+    """Get global question bank instance."""
+    global _bank_instance
+    
+    with _bank_lock:
+        if _bank_instance is None:
+            _bank_instance = QuestionBank()
+    
+    return _bank_instance
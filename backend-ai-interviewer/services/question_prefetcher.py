@@ -0,0 +1,215 @@
+"""
+Speculative prefetching of the next interview question.
+
+A turn used to cost two LLM generations back to back: the evaluation in
+/submit_answer, then the next question in /next_question. The prefetcher
+starts generating the next question as soon as an answer is submitted, in
+parallel with its evaluation, for every level update_level could still
+choose (see utils.scoring.reachable_levels) and for the question type the
+soft_pct logic picks. Once the evaluation settles the level, the other
+candidates are cancelled and /next_question takes the remaining one,
+finished or still running.
+
+Prefetches live on the event loop of the async API path. Memory is bounded
+by PREFETCH_MAX_SESSIONS (oldest sessions are dropped first) and
+PREFETCH_TTL (abandoned interviews).
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Any, Iterable, Optional
+
+
+class _Prefetch:
+    """Candidate next questions for one session turn."""
+    
+    __slots__ = ("asked_count", "question_type", "tasks", "loop", "created")
+    
+    def __init__(self, asked_count: int, question_type: str, loop):
+        self.asked_count = asked_count
+        self.question_type = question_type
+        self.tasks: Dict[int, asyncio.Task] = {}
+        self.loop = loop
+        self.created = time.monotonic()
+
+
+class QuestionPrefetcher:
+    """Per-session speculative question generation with hit-rate metrics."""
+    
+    def __init__(self,
+                 generate: Callable[..., Awaitable[Dict[str, Any]]],
+                 max_sessions: int = 64,
+                 ttl: float = 600.0,
+                 is_busy: Optional[Callable[[], bool]] = None):
+        """
+        Initialize prefetcher.
+        
+        Args:
+            generate: Async question generator taking generate_question's keyword arguments
+            max_sessions: Sessions with prefetches kept at once
+            ttl: Seconds after which an unclaimed prefetch is dropped
+            is_busy: Returns True when the LLM has no spare capacity; prefetching
+                is then skipped so it does not delay requests users are waiting on
+        """
+        self.generate = generate
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.is_busy = is_busy
+        self._entries: "OrderedDict[str, _Prefetch]" = OrderedDict()
+        
+        self.started = 0
+        self.generations = 0
+        self.skipped_busy = 0
+        self.hits = 0
+        self.waited_hits = 0
+        self.misses = 0
+        self.cancelled = 0
+        self.expired = 0
+    
+    def start(self, interview_id: str, request: Dict[str, Any], levels: Iterable[int], asked_count: int):
+        """
+        Start generating candidate next questions for a session.
+        
+        Must be called from the event loop. Replaces any earlier prefetch
+        for the session.
+        
+        Args:
+            interview_id: Interview session identifier
+            request: generate_question arguments for the next question (level is replaced)
+            levels: Candidate levels
+            asked_count: Questions asked so far; the prefetch is only valid for the next one
+        """
+        self.discard(interview_id)
+        self._expire()
+        
+        if self.is_busy is not None and self.is_busy():
+            self.skipped_busy += 1
+            return
+        
+        entry = _Prefetch(asked_count, request["question_type"], asyncio.get_running_loop())
+        for level in levels:
+            entry.tasks[level] = asyncio.create_task(self.generate(**{**request, "level": level}))
+            self.generations += 1
+        
+        self._entries[interview_id] = entry
+        self.started += 1
+        
+        while len(self._entries) > self.max_sessions:
+            _, oldest = self._entries.popitem(last=False)
+            self._cancel(oldest.tasks.values())
+    
+    def settle(self, interview_id: str, level: Optional[int], asked_count: Optional[int] = None):
+        """
+        Keep only the candidate for the level that was chosen.
+        
+        Args:
+            interview_id: Interview session identifier
+            level: The session's new level, or None if no question follows
+            asked_count: If given, only settle a prefetch started at this question count
+                (a deferred evaluation may finish after the next prefetch started)
+        """
+        entry = self._entries.get(interview_id)
+        if entry is None or (asked_count is not None and entry.asked_count != asked_count):
+            return
+        
+        if level is None or level not in entry.tasks:
+            self.discard(interview_id)
+            return
+        
+        self._cancel(task for lvl, task in entry.tasks.items() if lvl != level)
+        entry.tasks = {level: entry.tasks[level]}
+    
+    async def take(self, interview_id: str, asked_count: int, level: int) -> Optional[Dict[str, Any]]:
+        """
+        Claim the prefetched question for a session, waiting if it is still being generated.
+        
+        Args:
+            interview_id: Interview session identifier
+            asked_count: Questions asked so far
+            level: Level the next question is for
+            
+        Returns:
+            Generated question (as from generate_question), or None on a miss
+        """
+        entry = self._entries.pop(interview_id, None)
+        task = None
+        if (entry is not None
+                and entry.asked_count == asked_count
+                and entry.loop is asyncio.get_running_loop()
+                and time.monotonic() - entry.created <= self.ttl):
+            task = entry.tasks.pop(level, None)
+        if entry is not None:
+            self._cancel(entry.tasks.values())
+        
+        if task is None:
+            self.misses += 1
+            return None
+        
+        ready = task.done()
+        if not ready:
+            # asyncio.wait leaves the task running if this request is cancelled
+            await asyncio.wait({task})
+        
+        if task.cancelled() or task.exception() is not None:
+            if not task.cancelled():
+                print(f"Prefetched question failed: {task.exception()}")
+            self.misses += 1
+            return None
+        
+        if ready:
+            self.hits += 1
+        else:
+            self.waited_hits += 1
+        return task.result()
+    
+    def question_type(self, interview_id: str, asked_count: int) -> Optional[str]:
+        """Question type the session's pending prefetch was generated for, if any."""
+        entry = self._entries.get(interview_id)
+        if entry is None or entry.asked_count != asked_count:
+            return None
+        return entry.question_type
+    
+    def discard(self, interview_id: str):
+        """Cancel and drop a session's prefetch (e.g. on restart or delete)."""
+        entry = self._entries.pop(interview_id, None)
+        if entry is not None:
+            self._cancel(entry.tasks.values())
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Prefetch usage and hit-rate counters."""
+        claims = self.hits + self.waited_hits + self.misses
+        return {
+            "sessions": len(self._entries),
+            "in_flight": sum(1 for e in self._entries.values() for t in e.tasks.values() if not t.done()),
+            "started": self.started,
+            "generations": self.generations,
+            "skipped_busy": self.skipped_busy,
+            "hits": self.hits,
+            "waited_hits": self.waited_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.waited_hits) / claims, 3) if claims else None,
+            "cancelled": self.cancelled,
+            "expired": self.expired
+        }
+    
+    def _expire(self):
+        """Drop prefetches older than the TTL (sessions are ordered oldest first)."""
+        now = time.monotonic()
+        while self._entries:
+            interview_id, entry = next(iter(self._entries.items()))
+            if now - entry.created <= self.ttl:
+                return
+            del self._entries[interview_id]
+            self._cancel(entry.tasks.values())
+            self.expired += 1
+    
+    def _cancel(self, tasks: Iterable[asyncio.Task]):
+        for task in list(tasks):
+            if task.done():
+                continue
+            try:
+                task.cancel()
+            except RuntimeError:
+                continue  # its event loop is already closed
+            self.cancelled += 1
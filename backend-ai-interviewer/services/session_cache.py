@@ -0,0 +1,304 @@
+"""
+In-memory cache of live interview sessions with write-behind persistence.
+
+The interview manager reads a session on every question and answer, a few
+seconds apart. Keeping recent sessions in a bounded LRU avoids reparsing
+and revalidating them each time, and write-behind coalesces the several
+saves of one turn into a single storage write.
+
+Durability modes:
+- "write_through": every put is saved before it returns (crash-safe, the
+  cache only saves reads)
+- "write_behind": puts mark the session dirty and a background thread saves
+  it within SESSION_FLUSH_INTERVAL seconds; a crash can lose that window.
+  Callers force a flush at turn boundaries that must survive (session
+  creation, completion) and on shutdown.
+
+A session can be pinned while a long-lived connection (the interview
+WebSocket) works on it: it is then never evicted, and the background
+flusher leaves it to the connection, which flushes at turn boundaries.
+
+The cache assumes each session is served by one process at a time (the
+multi-worker router keeps an interview on one worker). With revalidate on,
+every read also compares the storage backend's change stamp, so a session
+another worker saved meanwhile (after a failover) is reloaded instead of
+served stale.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+WRITE_THROUGH = "write_through"
+WRITE_BEHIND = "write_behind"
+DURABILITY_MODES = (WRITE_THROUGH, WRITE_BEHIND)
+
+
+class _Entry:
+    """One cached session and its persistence bookkeeping."""
+    
+    __slots__ = ("data", "version", "saved_version", "flush_lock", "stamp")
+    
+    def __init__(self, data: Dict[str, Any], dirty: bool, stamp: Any = None):
+        self.data = data
+        self.version = 1
+        self.saved_version = 0 if dirty else 1
+        self.flush_lock = threading.Lock()
+        self.stamp = stamp  # storage change stamp of the saved version
+    
+    @property
+    def dirty(self) -> bool:
+        return self.saved_version < self.version
+
+
+class SessionCache:
+    """Bounded LRU of interview sessions in front of a storage backend."""
+    
+    def __init__(self, storage, max_sessions: int = 256,
+                 durability: str = WRITE_BEHIND, flush_interval: float = 1.0,
+                 revalidate: bool = False):
+        """
+        Initialize cache and start the flusher thread (write-behind only).
+        
+        Args:
+            storage: StorageBackend sessions are loaded from and saved to
+            max_sessions: Maximum number of cached sessions
+            durability: "write_through" or "write_behind"
+            flush_interval: Seconds between background flushes
+            revalidate: Check cached sessions against storage on every read
+                (for several worker processes sharing the storage)
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability mode: {durability}")
+        
+        self.storage = storage
+        self.max_sessions = max_sessions
+        self.revalidate = revalidate
+        self.durability = durability
+        self.flush_interval = flush_interval
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._pins: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.flushes = 0
+        self.flush_errors = 0
+        self.stale = 0
+        
+        self._flusher = None
+        if durability == WRITE_BEHIND:
+            self._flusher = threading.Thread(target=self._flush_loop, name="session-flusher", daemon=True)
+            self._flusher.start()
+    
+    def get(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a private copy of a session, loading it from storage on a miss.
+        
+        Returns:
+            Interview data the caller may modify, or None if not found
+        """
+        stamp = self.storage.change_stamp(interview_id) if self.revalidate else None
+        with self._lock:
+            entry = self._entries.get(interview_id)
+            if entry is not None and self.revalidate and not entry.dirty and stamp is not None and entry.stamp != stamp:
+                # Saved by another process since we cached it
+                del self._entries[interview_id]
+                self.stale += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(interview_id)
+                self.hits += 1
+                return copy.deepcopy(entry.data)
+            self.misses += 1
+        
+        data = self.storage.load_interview(interview_id)
+        if data is None:
+            return None
+        
+        with self._lock:
+            # A put that raced with the load wins
+            if interview_id not in self._entries:
+                self._entries[interview_id] = _Entry(copy.deepcopy(data), dirty=False, stamp=stamp)
+        self._evict_overflow()
+        return data
+    
+    def put(self, interview_data: Dict[str, Any], flush: bool = False) -> bool:
+        """
+        Store a new version of a session.
+        
+        The cache keeps the dict; callers must not modify it afterwards.
+        
+        Args:
+            interview_data: Full interview data
+            flush: Save before returning regardless of durability mode
+            
+        Returns:
+            False only if a synchronous save failed
+        """
+        interview_id = interview_data["interview_id"]
+        with self._lock:
+            entry = self._entries.get(interview_id)
+            if entry is None:
+                self._entries[interview_id] = _Entry(interview_data, dirty=True)
+            else:
+                entry.data = interview_data
+                entry.version += 1
+                self._entries.move_to_end(interview_id)
+            self.writes += 1
+        
+        ok = True
+        if flush or self.durability == WRITE_THROUGH:
+            ok = self.flush(interview_id)
+        self._evict_overflow()
+        return ok
+    
+    def flush(self, interview_id: str) -> bool:
+        """
+        Save a session now if it has unsaved changes.
+        
+        Returns:
+            True if the session is clean afterwards
+        """
+        with self._lock:
+            entry = self._entries.get(interview_id)
+        if entry is None:
+            return True
+        
+        # Serialize flushes of one session so an older version never lands last
+        with entry.flush_lock:
+            with self._lock:
+                if self._entries.get(interview_id) is not entry:
+                    return True  # evicted (e.g. deleted) meanwhile; never save it back
+                data, version = entry.data, entry.version
+            if entry.saved_version >= version:
+                return True
+            
+            if not self.storage.save_interview(data):
+                self.flush_errors += 1
+                return False
+            
+            entry.saved_version = version
+            if self.revalidate:
+                entry.stamp = self.storage.change_stamp(interview_id)
+            self.flushes += 1
+            return True
+    
+    def flush_all(self, skip_pinned: bool = False) -> int:
+        """
+        Save every dirty session.
+        
+        Args:
+            skip_pinned: Leave pinned sessions to their connection
+            
+        Returns:
+            Number of sessions that failed to save
+        """
+        with self._lock:
+            dirty_ids = [i for i, e in self._entries.items()
+                         if e.dirty and not (skip_pinned and i in self._pins)]
+        return sum(0 if self.flush(i) else 1 for i in dirty_ids)
+    
+    def pin(self, interview_id: str):
+        """Keep a session cached until unpinned (pins are counted)."""
+        with self._lock:
+            self._pins[interview_id] = self._pins.get(interview_id, 0) + 1
+    
+    def unpin(self, interview_id: str, flush: bool = True) -> bool:
+        """
+        Release a pin, saving the session's unsaved changes first.
+        
+        Returns:
+            True if the session is clean afterwards (or was not flushed)
+        """
+        ok = self.flush(interview_id) if flush else True
+        with self._lock:
+            count = self._pins.get(interview_id, 0) - 1
+            if count > 0:
+                self._pins[interview_id] = count
+            else:
+                self._pins.pop(interview_id, None)
+        self._evict_overflow()
+        return ok
+    
+    def evict(self, interview_id: str, flush: bool = False):
+        """
+        Drop a session from the cache (e.g. after it was deleted or replaced
+        directly in storage).
+        
+        Args:
+            interview_id: Session to drop
+            flush: Save unsaved changes first
+        """
+        if flush:
+            self.flush(interview_id)
+        with self._lock:
+            entry = self._entries.pop(interview_id, None)
+        if entry is not None:
+            # Wait for a save already in progress, so none lands after the caller deletes the session
+            with entry.flush_lock:
+                pass
+    
+    def close(self):
+        """Stop the flusher and save everything (call on shutdown)."""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=self.flush_interval * 2)
+        failed = self.flush_all()
+        if failed:
+            print(f"Warning: {failed} session(s) could not be saved on shutdown")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size, hit rate and persistence counters."""
+        with self._lock:
+            size = len(self._entries)
+            dirty = sum(1 for e in self._entries.values() if e.dirty)
+            pinned = len(self._pins)
+        lookups = self.hits + self.misses
+        return {
+            "durability": self.durability,
+            "sessions": size,
+            "max_sessions": self.max_sessions,
+            "dirty": dirty,
+            "pinned": pinned,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "writes": self.writes,
+            "flushes": self.flushes,
+            "flush_errors": self.flush_errors,
+            "stale_reloads": self.stale
+        }
+    
+    def _evict_overflow(self):
+        """Evict least recently used sessions beyond max_sessions, saving dirty ones first."""
+        while True:
+            with self._lock:
+                if len(self._entries) <= self.max_sessions:
+                    return
+                interview_id, entry = next(
+                    ((i, e) for i, e in self._entries.items() if i not in self._pins), (None, None)
+                )
+                if entry is None:
+                    return  # everything beyond the bound is pinned
+                if not entry.dirty:
+                    del self._entries[interview_id]
+                    continue
+            
+            # Dirty: save outside the cache lock, then drop it unless it changed meanwhile
+            saved = self.flush(interview_id)
+            with self._lock:
+                if self._entries.get(interview_id) is entry and not entry.dirty:
+                    del self._entries[interview_id]
+                elif not saved:
+                    return  # keep it; the flusher retries and the next put evicts again
+    
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush_all(skip_pinned=True)
+            except Exception as e:
+                print(f"Error in session flusher: {e}")
@@ -0,0 +1,464 @@
+"""
+SQLite storage backend for interview session data.
+
+Sessions, questions and evaluations are rows in a single database opened in
+WAL mode, so readers never block the writer and several worker processes can
+share one file. Saving a session only writes the rows that changed: asking a
+question is one insert into questions, recording an answer one update of that
+question plus one insert into evaluations.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+try:
+    from backend.utils.config import StorageConfig
+    from backend.services.storage_backend import StorageBackend
+    from backend.services.locking import InterviewLocks
+except ImportError:
+    # Fallback for direct execution
+    import sys
+    sys.path.append(str(Path(__file__).parent.parent))
+    from utils.config import StorageConfig
+    from services.storage_backend import StorageBackend
+    from services.locking import InterviewLocks
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    interview_id TEXT PRIMARY KEY,
+    settings     TEXT NOT NULL,
+    state        TEXT NOT NULL,
+    summary      TEXT,
+    extra        TEXT NOT NULL DEFAULT '{}',
+    created_at   REAL NOT NULL,
+    updated_at   REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS questions (
+    interview_id TEXT NOT NULL REFERENCES sessions(interview_id) ON DELETE CASCADE,
+    position     INTEGER NOT NULL,
+    record       TEXT NOT NULL,
+    PRIMARY KEY (interview_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS evaluations (
+    interview_id  TEXT NOT NULL REFERENCES sessions(interview_id) ON DELETE CASCADE,
+    position      INTEGER NOT NULL,
+    overall_score REAL,
+    evaluation    TEXT NOT NULL,
+    created_at    REAL NOT NULL,
+    PRIMARY KEY (interview_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_sessions_created ON sessions(created_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions(updated_at);
+"""
+
+# Top-level session keys stored in their own columns or tables
+_SESSION_KEYS = ("interview_id", "settings", "questions", "state", "summary")
+
+_SORT_COLUMNS = {
+    "created": "created_at DESC",
+    "modified": "updated_at DESC",
+    "id": "interview_id ASC",
+}
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class SQLiteInterviewStorage(StorageBackend):
+    """
+    SQLite (WAL mode) storage manager for interview session data.
+    
+    Each thread gets its own connection; writes run in BEGIN IMMEDIATE
+    transactions and wait up to SQLITE_BUSY_TIMEOUT_MS for other writers.
+    """
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Initialize storage manager and create the schema if needed.
+        
+        Args:
+            db_path: SQLite database file (defaults to StorageConfig.SQLITE_PATH)
+        """
+        self.db_path = Path(db_path or StorageConfig.SQLITE_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        # Rows are protected by SQLite itself; these serialize callers' load-modify-save sequences
+        self.locks = InterviewLocks(self.db_path.parent / "locks",
+                                    stripes=StorageConfig.LOCK_STRIPES,
+                                    timeout=StorageConfig.LOCK_TIMEOUT,
+                                    file_locks=StorageConfig.FILE_LOCKS)
+        
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=StorageConfig.SQLITE_BUSY_TIMEOUT_MS / 1000,
+                isolation_level=None,  # transactions are managed explicitly
+                check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute(f"PRAGMA busy_timeout={int(StorageConfig.SQLITE_BUSY_TIMEOUT_MS)}")
+            self._local.conn = conn
+        return conn
+    
+    @contextmanager
+    def _transaction(self, mode: str = "IMMEDIATE"):
+        """
+        Run a block in a transaction, rolling back on error.
+        
+        IMMEDIATE (the default) takes the write lock up front; DEFERRED gives
+        a read transaction that sees one consistent snapshot of the database.
+        """
+        conn = self._connection()
+        conn.execute(f"BEGIN {mode}")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+    
+    def save_interview(self,
+                       interview_data: Dict[str, Any],
+                       created_at: Optional[float] = None,
+                       updated_at: Optional[float] = None) -> bool:
+        """
+        Save interview session data, writing only rows that changed.
+        
+        Args:
+            interview_data: Interview session dictionary
+            created_at: Creation time to record instead of now (migrations);
+                an earlier stored creation time is kept
+            updated_at: Last change time to record instead of now (migrations)
+            
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        interview_id = interview_data.get("interview_id")
+        try:
+            if not interview_id:
+                raise ValueError("Interview data must contain 'interview_id'")
+            
+            now = updated_at if updated_at is not None else time.time()
+            created = created_at if created_at is not None else now
+            extra = {k: v for k, v in interview_data.items() if k not in _SESSION_KEYS}
+            summary = interview_data.get("summary")
+            
+            # Split each question into its record and its evaluation
+            records = []
+            evaluations = {}
+            for position, question in enumerate(interview_data.get("questions") or []):
+                record = dict(question)
+                evaluation = record.get("evaluation")
+                if "evaluation" in record:
+                    record["evaluation"] = None
+                records.append(_dumps(record))
+                if evaluation is not None:
+                    evaluations[position] = evaluation
+            
+            with self._transaction() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO sessions (interview_id, settings, state, summary, extra, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(interview_id) DO UPDATE SET
+                        settings = excluded.settings,
+                        state = excluded.state,
+                        summary = excluded.summary,
+                        extra = excluded.extra,
+                        created_at = MIN(sessions.created_at, excluded.created_at),
+                        updated_at = excluded.updated_at
+                    """,
+                    (
+                        interview_id,
+                        _dumps(interview_data.get("settings") or {}),
+                        _dumps(interview_data.get("state") or {}),
+                        _dumps(summary) if summary is not None else None,
+                        _dumps(extra),
+                        created,
+                        now
+                    )
+                )
+                
+                # Questions: insert new positions, rewrite changed ones, drop removed ones
+                existing = dict(conn.execute(
+                    "SELECT position, record FROM questions WHERE interview_id = ?",
+                    (interview_id,)
+                ).fetchall())
+                changed = [
+                    (interview_id, position, record)
+                    for position, record in enumerate(records)
+                    if existing.get(position) != record
+                ]
+                if changed:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO questions (interview_id, position, record) VALUES (?, ?, ?)",
+                        changed
+                    )
+                if len(existing) > len(records):
+                    conn.execute(
+                        "DELETE FROM questions WHERE interview_id = ? AND position >= ?",
+                        (interview_id, len(records))
+                    )
+                
+                # Evaluations: same diff, keyed by question position
+                existing = dict(conn.execute(
+                    "SELECT position, evaluation FROM evaluations WHERE interview_id = ?",
+                    (interview_id,)
+                ).fetchall())
+                changed = []
+                for position, evaluation in evaluations.items():
+                    serialized = _dumps(evaluation)
+                    if existing.get(position) != serialized:
+                        score = evaluation.get("overall_score") if isinstance(evaluation, dict) else None
+                        changed.append((interview_id, position, score, serialized, now))
+                if changed:
+                    conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO evaluations (interview_id, position, overall_score, evaluation, created_at)
+                        VALUES (?, ?, ?, ?, ?)
+                        """,
+                        changed
+                    )
+                removed = [(interview_id, p) for p in existing if p not in evaluations]
+                if removed:
+                    conn.executemany(
+                        "DELETE FROM evaluations WHERE interview_id = ? AND position = ?",
+                        removed
+                    )
+            
+            return True
+        
+        except Exception as e:
+            print(f"Error saving interview {interview_id}: {e}")
+            return False
+    
+    def load_interview(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load interview session data.
+        
+        Args:
+            interview_id: Unique interview identifier
+            
+        Returns:
+            Interview data dictionary or None if not found
+        """
+        try:
+            # One read transaction, so a concurrent save cannot land between the SELECTs
+            with self._transaction("DEFERRED") as conn:
+                row = conn.execute(
+                    "SELECT settings, state, summary, extra FROM sessions WHERE interview_id = ?",
+                    (interview_id,)
+                ).fetchone()
+                if row is None:
+                    return None
+                
+                settings, state, summary, extra = row
+                evaluations = dict(conn.execute(
+                    "SELECT position, evaluation FROM evaluations WHERE interview_id = ?",
+                    (interview_id,)
+                ).fetchall())
+                records = conn.execute(
+                    "SELECT position, record FROM questions WHERE interview_id = ? ORDER BY position",
+                    (interview_id,)
+                ).fetchall()
+            
+            questions = []
+            for position, record in records:
+                question = json.loads(record)
+                if position in evaluations:
+                    question["evaluation"] = json.loads(evaluations[position])
+                questions.append(question)
+            
+            data = {
+                "interview_id": interview_id,
+                "settings": json.loads(settings),
+                "questions": questions,
+                "state": json.loads(state),
+                "summary": json.loads(summary) if summary is not None else None,
+            }
+            data.update(json.loads(extra))
+            return data
+        
+        except Exception as e:
+            print(f"Error loading interview {interview_id}: {e}")
+            return None
+    
+    def delete_interview(self, interview_id: str) -> bool:
+        """
+        Delete interview session and its questions and evaluations.
+        
+        Args:
+            interview_id: Unique interview identifier
+            
+        Returns:
+            True if deleted successfully, False otherwise
+        """
+        try:
+            with self.interview_lock(interview_id):
+                with self._transaction() as conn:
+                    cursor = conn.execute("DELETE FROM sessions WHERE interview_id = ?", (interview_id,))
+                if cursor.rowcount == 0:
+                    return False
+                self.locks.remove(interview_id)
+            return True
+        
+        except Exception as e:
+            print(f"Error deleting interview {interview_id}: {e}")
+            return False
+    
+    def list_interviews(self,
+                        limit: Optional[int] = None,
+                        sort_by: str = "created",
+                        include_summary: bool = False,
+                        offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        List available interview sessions.
+        
+        Sorting and paging walk the created/updated indexes in SQL, and the
+        metadata is extracted only for the returned rows.
+        
+        Args:
+            limit: Maximum number of interviews to return
+            sort_by: Sort criteria ("created", "modified", "id")
+            include_summary: Whether to include interview summaries
+            offset: Number of interviews to skip (pagination)
+            
+        Returns:
+            List of interview metadata
+        """
+        try:
+            order = _SORT_COLUMNS.get(sort_by, _SORT_COLUMNS["created"])
+            query = f"""
+                SELECT s.interview_id, s.created_at, s.updated_at,
+                       length(s.settings) + length(s.state) + ifnull(length(s.summary), 0),
+                       json_extract(s.settings, '$.job_title'),
+                       json_extract(s.settings, '$.num_questions'),
+                       json_extract(s.state, '$.current_level'),
+                       s.summary IS NOT NULL,
+                       json_extract(s.summary, '$.overall_score'),
+                       json_extract(s.summary, '$.completed_at'),
+                       (SELECT count(*) FROM questions q WHERE q.interview_id = s.interview_id)
+                FROM sessions s
+                ORDER BY {order}
+                LIMIT ? OFFSET ?
+            """
+            params = (int(limit) if limit else -1, int(offset))
+            
+            interviews = []
+            for (interview_id, created_at, updated_at, size, job_title, num_questions, current_level,
+                 is_complete, summary_score, completed_at, questions_answered) in self._connection().execute(query, params):
+                metadata = {
+                    "interview_id": interview_id,
+                    "created": datetime.fromtimestamp(created_at).isoformat(),
+                    "modified": datetime.fromtimestamp(updated_at).isoformat(),
+                    "size_bytes": size
+                }
+                if include_summary:
+                    metadata.update({
+                        "job_title": job_title,
+                        "num_questions": num_questions,
+                        "questions_answered": questions_answered,
+                        "current_level": current_level,
+                        "is_complete": bool(is_complete),
+                        "summary_score": summary_score,
+                        "completed_at": completed_at
+                    })
+                interviews.append(metadata)
+            
+            return interviews
+        
+        except Exception as e:
+            print(f"Error listing interviews: {e}")
+            return []
+    
+    def load_summary(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the final summary of an interview without loading its transcript.
+        
+        Args:
+            interview_id: Unique interview identifier
+            
+        Returns:
+            Summary dictionary, or None if not found or not completed
+        """
+        row = self._connection().execute(
+            "SELECT summary FROM sessions WHERE interview_id = ?", (interview_id,)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])
+    
+    def exists(self, interview_id: str) -> bool:
+        """
+        Check if interview session exists.
+        
+        Args:
+            interview_id: Unique interview identifier
+            
+        Returns:
+            True if interview exists, False otherwise
+        """
+        row = self._connection().execute(
+            "SELECT 1 FROM sessions WHERE interview_id = ?", (interview_id,)
+        ).fetchone()
+        return row is not None
+    
+    def change_stamp(self, interview_id: str) -> Optional[Any]:
+        """The session's updated_at (one indexed lookup)."""
+        try:
+            row = self._connection().execute(
+                "SELECT updated_at FROM sessions WHERE interview_id = ?", (interview_id,)
+            ).fetchone()
+            return row[0] if row else None
+        except Exception as e:
+            print(f"Error reading change stamp of {interview_id}: {e}")
+            return None
+    
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """
+        Get storage usage statistics.
+        
+        Returns:
+            Dictionary with storage statistics
+        """
+        try:
+            conn = self._connection()
+            interviews_count = conn.execute("SELECT count(*) FROM sessions").fetchone()[0]
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            total_size = page_count * page_size
+            
+            wal_path = Path(f"{self.db_path}-wal")
+            wal_size = wal_path.stat().st_size if wal_path.exists() else 0
+            
+            return {
+                "interviews_count": interviews_count,
+                "total_size_bytes": total_size,
+                "total_size_mb": round(total_size / (1024 * 1024), 2),
+                "wal_size_bytes": wal_size,
+                "backup_count": 0,
+                "backup_size_bytes": 0,
+                "storage_backend": "sqlite",
+                "database_path": str(self.db_path)
+            }
+        
+        except Exception as e:
+            print(f"Error getting storage stats: {e}")
+            return {"error": str(e)}
@@ -2,12 +2,17 @@
 Storage utilities for interview data persistence.
 
 This module handles saving, loading, and managing interview session data
-in JSON format. Provides thread-safe operations and backup functionality.
+in JSON format. Provides thread-safe operations and an append-only change
+journal per interview (services/journal.py) for recovery and history.
+The backend used by the application is selected by StorageConfig.BACKEND
+(see get_storage); services/sqlite_storage.py provides the SQLite backend.
 """
 
+import copy
 import json
 import os
-import shutil
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -15,26 +20,43 @@ import threading
 from contextlib import contextmanager
 
 try:
-    from backend.utils.config import InterviewConfig
+    from backend.utils.config import InterviewConfig, StorageConfig
     from backend.utils.id_utils import get_interview_filename, sanitize_filename
+    from backend.services.storage_backend import StorageBackend
+    from backend.services import journal as journal_events
+    from backend.services.journal import InterviewJournal
+    from backend.services.metadata_index import MetadataIndex, build_entry
+    from backend.services.locking import InterviewLocks
 except ImportError:
     # Fallback for direct execution
     import sys
     sys.path.append(str(Path(__file__).parent.parent))
-    from utils.config import InterviewConfig
+    from utils.config import InterviewConfig, StorageConfig
     from utils.id_utils import get_interview_filename, sanitize_filename
+    from services.storage_backend import StorageBackend
+    from services import journal as journal_events
+    from services.journal import InterviewJournal
+    from services.metadata_index import MetadataIndex, build_entry
+    from services.locking import InterviewLocks
 
 
-class InterviewStorage:
+class InterviewStorage(StorageBackend):
     """
-    Thread-safe storage manager for interview session data.
+    Thread-safe JSON file storage manager for interview session data.
     
     Handles:
     - JSON serialization/deserialization
     - File system operations
-    - Backup creation
+    - Change journal and snapshot compaction
     - Data validation
     - Concurrent access protection
+    
+    Each save appends the changes since the last save to the interview's
+    journal. The <interview_id>.json snapshot is only rewritten when a
+    session is created or completed and after every JOURNAL_COMPACT_EVERY
+    events; loading reads the snapshot and replays the events after it.
+    Each compaction closes the journal as a segment and starts a new one,
+    so loads replay at most JOURNAL_COMPACT_EVERY events.
     """
     
     def __init__(self, storage_dir: Optional[Path] = None):
@@ -46,25 +68,73 @@ class InterviewStorage:
         """
         self.storage_dir = storage_dir or InterviewConfig.INTERVIEWS_DIR
         self.storage_dir.mkdir(parents=True, exist_ok=True)
-        self._lock = threading.RLock()  # Reentrant lock for nested operations
+        # Per-interview locks: striped in-process plus advisory file locks across workers
+        self.locks = InterviewLocks(self.storage_dir / "locks",
+                                    stripes=StorageConfig.LOCK_STRIPES,
+                                    timeout=StorageConfig.LOCK_TIMEOUT,
+                                    file_locks=StorageConfig.FILE_LOCKS)
         
-        # Create backup directory
+        # Backups written before the journal existed; only counted and cleaned up
         self.backup_dir = self.storage_dir / "backups"
         self.backup_dir.mkdir(exist_ok=True)
+        
+        # Running storage counters, kept current on every write so stats are O(1)
+        self._counters = {
+            "interviews_count": 0,
+            "total_size_bytes": 0,
+            "backup_count": 0,
+            "backup_size_bytes": 0,
+            "journal_count": 0,
+            "journal_size_bytes": 0,
+        }
+        self._counters_lock = threading.Lock()
+        self._stats_reconciled_at: Optional[str] = None
+        
+        self.journal = InterviewJournal(self.storage_dir / "journal",
+                                        fsync=StorageConfig.JOURNAL_FSYNC,
+                                        on_change=self._count_journal)
+        
+        # Last persisted state per interview (LRU), diffed against on save
+        self._persisted: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._persisted_lock = threading.Lock()
+        # Journal events since each interview's last snapshot
+        self._uncompacted: Dict[str, int] = {}
+        
+        # Listing and summary metadata, so those never open interview files
+        self.index = MetadataIndex(self.storage_dir / "index" / "metadata.json",
+                                   flush_delay=StorageConfig.INDEX_FLUSH_DELAY)
+        self._reconcile_index()
+        
+        self.reconcile_stats()
+        self._stop_reconciler = threading.Event()
+        if StorageConfig.STATS_RECONCILE_INTERVAL > 0:
+            threading.Thread(target=self._stats_reconciler, name="storage-stats", daemon=True).start()
     
     @contextmanager
-    def _file_lock(self):
-        """Context manager for thread-safe file operations."""
-        with self._lock:
+    def interview_lock(self, interview_id: str):
+        """
+        Hold one interview's lock, dropping cached state another process made stale.
+        
+        Reentrant, so callers can hold it around a load-modify-save sequence.
+        Unrelated interviews do not contend; listing and stats take no lock.
+        """
+        with self.locks.lock(interview_id):
+            if not self.journal.is_current(interview_id):
+                self.journal.forget(interview_id)
+                with self._persisted_lock:
+                    self._persisted.pop(interview_id, None)
             yield
     
     def save_interview(self, interview_data: Dict[str, Any]) -> bool:
         """
-        Save interview session data to JSON file.
+        Save interview session data.
+        
+        Appends the changes to the interview's journal and compacts them
+        into the JSON snapshot when due.
         
         Args:
             interview_data: Interview session dictionary
-        
+            
         Returns:
             True if saved successfully, False otherwise
         """
@@ -73,48 +143,51 @@ class InterviewStorage:
             if not interview_id:
                 raise ValueError("Interview data must contain 'interview_id'")
             
-            filename = get_interview_filename(interview_id)
-            filepath = self.storage_dir / filename
-            
-            with self._file_lock():
-                # Create backup if file exists
-                if filepath.exists():
-                    self._create_backup(filepath)
+            with self.interview_lock(interview_id):
+                previous = self._last_persisted(interview_id)
+                events = journal_events.diff_events(previous, interview_data)
+                if not events:
+                    return True
                 
-                # Save with atomic write
-                temp_filepath = filepath.with_suffix('.tmp')
-                with open(temp_filepath, 'w', encoding='utf-8') as f:
-                    json.dump(interview_data, f, indent=2, ensure_ascii=False)
+                # Sessions saved before the journal existed start with a full baseline
+                if previous is not None and not self.journal.exists(interview_id):
+                    events.insert(0, {"type": journal_events.SNAPSHOT_REPLACED, "data": previous})
                 
-                # Atomic rename
-                temp_filepath.replace(filepath)
+                seq = self.journal.append(interview_id, events)
+                self._remember(interview_id, interview_data)
+                
+                pending = self._uncompacted.get(interview_id, 0) + len(events)
+                self._uncompacted[interview_id] = pending
+                completed = any(e["type"] == journal_events.SUMMARY_RECORDED for e in events)
+                snapshot_size = None
+                if previous is None or completed or pending >= StorageConfig.JOURNAL_COMPACT_EVERY:
+                    snapshot_size = self._write_snapshot(interview_id, interview_data, seq,
+                                                         new_segment=previous is not None)
+                
+                self._index_entry(interview_data, is_new=previous is None, snapshot_size=snapshot_size)
             
             return True
-            
+        
         except Exception as e:
             print(f"Error saving interview {interview_id}: {e}")
             return False
     
     def load_interview(self, interview_id: str) -> Optional[Dict[str, Any]]:
         """
-        Load interview session data from JSON file.
+        Load interview session data (snapshot plus newer journal events).
         
         Args:
             interview_id: Unique interview identifier
-        
+            
         Returns:
             Interview data dictionary or None if not found
         """
         try:
-            filename = get_interview_filename(interview_id)
-            filepath = self.storage_dir / filename
-            
-            if not filepath.exists():
-                return None
-            
-            with self._file_lock():
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            with self.interview_lock(interview_id):
+                data = self._read_current(interview_id)
+                if data is None:
+                    return None
+                self._remember(interview_id, data)
             
             # Validate loaded data
             if not self._validate_interview_data(data):
@@ -122,7 +195,7 @@ class InterviewStorage:
                 return None
             
             return data
-            
+        
         except Exception as e:
             print(f"Error loading interview {interview_id}: {e}")
             return None
@@ -131,9 +204,12 @@ class InterviewStorage:
         """
         Delete interview session file.
         
+        The journal stays until cleanup_old_backups, so a deleted session
+        can still be reconstructed.
+        
         Args:
             interview_id: Unique interview identifier
-        
+            
         Returns:
             True if deleted successfully, False otherwise
         """
@@ -141,16 +217,23 @@ class InterviewStorage:
             filename = get_interview_filename(interview_id)
             filepath = self.storage_dir / filename
             
-            if not filepath.exists():
-                return False
-            
-            with self._file_lock():
-                # Create backup before deletion
-                self._create_backup(filepath)
+            with self.interview_lock(interview_id):
+                if not filepath.exists():
+                    return False
+                
+                # The journal is kept so the session can still be reconstructed
+                self.journal.append(interview_id, [{"type": journal_events.SESSION_DELETED}])
+                size = filepath.stat().st_size
                 filepath.unlink()
+                self._count(interviews_count=-1, total_size_bytes=-size)
+                self.index.remove(interview_id)
+                with self._persisted_lock:
+                    self._persisted.pop(interview_id, None)
+                self._uncompacted.pop(interview_id, None)
+                self.locks.remove(interview_id)
             
             return True
-            
+        
         except Exception as e:
             print(f"Error deleting interview {interview_id}: {e}")
             return False
@@ -158,79 +241,52 @@ class InterviewStorage:
     def list_interviews(self, 
                        limit: Optional[int] = None,
                        sort_by: str = "created",
-                       include_summary: bool = False) -> List[Dict[str, Any]]:
+                       include_summary: bool = False,
+                       offset: int = 0) -> List[Dict[str, Any]]:
         """
         List available interview sessions.
         
+        Served from the metadata index; no interview file is read.
+        
         Args:
             limit: Maximum number of interviews to return
             sort_by: Sort criteria ("created", "modified", "id")
             include_summary: Whether to include interview summaries
-        
+            offset: Number of interviews to skip (pagination)
+            
         Returns:
             List of interview metadata
         """
         try:
-            with self._file_lock():
-                interviews = []
-                
-                for filepath in self.storage_dir.glob("*.json"):
-                    if filepath.name.startswith("backup_"):
-                        continue  # Skip backup files
-                    
-                    try:
-                        stat = filepath.stat()
-                        metadata = {
-                            "interview_id": filepath.stem,
-                            "filename": filepath.name,
-                            "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                            "size_bytes": stat.st_size
-                        }
-                        
-                        if include_summary:
-                            # Load basic info without full data
-                            data = self.load_interview(filepath.stem)
-                            if data:
-                                metadata.update({
-                                    "job_title": data.get("settings", {}).get("job_title"),
-                                    "num_questions": data.get("settings", {}).get("num_questions"),
-                                    "questions_answered": len(data.get("questions", [])),
-                                    "current_level": data.get("state", {}).get("current_level"),
-                                    "is_complete": data.get("summary") is not None
-                                })
-                        
-                        interviews.append(metadata)
-                        
-                    except Exception as e:
-                        print(f"Error reading metadata for {filepath}: {e}")
-                        continue
-                
-                # Sort interviews
-                if sort_by == "created":
-                    interviews.sort(key=lambda x: x["created"], reverse=True)
-                elif sort_by == "modified":
-                    interviews.sort(key=lambda x: x["modified"], reverse=True)
-                elif sort_by == "id":
-                    interviews.sort(key=lambda x: x["interview_id"])
-                
-                # Apply limit
-                if limit:
-                    interviews = interviews[:limit]
-                
-                return interviews
-                
+            return self.index.query(limit=limit, offset=offset, sort_by=sort_by,
+                                    include_summary=include_summary)
+        
         except Exception as e:
             print(f"Error listing interviews: {e}")
             return []
     
+    def load_summary(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the final summary of an interview without loading its transcript.
+        
+        Args:
+            interview_id: Unique interview identifier
+            
+        Returns:
+            Summary dictionary, or None if not found or not completed
+        """
+        entry = self.index.get(interview_id)
+        if entry is None:
+            return None
+        return copy.deepcopy(entry.get("summary"))
+    
     def exists(self, interview_id: str) -> bool:
         """
         Check if interview session exists.
         
         Args:
             interview_id: Unique interview identifier
-        
+            
         Returns:
             True if interview exists, False otherwise
         """
@@ -238,181 +294,307 @@ class InterviewStorage:
         filepath = self.storage_dir / filename
         return filepath.exists()
     
+    def change_stamp(self, interview_id: str) -> Optional[Any]:
+        """Size and mtime of the interview's journal and snapshot (every save appends to the journal)."""
+        marks = []
+        for filepath in (self.journal.path(interview_id), self.storage_dir / get_interview_filename(interview_id)):
+            try:
+                stat = filepath.stat()
+                marks.append((stat.st_size, stat.st_mtime_ns))
+            except FileNotFoundError:
+                marks.append(None)
+        return tuple(marks)
+    
     def get_storage_stats(self) -> Dict[str, Any]:
         """
         Get storage usage statistics.
         
+        Reads the running counters (no file system access); a background
+        thread re-scans the directory every STATS_RECONCILE_INTERVAL seconds
+        to correct any drift.
+        
         Returns:
             Dictionary with storage statistics
         """
+        with self._counters_lock:
+            stats = dict(self._counters)
+        
+        stats.update({
+            "total_size_mb": round(stats["total_size_bytes"] / (1024 * 1024), 2),
+            "storage_backend": "json",
+            "storage_directory": str(self.storage_dir),
+            "backup_directory": str(self.backup_dir),
+            "stats_reconciled_at": self._stats_reconciled_at
+        })
+        return stats
+    
+    def reconcile_stats(self) -> Dict[str, int]:
+        """
+        Recount storage usage from the files on disk and reset the counters.
+        
+        The scan runs without the storage lock so it never blocks saves; a
+        write racing with it is off by at most that write until the next scan.
+        
+        Returns:
+            Counter values found by the scan
+        """
         try:
-            with self._file_lock():
-                total_files = 0
-                total_size = 0
-                backup_files = 0
-                backup_size = 0
-                
-                # Count main files
-                for filepath in self.storage_dir.glob("*.json"):
-                    if not filepath.name.startswith("backup_"):
-                        total_files += 1
-                        total_size += filepath.stat().st_size
-                
-                # Count backup files
-                for filepath in self.backup_dir.glob("backup_*.json"):
-                    backup_files += 1
-                    backup_size += filepath.stat().st_size
-                
-                return {
-                    "interviews_count": total_files,
-                    "total_size_bytes": total_size,
-                    "total_size_mb": round(total_size / (1024 * 1024), 2),
-                    "backup_count": backup_files,
-                    "backup_size_bytes": backup_size,
-                    "storage_directory": str(self.storage_dir),
-                    "backup_directory": str(self.backup_dir)
-                }
-                
+            scanned = dict.fromkeys(self._counters, 0)
+            
+            # Count main files
+            for filepath in self.storage_dir.glob("*.json"):
+                if not filepath.name.startswith("backup_"):
+                    scanned["interviews_count"] += 1
+                    scanned["total_size_bytes"] += filepath.stat().st_size
+            
+            # Count legacy backup files
+            for filepath in self.backup_dir.glob("backup_*.json"):
+                scanned["backup_count"] += 1
+                scanned["backup_size_bytes"] += filepath.stat().st_size
+            
+            journal_files = list(self.journal.journal_dir.glob("*.jsonl"))
+            journal_files += self.journal.segment_dir.glob("*.jsonl")
+            for filepath in journal_files:
+                scanned["journal_count"] += 1
+                scanned["journal_size_bytes"] += filepath.stat().st_size
+            
+            with self._counters_lock:
+                self._counters.update(scanned)
+            self._stats_reconciled_at = datetime.now().isoformat()
+            return scanned
+        
         except Exception as e:
-            print(f"Error getting storage stats: {e}")
-            return {"error": str(e)}
+            # Files can disappear mid-scan; keep the running counters
+            print(f"Error reconciling storage stats: {e}")
+            return {}
     
     def cleanup_old_backups(self, keep_days: int = 7) -> int:
         """
-        Clean up old backup files.
+        Clean up old backup files, journals of deleted interviews and lock
+        files of interviews that no longer exist.
         
         Args:
             keep_days: Number of days to keep backups
-        
+            
         Returns:
-            Number of backups deleted
+            Number of files deleted
         """
         try:
             cutoff_time = datetime.now().timestamp() - (keep_days * 24 * 3600)
             deleted_count = 0
             
-            with self._file_lock():
-                for backup_file in self.backup_dir.glob("backup_*.json"):
-                    if backup_file.stat().st_mtime < cutoff_time:
-                        backup_file.unlink()
+            for backup_file in self.backup_dir.glob("backup_*.json"):
+                stat = backup_file.stat()
+                if stat.st_mtime < cutoff_time:
+                    backup_file.unlink()
+                    self._count(backup_count=-1, backup_size_bytes=-stat.st_size)
+                    deleted_count += 1
+            
+            interview_ids = {path.stem for path in self.journal.journal_dir.glob("*.jsonl")}
+            interview_ids |= {path.name.split(".")[0] for path in self.journal.segment_dir.glob("*.jsonl")}
+            for interview_id in interview_ids:
+                with self.interview_lock(interview_id):
+                    if self.exists(interview_id) or not self.journal.exists(interview_id):
+                        continue
+                    journal_file = self.journal.path(interview_id)
+                    if not journal_file.exists():
+                        journal_file = self.journal.segment_paths(interview_id)[-1]
+                    if journal_file.stat().st_mtime < cutoff_time:
+                        self.journal.delete(interview_id)
                         deleted_count += 1
             
+            deleted_count += self.locks.prune(self.exists)
             return deleted_count
-            
+        
         except Exception as e:
             print(f"Error cleaning up backups: {e}")
             return 0
     
-    def _create_backup(self, filepath: Path) -> bool:
+    def get_history(self, interview_id: str) -> List[Dict[str, Any]]:
         """
-        Create backup of existing file.
+        List the journal events of an interview without their payloads.
         
         Args:
-            filepath: Path to file to backup
-        
+            interview_id: Unique interview identifier
+            
         Returns:
-            True if backup created successfully
+            List of {"seq", "ts", "type"} entries (plus position or level change)
         """
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"backup_{timestamp}_{filepath.name}"
-            backup_path = self.backup_dir / backup_name
-            
-            shutil.copy2(filepath, backup_path)
-            return True
-            
-        except Exception as e:
-            print(f"Error creating backup for {filepath}: {e}")
-            return False
+        with self.interview_lock(interview_id):
+            events = self.journal.read_all(interview_id)
+        
+        history = []
+        for event in events:
+            entry = {"seq": event["seq"], "ts": event["ts"], "type": event["type"]}
+            for key in ("position", "from", "to", "covers"):
+                if key in event:
+                    entry[key] = event[key]
+            history.append(entry)
+        return history
     
-    def _validate_interview_data(self, data: Dict[str, Any]) -> bool:
+    def reconstruct_interview(self,
+                              interview_id: str,
+                              seq: Optional[int] = None,
+                              at: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
-        Validate interview data structure.
+        Rebuild an interview as it was at a journal position or point in time.
         
-        Args:
-            data: Interview data to validate
+        Works for deleted interviews as long as their journal is kept.
         
+        Args:
+            interview_id: Unique interview identifier
+            seq: Include events up to and including this seq
+            at: Include events recorded at or before this Unix timestamp
+            
         Returns:
-            True if data structure is valid
-        """
-        required_fields = ["interview_id", "settings", "questions", "state"]
-        
-        # Check required top-level fields
-        for field in required_fields:
-            if field not in data:
-                return False
-        
-        # Validate settings
-        settings = data["settings"]
-        settings_required = ["job_title", "num_questions", "soft_pct", "initial_level", "keywords"]
-        for field in settings_required:
-            if field not in settings:
-                return False
-        
-        # Validate state
-        state = data["state"]
-        state_required = ["current_level", "asked_count", "recent_scores"]
-        for field in state_required:
-            if field not in state:
-                return False
-        
-        return True
-    
-    def export_interview(self, interview_id: str, export_path: Path) -> bool:
+            Interview data, or None if the session did not exist at that point
         """
-        Export interview data to specified location.
+        with self.interview_lock(interview_id):
+            events = self.journal.read_all(interview_id)
+        return journal_events.replay(events, upto_seq=seq, upto_time=at)
+    
+    def _read_current(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        """Read the snapshot and replay the journal events it does not cover."""
+        filepath = self.storage_dir / get_interview_filename(interview_id)
+        if not filepath.exists():
+            return None
         
-        Args:
-            interview_id: Interview to export
-            export_path: Destination file path
+        with open(filepath, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
         
-        Returns:
-            True if exported successfully
+        events = self.journal.read(interview_id)
+        covered = 0
+        for event in events:
+            if event["type"] == journal_events.SNAPSHOT_WRITTEN:
+                covered = event["covers"]
+        tail = [e for e in events if e["seq"] > covered and e["type"] != journal_events.SNAPSHOT_WRITTEN]
+        self._uncompacted[interview_id] = len(tail)
+        
+        return journal_events.replay(tail, base=snapshot)
+    
+    def _last_persisted(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        """Last persisted state of an interview, from the LRU or from disk."""
+        with self._persisted_lock:
+            if interview_id in self._persisted:
+                self._persisted.move_to_end(interview_id)
+                return self._persisted[interview_id]
+        return self._read_current(interview_id)
+    
+    def _remember(self, interview_id: str, data: Dict[str, Any]):
+        """Keep a private copy of the persisted state for the next diff."""
+        snapshot = copy.deepcopy(data)
+        with self._persisted_lock:
+            self._persisted[interview_id] = snapshot
+            self._persisted.move_to_end(interview_id)
+            while len(self._persisted) > StorageConfig.JOURNAL_CACHE_SIZE:
+                self._persisted.popitem(last=False)
+    
+    def _write_snapshot(self, interview_id: str, interview_data: Dict[str, Any], seq: int,
+                        new_segment: bool = True) -> int:
         """
-        try:
-            data = self.load_interview(interview_id)
-            if not data:
-                return False
-            
-            export_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error exporting interview {interview_id}: {e}")
-            return False
+        Compact the journal into the JSON snapshot and return its size in bytes.
+        
+        The snapshot is written before the marker recording the seq it
+        covers; after a crash in between, the replayed events are already
+        in the snapshot and re-applying them changes nothing. With
+        new_segment the marker starts a new journal segment (see
+        InterviewJournal.start_segment); a new session's one-event journal
+        just gets the marker appended.
+        """
+        filepath = self.storage_dir / get_interview_filename(interview_id)
+        existing = self.index.get(interview_id)
+        old_size = existing["size_bytes"] if existing is not None and filepath.exists() else None
+        
+        # Save with atomic write
+        temp_filepath = filepath.with_suffix('.tmp')
+        with open(temp_filepath, 'w', encoding='utf-8') as f:
+            json.dump(interview_data, f, indent=2, ensure_ascii=False)
+        
+        # Atomic rename
+        temp_filepath.replace(filepath)
+        
+        if new_segment:
+            self.journal.start_segment(interview_id, covers=seq)
+        else:
+            self.journal.append(interview_id, [{"type": journal_events.SNAPSHOT_WRITTEN, "covers": seq}])
+        self._uncompacted[interview_id] = 0
+        
+        size = filepath.stat().st_size
+        if old_size is None:
+            self._count(interviews_count=1, total_size_bytes=size)
+        else:
+            self._count(total_size_bytes=size - old_size)
+        return size
+    
+    def _count(self, **deltas: int):
+        """Apply deltas to the running storage counters."""
+        with self._counters_lock:
+            for key, delta in deltas.items():
+                self._counters[key] += delta
+    
+    def _count_journal(self, files: int, size: int):
+        self._count(journal_count=files, journal_size_bytes=size)
     
-    def import_interview(self, import_path: Path) -> Optional[str]:
+    def _stats_reconciler(self):
         """
-        Import interview data from file.
+        Background loop re-scanning the storage directory.
         
-        Args:
-            import_path: Path to interview file to import
+        Also picks up sessions other worker processes created or changed,
+        since the index and counters are per process.
+        """
+        while not self._stop_reconciler.wait(StorageConfig.STATS_RECONCILE_INTERVAL):
+            self.reconcile_stats()
+            self._reconcile_index()
+    
+    def _index_entry(self, interview_data: Dict[str, Any], is_new: bool, snapshot_size: Optional[int]):
+        """Refresh an interview's metadata index entry after a save."""
+        interview_id = interview_data["interview_id"]
+        existing = self.index.get(interview_id)
+        if existing is not None and not is_new:
+            created, size = existing["created"], existing["size_bytes"]
+        else:
+            created, size = datetime.now().isoformat(), 0
+        if snapshot_size is not None:
+            size = snapshot_size
+        self.index.put(build_entry(interview_data, get_interview_filename(interview_id), created, time.time(), size))
+    
+    def _reconcile_index(self):
+        """
+        Rebuild index entries that are missing or older than the files on disk.
         
-        Returns:
-            Interview ID if imported successfully, None otherwise
+        One directory scan at startup; entries only go stale if the process
+        stopped before a debounced index write.
         """
-        try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if not self._validate_interview_data(data):
-                print("Invalid interview data structure")
+        snapshots = {
+            filepath.stem: filepath
+            for filepath in self.storage_dir.glob("*.json")
+            if not filepath.name.startswith("backup_")
+        }
+        
+        def last_change(interview_id: str) -> float:
+            mtime = snapshots[interview_id].stat().st_mtime
+            journal_path = self.journal.path(interview_id)
+            if journal_path.exists():
+                mtime = max(mtime, journal_path.stat().st_mtime)
+            return mtime
+        
+        def rebuild(interview_id: str) -> Optional[Dict[str, Any]]:
+            try:
+                with self.interview_lock(interview_id):
+                    data = self._read_current(interview_id)
+            except Exception as e:
+                print(f"Error indexing interview {interview_id}: {e}")
                 return None
-            
-            interview_id = data["interview_id"]
-            
-            if self.save_interview(data):
-                return interview_id
-            else:
+            if data is None:
                 return None
-                
-        except Exception as e:
-            print(f"Error importing interview from {import_path}: {e}")
-            return None
+            stat = snapshots[interview_id].stat()
+            existing = self.index.get(interview_id)
+            created = existing["created"] if existing else datetime.fromtimestamp(stat.st_ctime).isoformat()
+            return build_entry(data, snapshots[interview_id].name, created, last_change(interview_id), stat.st_size)
+        
+        changed = self.index.reconcile(snapshots, last_change, rebuild)
+        if changed:
+            print(f"Metadata index: reconciled {changed} interview(s)")
 
 
 # Global storage instance
@@ -420,19 +602,43 @@ _storage_instance = None
 _storage_lock = threading.Lock()
 
 
-def get_storage() -> InterviewStorage:
+def create_storage(backend: Optional[str] = None) -> StorageBackend:
+    """
+    Create a storage backend by name.
+    
+    Args:
+        backend: "json" or "sqlite" (defaults to StorageConfig.BACKEND)
+        
+    Returns:
+        StorageBackend instance
+    """
+    backend = (backend or StorageConfig.BACKEND).lower()
+    
+    if backend == "json":
+        return InterviewStorage()
+    if backend == "sqlite":
+        try:
+            from backend.services.sqlite_storage import SQLiteInterviewStorage
+        except ImportError:
+            from services.sqlite_storage import SQLiteInterviewStorage
+        return SQLiteInterviewStorage()
+    
+    raise ValueError(f"Unknown storage backend: {backend}")
+
+
+def get_storage() -> StorageBackend:
     """
     Get global storage instance (singleton pattern).
     
     Returns:
-        InterviewStorage instance
+        Storage backend selected by StorageConfig.BACKEND
     """
     global _storage_instance
     
     if _storage_instance is None:
         with _storage_lock:
             if _storage_instance is None:
-                _storage_instance = InterviewStorage()
+                _storage_instance = create_storage()
     
     return _storage_instance
 
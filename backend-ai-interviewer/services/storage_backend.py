@@ -0,0 +1,177 @@
+"""
+Storage backend interface for interview session persistence.
+
+Concrete backends:
+- InterviewStorage (services/storage.py): one JSON file per interview
+- SQLiteInterviewStorage (services/sqlite_storage.py): single SQLite database in WAL mode
+
+Both store the same interview dictionary shape, so the interview manager and
+API endpoints work unchanged whichever backend get_storage() returns.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+
+class StorageBackend(ABC):
+    """
+    Common interface for interview session storage.
+    
+    Implementations set self.locks to an InterviewLocks instance.
+    """
+    
+    @abstractmethod
+    def save_interview(self, interview_data: Dict[str, Any]) -> bool:
+        """Persist a full interview session. Returns True on success."""
+    
+    @abstractmethod
+    def load_interview(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        """Load an interview session, or None if not found."""
+    
+    @abstractmethod
+    def delete_interview(self, interview_id: str) -> bool:
+        """Delete an interview session. Returns False if not found."""
+    
+    @abstractmethod
+    def list_interviews(self,
+                        limit: Optional[int] = None,
+                        sort_by: str = "created",
+                        include_summary: bool = False,
+                        offset: int = 0) -> List[Dict[str, Any]]:
+        """List one page of interview metadata sorted by "created", "modified" or "id"."""
+    
+    @abstractmethod
+    def exists(self, interview_id: str) -> bool:
+        """Check if an interview session exists."""
+    
+    @abstractmethod
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """Get storage usage statistics."""
+    
+    def load_summary(self, interview_id: str) -> Optional[Dict[str, Any]]:
+        """Get an interview's final summary, or None if not found or not completed."""
+        data = self.load_interview(interview_id)
+        return data.get("summary") if data else None
+    
+    def change_stamp(self, interview_id: str) -> Optional[Any]:
+        """
+        Cheap marker that changes whenever an interview is saved, by any process.
+        
+        Lets a cache detect sessions another worker wrote. None means the
+        backend cannot tell (cached copies are then trusted).
+        """
+        return None
+    
+    def interview_lock(self, interview_id: str):
+        """
+        Context manager locking one interview across threads and worker
+        processes. Reentrant; hold it around load-modify-save sequences.
+        """
+        return self.locks.lock(interview_id)
+    
+    def cleanup_old_backups(self, keep_days: int = 7) -> int:
+        """Remove backups older than keep_days and lock files of interviews that no longer exist. Returns the number removed."""
+        return self.locks.prune(self.exists)
+    
+    def get_history(self, interview_id: str) -> List[Dict[str, Any]]:
+        """List recorded change events of an interview (empty if not supported)."""
+        return []
+    
+    def reconstruct_interview(self,
+                              interview_id: str,
+                              seq: Optional[int] = None,
+                              at: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Rebuild an interview as of a history seq or Unix time (None if not supported)."""
+        return None
+    
+    def export_interview(self, interview_id: str, export_path: Path) -> bool:
+        """
+        Export interview data to specified location.
+        
+        Args:
+            interview_id: Interview to export
+            export_path: Destination file path
+            
+        Returns:
+            True if exported successfully
+        """
+        try:
+            data = self.load_interview(interview_id)
+            if not data:
+                return False
+            
+            export_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(export_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            
+            return True
+        
+        except Exception as e:
+            print(f"Error exporting interview {interview_id}: {e}")
+            return False
+    
+    def import_interview(self, import_path: Path) -> Optional[str]:
+        """
+        Import interview data from file.
+        
+        Args:
+            import_path: Path to interview file to import
+            
+        Returns:
+            Interview ID if imported successfully, None otherwise
+        """
+        try:
+            with open(import_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            if not self._validate_interview_data(data):
+                print("Invalid interview data structure")
+                return None
+            
+            interview_id = data["interview_id"]
+            
+            if self.save_interview(data):
+                return interview_id
+            else:
+                return None
+        
+        except Exception as e:
+            print(f"Error importing interview from {import_path}: {e}")
+            return None
+    
+    @staticmethod
+    def _validate_interview_data(data: Dict[str, Any]) -> bool:
+        """
+        Validate interview data structure.
+        
+        Args:
+            data: Interview data to validate
+            
+        Returns:
+            True if data structure is valid
+        """
+        required_fields = ["interview_id", "settings", "questions", "state"]
+        
+        # Check required top-level fields
+        for field in required_fields:
+            if field not in data:
+                return False
+        
+        # Validate settings
+        settings = data["settings"]
+        settings_required = ["job_title", "num_questions", "soft_pct", "initial_level", "keywords"]
+        for field in settings_required:
+            if field not in settings:
+                return False
+        
+        # Validate state
+        state = data["state"]
+        state_required = ["current_level", "asked_count", "recent_scores"]
+        for field in state_required:
+            if field not in state:
+                return False
+        
+        return True
@@ -59,11 +59,50 @@ class InterviewConfig:
         cls.INTERVIEWS_DIR.mkdir(exist_ok=True)
 
 
+class StorageConfig:
+    """Configuration for interview session persistence."""
+    
+    # Storage backend: "json" (one file per interview) or "sqlite" (single WAL-mode database).
+    # Several workers need SQLite: the JSON backend's metadata index is per process.
+    BACKEND = os.getenv("STORAGE_BACKEND", "sqlite" if int(os.getenv("INTERVIEWER_WORKERS", "1")) > 1 else "json").lower()
+    
+    # SQLite settings
+    SQLITE_PATH = Path(os.getenv("SQLITE_PATH", str(InterviewConfig.DATA_DIR / "interviews.db")))
+    SQLITE_BUSY_TIMEOUT_MS = 5000  # Wait for other writers instead of failing immediately
+    
+    # JSON backend change journal
+    JOURNAL_COMPACT_EVERY = 16  # Rewrite the JSON snapshot after this many journal events
+    JOURNAL_CACHE_SIZE = 128  # Sessions whose last persisted state is kept in memory for diffing
+    JOURNAL_FSYNC = os.getenv("JOURNAL_FSYNC", "false").lower() == "true"
+    
+    # Metadata index (JSON backend)
+    INDEX_FLUSH_DELAY = 2.0  # Seconds between an index change and writing index/metadata.json
+    
+    # Storage statistics
+    STATS_RECONCILE_INTERVAL = 300  # Seconds between background re-scans of the storage directory (0 disables)
+    
+    # Per-interview locking
+    LOCK_STRIPES = 64  # In-process locks interview ids are hashed onto
+    LOCK_TIMEOUT = 30.0  # Seconds to wait for an interview lock
+    FILE_LOCKS = os.getenv("STORAGE_FILE_LOCKS", "true").lower() == "true"  # Cross-process advisory locks
+    
+    # Several worker processes behind router.py (which sets INTERVIEWER_WORKERS for them)
+    MULTI_WORKER = int(os.getenv("INTERVIEWER_WORKERS", "1")) > 1
+    SESSION_REVALIDATE = os.getenv("SESSION_REVALIDATE", str(MULTI_WORKER)).lower() == "true"  # Reload sessions another worker saved
+    SESSION_FILE_LOCKS = os.getenv("SESSION_FILE_LOCKS", str(MULTI_WORKER)).lower() == "true"  # Cross-process session locks
+    
+    # Live session cache in InterviewManager (write-through by default with several workers,
+    # so a session is in storage before its lock is released to a worker taking it over)
+    SESSION_CACHE_SIZE = 256  # Sessions kept in memory
+    SESSION_DURABILITY = os.getenv("SESSION_DURABILITY", "write_through" if MULTI_WORKER else "write_behind").lower()  # "write_behind" or "write_through"
+    SESSION_FLUSH_INTERVAL = 1.0  # Seconds; max window of changes lost on a crash in write_behind mode
+
+
 class OllamaConfig:
     """Configuration for Ollama LLM integration."""
     
     # Ollama API settings
-    OLLAMA_HOST = "https://ollama.com"
+    OLLAMA_HOST = os.getenv("OLLAMA_HOST", "https://ollama.com")
     OLLAMA_API_KEY = os.getenv("OLLAMA_API_KEY", "")
     OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "gpt-oss:120b")
     
@@ -71,6 +110,35 @@ class OllamaConfig:
     TEMPERATURE = 0.7
     MAX_TOKENS = 1000
     TOP_P = 0.9
+    
+    # Per-task token budgets (generation also stops early once all fields are parsed).
+    # Thinking models spend part of the budget on reasoning, so leave headroom.
+    QUESTION_MAX_TOKENS = int(os.getenv("QUESTION_MAX_TOKENS", "400"))
+    EVALUATION_MAX_TOKENS = int(os.getenv("EVALUATION_MAX_TOKENS", "800"))
+    
+    # Async client (used by the API endpoints)
+    MAX_CONCURRENT_REQUESTS = int(os.getenv("OLLAMA_MAX_CONCURRENT", "8"))  # LLM calls in flight per process; also the connection pool size
+    REQUEST_TIMEOUT = float(os.getenv("OLLAMA_REQUEST_TIMEOUT", "60"))  # Seconds per generation before falling back
+    CONNECT_TIMEOUT = 10.0  # Seconds to establish a connection to the Ollama host
+    
+    # Latency-aware timeouts: once enough calls have completed, a generation may take
+    # TIMEOUT_MULTIPLIER x the recent p95 latency (at least MIN_TIMEOUT, at most REQUEST_TIMEOUT)
+    MIN_TIMEOUT = float(os.getenv("OLLAMA_MIN_TIMEOUT", "10"))
+    TIMEOUT_MULTIPLIER = 3.0
+    LATENCY_SAMPLES = 50  # Recent successful calls the p95 is taken over
+    LATENCY_MIN_SAMPLES = 10  # Calls needed before the timeout adapts
+    
+    # Retries on connection errors and 429/5xx responses, before any output was received
+    RETRY_ATTEMPTS = int(os.getenv("OLLAMA_RETRY_ATTEMPTS", "2"))
+    RETRY_BACKOFF = 0.25  # Seconds; attempt n sleeps a random time up to RETRY_BACKOFF * 2**n
+    
+    # Circuit breaker: after BREAKER_MIN_CALLS calls in BREAKER_WINDOW seconds with at least
+    # BREAKER_FAILURE_RATE failing, the agents use their fallbacks for BREAKER_COOLDOWN seconds,
+    # then a single probe call decides whether to close the breaker again
+    BREAKER_FAILURE_RATE = float(os.getenv("OLLAMA_BREAKER_FAILURE_RATE", "0.5"))
+    BREAKER_MIN_CALLS = 5
+    BREAKER_WINDOW = 60.0
+    BREAKER_COOLDOWN = float(os.getenv("OLLAMA_BREAKER_COOLDOWN", "30"))
 
 
 class QuestionConfig:
@@ -110,6 +178,19 @@ class QuestionConfig:
         "decision_making", "emotional_intelligence", "creativity"
     ]
     
+    # Speculative prefetch of the next question while an answer is evaluated (async API path)
+    PREFETCH_ENABLED = os.getenv("QUESTION_PREFETCH", "true").lower() == "true"
+    PREFETCH_MAX_SESSIONS = 64  # Sessions with pending prefetches; the oldest are cancelled beyond this
+    PREFETCH_TTL = 600.0  # Seconds an unclaimed prefetch is kept
+    
+    # Question bank: generated questions reused across sessions with the same settings
+    BANK_ENABLED = os.getenv("QUESTION_BANK", "true").lower() == "true"
+    BANK_PATH = Path(os.getenv("QUESTION_BANK_PATH", str(InterviewConfig.DATA_DIR / "question_bank.db")))
+    BANK_MIN_UNSEEN = 5  # Serve from the bank only if this many questions the session has not seen remain
+    BANK_EXPLORE_RATE = 0.1  # Share of bank-servable requests still generated fresh, so the bank keeps growing
+    BANK_DUPLICATE_THRESHOLD = 0.5  # Estimated Jaccard similarity at which two questions are near-duplicates
+    BANK_CANDIDATES = 50  # Least-served questions considered per draw
+    
     # Level complexity indicators
     LEVEL_DESCRIPTORS = {
         1: "Basic/Entry-level",
@@ -147,6 +228,29 @@ class EvaluationConfig:
     # Mock evaluation settings
     MOCK_SCORE_RANGE = (40, 95)  # Range for random mock scores
     
+    # Async evaluation mode: answers are acknowledged at once and evaluated by background workers
+    ASYNC_WORKERS = int(os.getenv("EVALUATION_WORKERS", "4"))  # Deferred evaluations run at once
+    ASYNC_WAIT_TIMEOUT = 120.0  # Seconds next_question and submit_answer wait for a pending evaluation they need
+    ASYNC_MAX_ATTEMPTS = int(os.getenv("EVALUATION_MAX_ATTEMPTS", "3"))  # Tries per deferred evaluation before "failed"
+    
+    # Batch evaluation of recorded transcripts (/evaluate/batch)
+    BATCH_CONCURRENCY = int(os.getenv("BATCH_EVALUATION_CONCURRENCY", "4"))  # Default evaluations in flight per batch
+    BATCH_MAX_CONCURRENCY = 16  # Upper bound a request may ask for (the LLM gateway limit still applies)
+    
+    # Local pre-scoring: empty or content-free, "I don't know" and copied-question answers
+    # are scored without an LLM call; everything else is evaluated by the LLM
+    PRESCORE_ENABLED = os.getenv("ANSWER_PRESCORE", "true").lower() == "true"
+    PRESCORE_IDK_MAX_WORDS = 8  # "I don't know" answers longer than this are left to the LLM
+    PRESCORE_COPY_SIMILARITY = 0.85  # Cosine similarity to the question at which an answer counts as a copy
+    PRESCORE_COPY_MAX_NEW_WORDS = 0.2  # ... provided at most this share of its words is not in the question
+    
+    # Evaluation cache: stored evaluations reused for the same answer to the same question
+    CACHE_ENABLED = os.getenv("EVALUATION_CACHE", "true").lower() == "true"
+    CACHE_PATH = Path(os.getenv("EVALUATION_CACHE_PATH", str(InterviewConfig.DATA_DIR / "evaluation_cache.db")))
+    CACHE_TTL = float(os.getenv("EVALUATION_CACHE_TTL", str(30 * 24 * 3600)))  # Seconds an evaluation is reused
+    CACHE_MAX_ENTRIES = int(os.getenv("EVALUATION_CACHE_MAX_ENTRIES", "50000"))  # Least recently used are dropped beyond this
+    CACHE_PRUNE_EVERY = 100  # Stores between expiry/size pruning passes
+    
     # Summary generation
     MAX_STRENGTHS = 3
     MAX_WEAKNESSES = 3
@@ -192,8 +296,44 @@ class APIConfig:
     MAX_ANSWER_LENGTH = 5000
     MAX_PROFILE_BRIEF_LENGTH = 1000
     
-    # Rate limiting (if implemented)
-    RATE_LIMIT_PER_MINUTE = 60
+    # Rate limiting and admission control (services/admission.py)
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT", "true").lower() == "true"
+    RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", "60"))  # LLM-bound requests per client
+    RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "10"))  # Requests a client may send at once after idling
+    GLOBAL_RATE_LIMIT_PER_MINUTE = int(os.getenv("GLOBAL_RATE_LIMIT_PER_MINUTE", "600"))  # LLM-bound requests, all clients
+    GLOBAL_RATE_LIMIT_BURST = int(os.getenv("GLOBAL_RATE_LIMIT_BURST", "50"))
+    RATE_LIMIT_LIGHT_COST = 0.1  # Tokens taken by a request that does not call the LLM (status, polling, ...)
+    RATE_LIMIT_EXEMPT_PATHS = ["/", "/health", "/docs", "/redoc", "/openapi.json"]
+    RATE_LIMIT_MAX_CLIENTS = 10000  # Client buckets tracked (least recently seen dropped first)
+    TRUST_FORWARDED_FOR = os.getenv("TRUST_FORWARDED_FOR", "false").lower() == "true"  # Identify clients by X-Forwarded-For (behind a proxy)
+    TRUSTED_PROXY_HOPS = int(os.getenv("TRUSTED_PROXY_HOPS", "1"))  # Proxies in front that append to X-Forwarded-For
+    
+    LLM_BOUND_PATHS = ["/next_question", "/submit_answer", "/evaluate/batch"]  # Path prefixes that call the LLM
+    ADMISSION_MAX_IN_FLIGHT = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "16"))  # LLM-bound requests served at once
+    ADMISSION_MAX_QUEUED = int(os.getenv("ADMISSION_MAX_QUEUED", "32"))  # Further LLM-bound requests allowed to wait
+    ADMISSION_QUEUE_TIMEOUT = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "15"))  # Seconds a request waits for a slot
+    ADMISSION_SHED_NEW_INTERVIEWS = True  # Refuse /start_interview while LLM-bound requests are queued
+    
+    # Interview WebSocket (/ws/interview/{interview_id})
+    WS_REPLACE_TIMEOUT = 120  # Seconds a reconnect waits for the replaced connection to finish its turn
+
+
+class RouterConfig:
+    """Configuration for the multi-worker front router (router.py)."""
+    
+    HOST = os.getenv("ROUTER_HOST", "0.0.0.0")
+    PORT = int(os.getenv("ROUTER_PORT", "8000"))
+    WORKERS = int(os.getenv("INTERVIEWER_WORKERS", str(os.cpu_count() or 1)))
+    WORKER_HOST = "127.0.0.1"
+    WORKER_BASE_PORT = int(os.getenv("WORKER_BASE_PORT", "8100"))  # Worker i listens on WORKER_BASE_PORT + i
+    WORKER_INDEX = int(os.getenv("INTERVIEWER_WORKER_INDEX", "-1"))  # Set by router.py in each worker process
+    
+    STARTUP_TIMEOUT = 60.0  # Seconds to wait for the workers to answer /health
+    HEALTH_INTERVAL = 2.0  # Seconds between worker liveness checks
+    HUNG_CHECKS = int(os.getenv("ROUTER_HUNG_CHECKS", "5"))  # Failed checks in a row after which a running worker is restarted
+    RESTART_BACKOFF = 1.0  # Seconds before restarting a worker that exited (doubles up to 30s)
+    PROXY_TIMEOUT = 600.0  # Seconds a proxied request may take (streams included)
+    MAX_CONNECTIONS = 1000  # Pooled connections from the router to the workers
 
 
 # Environment-specific overrides
@@ -5,19 +5,49 @@ This module provides functions for generating unique identifiers
 used throughout the interview system.
 """
 
+import hashlib
 import uuid
 import time
 from datetime import datetime
+from typing import List, Optional
 
 
-def generate_interview_id() -> str:
+def generate_interview_id(worker_index: Optional[int] = None, workers: int = 1) -> str:
     """
     Generate a unique interview session ID.
     
+    Args:
+        worker_index: Worker that should own the interview (see rendezvous_pick)
+        workers: Number of workers behind the router
+        
     Returns:
         String UUID4 identifier
     """
-    return str(uuid.uuid4())
+    while True:
+        interview_id = str(uuid.uuid4())
+        if worker_index is None or workers <= 1:
+            return interview_id
+        if rendezvous_pick(interview_id, list(range(workers))) == worker_index:
+            return interview_id
+
+
+def rendezvous_pick(key: str, candidates: List[int]) -> Optional[int]:
+    """
+    Owner of a key among worker indexes (highest random weight hashing).
+    
+    Removing a worker only moves the keys it owned; every process computes
+    the same owner for the same candidates.
+    
+    Args:
+        key: Interview id
+        candidates: Indexes of the workers to choose from
+        
+    Returns:
+        Index of the owning worker, or None without candidates
+    """
+    if not candidates:
+        return None
+    return max(candidates, key=lambda i: hashlib.blake2b(f"{i}:{key}".encode("utf-8"), digest_size=8).digest())
 
 
 def generate_short_id(length: int = 8) -> str:
@@ -57,6 +57,28 @@ def update_level(current_level: int,
         return current_level, reason
 
 
+def reachable_levels(current_level: int,
+                     recent_scores: List[float],
+                     window_size: int = InterviewConfig.SCORE_WINDOW_SIZE) -> List[int]:
+    """
+    Levels update_level can produce once the next score is known.
+    
+    update_level is monotonic in the new score, so the outcomes for scores
+    of 0 and 100 bound every possible outcome.
+    
+    Args:
+        current_level: Current difficulty level (1-5)
+        recent_scores: Scores so far, before the pending one
+        window_size: Number of recent scores to consider (default: 3)
+    
+    Returns:
+        Sorted list of possible next levels (one entry if the score cannot matter)
+    """
+    lowest, _ = update_level(current_level, (recent_scores + [0.0])[-window_size:], window_size=window_size)
+    highest, _ = update_level(current_level, (recent_scores + [100.0])[-window_size:], window_size=window_size)
+    return list(range(lowest, highest + 1))
+
+
 def weighted_average(questions: List[Dict[str, Any]]) -> float:
     """
     Calculate weighted average score where higher level questions have more weight.
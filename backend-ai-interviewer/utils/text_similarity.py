@@ -0,0 +1,121 @@
+"""
+Text similarity utilities.
+
+MinHash signatures estimate the Jaccard similarity of two texts' word
+shingles in constant time per pair, which is enough to tell whether two
+interview questions are near-duplicates ("What is a Python decorator?" vs
+"In Python, what is a decorator?"). Locality-sensitive hashing over the
+signature's bands finds candidate duplicates without comparing every pair.
+Term-frequency cosine similarity compares two single texts directly (e.g. an
+answer with the question it answers).
+"""
+
+import hashlib
+import math
+import random
+import re
+from collections import Counter
+from typing import List, Sequence, Set
+
+NUM_PERM = 64  # Signature length
+LSH_BANDS = 16  # Bands of LSH_ROWS values; pairs around 0.5 similarity or more share a band
+LSH_ROWS = NUM_PERM // LSH_BANDS
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed: signatures are persisted and must stay comparable across processes
+_rng = random.Random(1729)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Words that carry no meaning for question similarity
+_STOPWORDS = {
+    "a", "an", "the", "is", "are", "was", "were", "be", "to", "of", "in", "on", "for", "and", "or",
+    "what", "how", "why", "when", "which", "who", "do", "does", "you", "your", "can", "would",
+    "it", "its", "this", "that", "with", "as", "by", "at", "from", "between", "explain", "describe"
+}
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase text and collapse it to space-separated alphanumeric words."""
+    return " ".join(_WORD_RE.findall((text or "").lower()))
+
+
+def shingles(text: str, size: int = 2) -> Set[str]:
+    """
+    Word shingles of a text, ignoring stopwords.
+    
+    Args:
+        text: Input text
+        size: Words per shingle
+        
+    Returns:
+        Set of shingles (single words for texts shorter than size)
+    """
+    words = content_words(text)
+    if len(words) < size:
+        return set(words)
+    # Single words as well, so reordered phrasings still overlap
+    return set(words) | {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def content_words(text: str) -> List[str]:
+    """Words of a text without stopwords, in order."""
+    return [w for w in normalize_text(text).split() if w not in _STOPWORDS]
+
+
+def cosine_similarity(text_a: str, text_b: str) -> float:
+    """
+    Cosine similarity of two texts' term-frequency vectors (stopwords ignored).
+    
+    Returns:
+        0.0 (no shared words) to 1.0 (same words in the same proportions)
+    """
+    tf_a, tf_b = Counter(content_words(text_a)), Counter(content_words(text_b))
+    if not tf_a or not tf_b:
+        return 0.0
+    dot = sum(count * tf_b[word] for word, count in tf_a.items())
+    norm = math.sqrt(sum(c * c for c in tf_a.values())) * math.sqrt(sum(c * c for c in tf_b.values()))
+    return dot / norm
+
+
+def minhash(text: str) -> List[int]:
+    """
+    MinHash signature of a text's shingles.
+    
+    Returns:
+        NUM_PERM integers; an empty text gets a signature of all _MAX_HASH
+    """
+    values = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little")
+              for s in shingles(text)]
+    if not values:
+        return [_MAX_HASH] * NUM_PERM
+    return [min(((a * v + b) % _MERSENNE_PRIME) & _MAX_HASH for v in values) for a, b in _PERMUTATIONS]
+
+
+def estimate_jaccard(sig_a: Sequence[int], sig_b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    if not sig_a or len(sig_a) != len(sig_b):
+        return 0.0
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+def is_near_duplicate(signature: Sequence[int], others: Sequence[Sequence[int]], threshold: float) -> bool:
+    """Check whether a signature is at least threshold-similar to any of others."""
+    return any(estimate_jaccard(signature, other) >= threshold for other in others)
+
+
+def lsh_bands(signature: Sequence[int]) -> List[str]:
+    """
+    Band hashes of a signature for locality-sensitive lookup.
+    
+    Two signatures sharing any band hash are candidate duplicates.
+    """
+    bands = []
+    for band in range(LSH_BANDS):
+        chunk = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(",".join(map(str, chunk)).encode("ascii"), digest_size=8).hexdigest()
+        bands.append(f"{band}:{digest}")
+    return bands
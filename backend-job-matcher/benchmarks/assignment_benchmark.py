@@ -0,0 +1,67 @@
+"""
+Benchmark for the sparse top-k CV -> job assignment engine.
+
+Uses random embeddings, so it measures time and memory only, not match quality.
+
+Usage:
+    python benchmarks/assignment_benchmark.py                      # 100k x 100k
+    python benchmarks/assignment_benchmark.py --cvs 20000 --jobs 20000 --repair
+"""
+import argparse
+import resource
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.assignment import topk_graph, assign_greedy
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cvs", type=int, default=100_000)
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=384, help="Embedding size (384 for all-MiniLM-L6-v2)")
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--capacity", type=int, default=1)
+    parser.add_argument("--block-mb", type=int, default=64, help="Similarity block budget in MiB")
+    parser.add_argument("--repair", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    cv_embeddings = rng.standard_normal((args.cvs, args.dim), dtype=np.float32)
+    job_embeddings = rng.standard_normal((args.jobs, args.dim), dtype=np.float32)
+    base_rss = peak_rss_mb()
+    print(f"{args.cvs} CVs x {args.jobs} jobs, dim={args.dim}, k={args.k}, capacity={args.capacity}")
+    print(f"Embeddings: {(cv_embeddings.nbytes + job_embeddings.nbytes) / 2**20:.0f} MiB, "
+          f"dense similarity matrix would be {args.cvs * args.jobs * 4 / 2**30:.1f} GiB")
+
+    t0 = time.perf_counter()
+    indices, scores = topk_graph(cv_embeddings, job_embeddings, k=args.k,
+                                 max_block_bytes=args.block_mb * 2**20)
+    t_graph = time.perf_counter() - t0
+
+    capacities = np.full(args.jobs, args.capacity, dtype=np.int64)
+    t0 = time.perf_counter()
+    assigned_job, assigned_score = assign_greedy(indices, scores, capacities, repair=args.repair)
+    t_assign = time.perf_counter() - t0
+
+    assigned = int((assigned_job >= 0).sum())
+    print(f"Top-k graph:  {t_graph:8.2f}s  ({indices.size} edges)")
+    print(f"Assignment:   {t_assign:8.2f}s  (repair={args.repair})")
+    print(f"Assigned:     {assigned}/{args.cvs}, total score {assigned_score.sum():.2f}")
+    print(f"Peak RSS:     {peak_rss_mb():.0f} MiB ({peak_rss_mb() - base_rss:.0f} MiB above inputs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,17 +6,23 @@ Endpoints:
  - POST /match/job-to-cvs - Match job description to CVs
  - POST /match/text-to-jobs - Match text to jobs (alias for cv-to-jobs)
  - POST /match/text-to-cvs - Match text to CVs (alias for job-to-cvs)
+ - POST /match/assignment - Global CV-to-job assignment with per-job capacities
  - GET  /health - Health check
+ - GET  /metrics - Per-stage latency histograms in Prometheus text format
  - POST /initialize - Initialize matcher with data from database
+ - POST /migration/start - Re-embed into a shadow index for a new model/template
+ - GET  /migration/status - Migration progress and ETA
+ - POST /migration/cancel - Cancel a running migration
 
 This module wires the MatcherService into a REST API.
 """
 
 import sys
+import time
 from pathlib import Path
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from typing import Optional
 import uvicorn
 
@@ -29,9 +35,15 @@ from models.schemas import (
     MatchRequest,
     MatchResponse,
     MatchItem,
-    HealthResponse
+    HealthResponse,
+    AssignmentRequest,
+    AssignmentResponse,
+    MigrationRequest,
+    MigrationStatusResponse
 )
 from utils.config import APIConfig
+from utils.metrics import get_metrics
+from utils.serialization import FastJSONResponse
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -52,6 +64,29 @@ app.add_middleware(
 
 # Get global matcher service
 matcher_service = get_matcher_service()
+metrics = get_metrics()
+
+metrics.gauge("matcher_index_size_bytes", "Bytes held by the serving index embeddings",
+              matcher_service.index_size_bytes)
+metrics.gauge("matcher_jobs_count", "Jobs in the serving index", lambda: len(matcher_service.job_texts))
+metrics.gauge("matcher_cvs_count", "CVs in the serving index", lambda: len(matcher_service.cv_texts))
+metrics.gauge("matcher_inflight_requests", "Requests currently being processed (queue depth)",
+              lambda: metrics.inflight)
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Track in-flight requests and per-endpoint latency for /metrics."""
+    metrics.inflight += 1
+    t0 = time.perf_counter()
+    try:
+        return await call_next(request)
+    finally:
+        metrics.inflight -= 1
+        route = request.scope.get("route")
+        path = route.path if route is not None else "unmatched"
+        metrics.histogram("matcher_request_duration_seconds", "path", path,
+                          "End-to-end request latency per endpoint").observe(time.perf_counter() - t0)
 
 
 @app.get("/", response_class=JSONResponse)
@@ -65,8 +100,13 @@ async def root():
             "POST /match/job-to-cvs": "Match job description to CVs",
             "POST /match/text-to-jobs": "Match text to jobs (alias)",
             "POST /match/text-to-cvs": "Match text to CVs (alias)",
+            "POST /match/assignment": "Global CV-to-job assignment with per-job capacities",
             "POST /initialize": "Initialize matcher with database data",
+            "POST /migration/start": "Re-embed into a shadow index and cut over when done",
+            "GET /migration/status": "Migration progress and ETA",
+            "POST /migration/cancel": "Cancel a running migration",
             "GET /health": "Health check",
+            "GET /metrics": "Prometheus metrics",
         }
     }
 
@@ -80,17 +120,26 @@ async def health_check():
             status="healthy",
             model_loaded=stats.get('model_loaded', False),
             jobs_count=stats.get('jobs_count', 0),
-            cvs_count=stats.get('cvs_count', 0)
+            cvs_count=stats.get('cvs_count', 0),
+            readiness=stats.get('readiness', 'cold'),
+            snapshot_created_at=stats.get('snapshot_created_at')
         )
     except Exception as e:
         return HealthResponse(
             status=f"error: {str(e)}",
             model_loaded=False,
             jobs_count=0,
-            cvs_count=0
+            cvs_count=0,
+            readiness="error"
         )
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Per-stage latency histograms, index size and queue depth in Prometheus text format."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.post("/initialize")
 async def initialize_matcher(user_id: Optional[str] = Query(None, description="Optional user ID to filter CVs")):
     """Initialize the matcher with data from database."""
@@ -106,31 +155,72 @@ async def initialize_matcher(user_id: Optional[str] = Query(None, description="O
         raise HTTPException(status_code=500, detail=f"Failed to initialize matcher: {str(e)}")
 
 
+@app.post("/migration/start", response_model=MigrationStatusResponse)
+async def start_migration(request: MigrationRequest):
+    """
+    Start an online re-embedding migration.
+    
+    Builds a shadow index for the requested model and/or text template in the
+    background under a CPU throttle. Queries keep being served from the current
+    index until the shadow index is complete, then it is swapped in atomically.
+    """
+    try:
+        matcher_service.start_migration(
+            model_name=request.model_name,
+            text_template=request.text_template,
+            user_id=request.user_id,
+            cpu_fraction=request.cpu_fraction,
+            batch_size=request.batch_size
+        )
+        return MigrationStatusResponse(**matcher_service.get_migration_status())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to start migration: {str(e)}")
+
+
+@app.get("/migration/status", response_model=MigrationStatusResponse)
+async def migration_status():
+    """Get progress and estimated time to completion of the current migration."""
+    return MigrationStatusResponse(**matcher_service.get_migration_status())
+
+
+@app.post("/migration/cancel")
+async def cancel_migration():
+    """Cancel the running migration; the current index keeps serving."""
+    if not matcher_service.cancel_migration():
+        raise HTTPException(status_code=404, detail="No migration is running")
+    return {"status": "cancelling"}
+
+
 @app.post("/match/cv-to-jobs", response_model=MatchResponse)
 async def match_cv_to_jobs(request: MatchRequest):
     """
     Match CV text to job descriptions.
     
     Args:
-        request: MatchRequest with text and top_n
+        request: MatchRequest with text, top_n and optional fields selection
         
     Returns:
         MatchResponse with matches and metadata
     """
     try:
-        # Ensure matcher is initialized
-        if not matcher_service._initialized:
-            matcher_service.initialize()
+        # Ensure matcher is initialized (503 while a background warm-up is running)
+        matcher_service.ensure_initialized()
         
         matches = matcher_service.match_cv_to_jobs(
             cv_text=request.text,
-            top_n=min(request.top_n, APIConfig.MAX_TOP_N)
+            top_n=min(request.top_n, APIConfig.MAX_TOP_N),
+            fields=request.fields
         )
         
-        return MatchResponse(
-            matches=matches,
-            total_found=len(matches)
-        )
+        # Plain dicts straight to orjson, skipping response model validation
+        return FastJSONResponse({
+            "matches": matches,
+            "total_found": len(matches)
+        })
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
@@ -143,25 +233,26 @@ async def match_job_to_cvs(request: MatchRequest):
     Match job description to CVs.
     
     Args:
-        request: MatchRequest with text and top_n
+        request: MatchRequest with text, top_n and optional fields selection
         
     Returns:
         MatchResponse with matches and metadata
     """
     try:
-        # Ensure matcher is initialized
-        if not matcher_service._initialized:
-            matcher_service.initialize()
+        # Ensure matcher is initialized (503 while a background warm-up is running)
+        matcher_service.ensure_initialized()
         
         matches = matcher_service.match_job_to_cvs(
             job_text=request.text,
-            top_n=min(request.top_n, APIConfig.MAX_TOP_N)
+            top_n=min(request.top_n, APIConfig.MAX_TOP_N),
+            fields=request.fields
         )
         
-        return MatchResponse(
-            matches=matches,
-            total_found=len(matches)
-        )
+        # Plain dicts straight to orjson, skipping response model validation
+        return FastJSONResponse({
+            "matches": matches,
+            "total_found": len(matches)
+        })
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
@@ -180,14 +271,38 @@ async def match_text_to_cvs(request: MatchRequest):
     return await match_job_to_cvs(request)
 
 
-if __name__ == "__main__":
-    # Initialize matcher on startup
+@app.post("/match/assignment", response_model=AssignmentResponse)
+async def match_assignment(request: AssignmentRequest):
+    """
+    Compute a global CV-to-job assignment for a hiring campaign.
+    
+    Each CV gets at most one job and each job at most its capacity, chosen on
+    the sparse top-k similarity graph of the loaded embeddings.
+    """
     try:
-        matcher_service.initialize()
+        matcher_service.ensure_initialized()
+        
+        result = matcher_service.compute_assignment(
+            k=request.k,
+            default_capacity=request.default_capacity,
+            capacities=request.capacities,
+            repair=request.repair
+        )
+        return AssignmentResponse(**result)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
-        print(f"Warning: Could not initialize matcher on startup: {e}")
-        print("Matcher will be initialized on first request.")
-    
+        raise HTTPException(status_code=500, detail=f"Assignment failed: {str(e)}")
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Warm the matcher in the background so the API is up immediately."""
+    # Serves from the last index snapshot first, then syncs with the database
+    matcher_service.start_background_warmup()
+
+
+if __name__ == "__main__":
     uvicorn.run(
         "main:app",
         host=APIConfig.HOST,
@@ -2,13 +2,18 @@
 Pydantic schemas for request/response validation.
 """
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional
 
 
 class MatchRequest(BaseModel):
     """Request schema for text-based matching."""
     text: str = Field(..., description="Text to match (CV or job description)")
     top_n: int = Field(default=5, ge=1, le=50, description="Number of top matches to return")
+    fields: Optional[List[Literal["metadata", "snippet", "text"]]] = Field(
+        default=None,
+        description="Optional fields to include besides index, id and score "
+                    "([] for ids and scores only). Omit for the full legacy item (text and metadata)."
+    )
 
 
 class MatchResponse(BaseModel):
@@ -20,16 +25,64 @@ class MatchResponse(BaseModel):
 class MatchItem(BaseModel):
     """Individual match item."""
     index: int = Field(..., description="Index of the matched item")
+    id: Optional[str] = Field(default=None, description="Database ID of the matched item (with field selection)")
     score: float = Field(..., description="Similarity score (0-1)")
-    text: str = Field(..., description="Matched text content")
+    text: Optional[str] = Field(default=None, description="Matched text content")
+    snippet: Optional[str] = Field(default=None, description="Start of the matched text")
     metadata: Optional[dict] = Field(default=None, description="Additional metadata (e.g., job title, company)")
 
 
+class AssignmentRequest(BaseModel):
+    """Request schema for a global CV-to-job assignment."""
+    k: int = Field(default=10, ge=1, le=100, description="Candidate jobs kept per CV in the similarity graph")
+    default_capacity: int = Field(default=1, ge=0, description="Slots per job when not listed in capacities")
+    capacities: Optional[Dict[str, int]] = Field(default=None, description="Slots per job ID")
+    repair: bool = Field(default=False, description="Place leftover CVs by moving others (may break stability)")
+
+
+class AssignmentResponse(BaseModel):
+    """Response schema for a global CV-to-job assignment."""
+    assignments: List[dict] = Field(..., description="Assigned pairs with cv/job index, id and score")
+    assigned_count: int
+    unassigned_count: int
+    total_score: float
+    edges: int = Field(..., description="Edges in the sparse similarity graph")
+    elapsed_seconds: float
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str
     model_loaded: bool
     jobs_count: int
     cvs_count: int
+    readiness: str = Field(default="cold", description="cold, warming, serving_snapshot, synced or error")
+    snapshot_created_at: Optional[str] = Field(default=None, description="When the last index snapshot was written or loaded")
+
+
+
+
+class MigrationRequest(BaseModel):
+    """Request schema for starting a re-embedding migration."""
+    model_name: Optional[str] = Field(default=None, description="Target sentence-transformers model (defaults to current)")
+    text_template: Optional[str] = Field(default=None, description="Target text template version (defaults to current)")
+    user_id: Optional[str] = Field(default=None, description="Optional user ID to filter CVs")
+    cpu_fraction: Optional[float] = Field(default=None, gt=0.0, le=1.0, description="Share of wall time the shadow build may spend encoding")
+    batch_size: Optional[int] = Field(default=None, ge=1, le=1024, description="Texts encoded per throttled step")
 
 
+class MigrationStatusResponse(BaseModel):
+    """Progress of a re-embedding migration."""
+    state: str = Field(..., description="idle, pending, loading, encoding, completed, cancelled or failed")
+    serving_model: str = Field(..., description="Model of the index currently serving queries")
+    serving_template: str = Field(..., description="Text template of the index currently serving queries")
+    model_name: Optional[str] = None
+    text_template: Optional[str] = None
+    total: int = 0
+    done: int = 0
+    progress_pct: float = 0.0
+    elapsed_seconds: float = 0.0
+    encoding_seconds: float = 0.0
+    eta_seconds: Optional[float] = Field(default=None, description="Estimated seconds until cut-over")
+    cpu_fraction: Optional[float] = None
+    error: Optional[str] = None
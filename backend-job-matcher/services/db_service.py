@@ -1,13 +1,104 @@
 """
 MongoDB service for loading jobs and CVs from database.
 """
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 import os
 from pymongo import MongoClient
 from bson import ObjectId
 from utils.config import APIConfig
 
 
+def _job_text_v1(job: Dict) -> str:
+    """Combine title, company, description, requirements and tags into a single text."""
+    text_parts = []
+    if job.get('title'):
+        text_parts.append(f"Title: {job['title']}")
+    if job.get('company'):
+        text_parts.append(f"Company: {job['company']}")
+    if job.get('description'):
+        text_parts.append(f"Description: {job['description']}")
+    if job.get('requirements'):
+        if isinstance(job['requirements'], list):
+            text_parts.append(f"Requirements: {', '.join(job['requirements'])}")
+        else:
+            text_parts.append(f"Requirements: {job['requirements']}")
+    if job.get('tags'):
+        if isinstance(job['tags'], list):
+            text_parts.append(f"Tags: {', '.join(job['tags'])}")
+    
+    return " ".join(text_parts)
+
+
+def _cv_text_v1(resume: Dict) -> str:
+    """Combine original_text and parsed_data into a single text."""
+    text_parts = []
+    
+    if resume.get('original_text'):
+        text_parts.append(resume['original_text'])
+    
+    if resume.get('parsed_data'):
+        parsed = resume['parsed_data']
+        
+        if parsed.get('education'):
+            ed_parts = []
+            for edu in parsed['education']:
+                ed_str = f"{edu.get('degree', '')} in {edu.get('field', '')} from {edu.get('school', '')} ({edu.get('year', '')})"
+                ed_parts.append(ed_str)
+            if ed_parts:
+                text_parts.append("Education: " + " | ".join(ed_parts))
+        
+        if parsed.get('experience'):
+            exp_parts = []
+            for exp in parsed['experience']:
+                exp_str = f"{exp.get('title', '')} at {exp.get('company', '')} - {exp.get('description', '')}"
+                exp_parts.append(exp_str)
+            if exp_parts:
+                text_parts.append("Experience: " + " | ".join(exp_parts))
+        
+        if parsed.get('skills'):
+            if isinstance(parsed['skills'], list):
+                text_parts.append("Skills: " + ", ".join(parsed['skills']))
+        
+        if parsed.get('certifications'):
+            cert_parts = []
+            for cert in parsed['certifications']:
+                cert_str = f"{cert.get('name', '')} from {cert.get('issuer', '')}"
+                cert_parts.append(cert_str)
+            if cert_parts:
+                text_parts.append("Certifications: " + " | ".join(cert_parts))
+    
+    return " ".join(text_parts)
+
+
+# Text templates used to turn database documents into matchable text.
+# Register a new version here and point APIConfig.TEXT_TEMPLATE (or a
+# re-embedding migration) at it; old versions stay available so the
+# currently served index can keep being refreshed until cut over.
+JOB_TEXT_TEMPLATES: Dict[str, Callable[[Dict], str]] = {
+    "v1": _job_text_v1,
+}
+
+CV_TEXT_TEMPLATES: Dict[str, Callable[[Dict], str]] = {
+    "v1": _cv_text_v1,
+}
+
+
+def get_job_text_template(template: Optional[str] = None) -> Callable[[Dict], str]:
+    """Return the job text builder for a template version (defaults to config)."""
+    name = template or APIConfig.TEXT_TEMPLATE
+    if name not in JOB_TEXT_TEMPLATES:
+        raise ValueError(f"Unknown text template: {name}")
+    return JOB_TEXT_TEMPLATES[name]
+
+
+def get_cv_text_template(template: Optional[str] = None) -> Callable[[Dict], str]:
+    """Return the CV text builder for a template version (defaults to config)."""
+    name = template or APIConfig.TEXT_TEMPLATE
+    if name not in CV_TEXT_TEMPLATES:
+        raise ValueError(f"Unknown text template: {name}")
+    return CV_TEXT_TEMPLATES[name]
+
+
 class DatabaseService:
     """Service for interacting with MongoDB."""
     
@@ -30,12 +121,13 @@ class DatabaseService:
             self.client = None
             self.db = None
     
-    def load_jobs(self, user_id: Optional[str] = None) -> List[Dict]:
+    def load_jobs(self, user_id: Optional[str] = None, template: Optional[str] = None) -> List[Dict]:
         """
         Load all active job listings from database.
         
         Args:
             user_id: Optional user ID to filter jobs for specific user
+            template: Text template version (defaults to APIConfig.TEXT_TEMPLATE)
             
         Returns:
             List of job dictionaries with 'text' and 'metadata' keys
@@ -43,6 +135,8 @@ class DatabaseService:
         if not self.db:
             return []
         
+        build_text = get_job_text_template(template)
+        
         try:
             jobs_collection = self.db.joblistings
             query = {"status": "active"}
@@ -54,27 +148,8 @@ class DatabaseService:
             
             result = []
             for job in jobs:
-                # Combine title, description, requirements, etc. into a single text
-                text_parts = []
-                if job.get('title'):
-                    text_parts.append(f"Title: {job['title']}")
-                if job.get('company'):
-                    text_parts.append(f"Company: {job['company']}")
-                if job.get('description'):
-                    text_parts.append(f"Description: {job['description']}")
-                if job.get('requirements'):
-                    if isinstance(job['requirements'], list):
-                        text_parts.append(f"Requirements: {', '.join(job['requirements'])}")
-                    else:
-                        text_parts.append(f"Requirements: {job['requirements']}")
-                if job.get('tags'):
-                    if isinstance(job['tags'], list):
-                        text_parts.append(f"Tags: {', '.join(job['tags'])}")
-                
-                text = " ".join(text_parts)
-                
                 result.append({
-                    'text': text,
+                    'text': build_text(job),
                     'metadata': {
                         'id': str(job['_id']),
                         'title': job.get('title', ''),
@@ -91,12 +166,13 @@ class DatabaseService:
             print(f"Error loading jobs from database: {e}")
             return []
     
-    def load_cvs(self, user_id: Optional[str] = None) -> List[Dict]:
+    def load_cvs(self, user_id: Optional[str] = None, template: Optional[str] = None) -> List[Dict]:
         """
         Load CVs from database.
         
         Args:
             user_id: Optional user ID to filter CVs for specific user
+            template: Text template version (defaults to APIConfig.TEXT_TEMPLATE)
             
         Returns:
             List of CV dictionaries with 'text' and 'metadata' keys
@@ -104,6 +180,8 @@ class DatabaseService:
         if not self.db:
             return []
         
+        build_text = get_cv_text_template(template)
+        
         try:
             resumes_collection = self.db.resumes
             query = {}
@@ -115,47 +193,8 @@ class DatabaseService:
             
             result = []
             for resume in resumes:
-                # Combine original_text and parsed_data into a single text
-                text_parts = []
-                
-                if resume.get('original_text'):
-                    text_parts.append(resume['original_text'])
-                
-                if resume.get('parsed_data'):
-                    parsed = resume['parsed_data']
-                    
-                    if parsed.get('education'):
-                        ed_parts = []
-                        for edu in parsed['education']:
-                            ed_str = f"{edu.get('degree', '')} in {edu.get('field', '')} from {edu.get('school', '')} ({edu.get('year', '')})"
-                            ed_parts.append(ed_str)
-                        if ed_parts:
-                            text_parts.append("Education: " + " | ".join(ed_parts))
-                    
-                    if parsed.get('experience'):
-                        exp_parts = []
-                        for exp in parsed['experience']:
-                            exp_str = f"{exp.get('title', '')} at {exp.get('company', '')} - {exp.get('description', '')}"
-                            exp_parts.append(exp_str)
-                        if exp_parts:
-                            text_parts.append("Experience: " + " | ".join(exp_parts))
-                    
-                    if parsed.get('skills'):
-                        if isinstance(parsed['skills'], list):
-                            text_parts.append("Skills: " + ", ".join(parsed['skills']))
-                    
-                    if parsed.get('certifications'):
-                        cert_parts = []
-                        for cert in parsed['certifications']:
-                            cert_str = f"{cert.get('name', '')} from {cert.get('issuer', '')}"
-                            cert_parts.append(cert_str)
-                        if cert_parts:
-                            text_parts.append("Certifications: " + " | ".join(cert_parts))
-                
-                text = " ".join(text_parts)
-                
                 result.append({
-                    'text': text,
+                    'text': build_text(resume),
                     'metadata': {
                         'id': str(resume['_id']),
                         'user_id': str(resume.get('user_id', '')),
@@ -1,10 +1,27 @@
 """
 Service for managing the Matcher instance and providing matching functionality.
 """
+import threading
+import time
+from datetime import datetime
 from typing import List, Dict, Optional
+import numpy as np
 from src.matcher import Matcher
-from services.db_service import get_db_service
+from src.assignment import topk_graph, assign_greedy
+from src.snapshot import write_snapshot, read_snapshot, text_hash, SnapshotError
+from src.utils import embed_texts
+from services.db_service import get_db_service, JOB_TEXT_TEMPLATES, CV_TEXT_TEMPLATES
+from services.migration_service import IndexMigration
 from utils.config import APIConfig
+from utils.metrics import get_metrics
+
+
+def _snippet(text: str, length: int) -> str:
+    """Cut text to about length characters on a word boundary."""
+    if len(text) <= length:
+        return text
+    cut = text.rfind(" ", 0, length)
+    return text[:cut if cut > length // 2 else length].rstrip() + "…"
 
 
 class MatcherService:
@@ -16,7 +33,17 @@ class MatcherService:
         self.cvs_data: List[Dict] = []
         self.job_texts: List[str] = []
         self.cv_texts: List[str] = []
+        self.model_name = APIConfig.MODEL_NAME
+        self.text_template = APIConfig.TEXT_TEMPLATE
         self._initialized = False
+        self._migration: Optional[IndexMigration] = None
+        # Guards the serving index so a cut-over swaps matcher and data together
+        self._lock = threading.RLock()
+        # cold -> warming -> serving_snapshot -> synced (or error)
+        self.readiness = "cold"
+        self.last_error: Optional[str] = None
+        self.snapshot_created_at: Optional[float] = None
+        self._warmup_thread: Optional[threading.Thread] = None
     
     def initialize(self, user_id: Optional[str] = None, force_reload: bool = False):
         """
@@ -30,90 +57,440 @@ class MatcherService:
             return
         
         db_service = get_db_service()
+        with self._lock:
+            model_name, text_template = self.model_name, self.text_template
+        metrics = get_metrics()
         
         # Load jobs and CVs from database
-        self.jobs_data = db_service.load_jobs(user_id=user_id)
-        self.cvs_data = db_service.load_cvs(user_id=user_id)
+        with metrics.timer("db_load"):
+            jobs_data = db_service.load_jobs(user_id=user_id, template=text_template)
+            cvs_data = db_service.load_cvs(user_id=user_id, template=text_template)
+        
+        # The loaders return [] when the database is unavailable; keep a serving snapshot over that
+        if user_id is None and self.readiness == "serving_snapshot":
+            with self._lock:
+                had_jobs, had_cvs = bool(self.jobs_data), bool(self.cvs_data)
+            if (had_jobs and not jobs_data) or (had_cvs and not cvs_data):
+                raise RuntimeError("Database returned no jobs or CVs, still serving the snapshot")
         
-        # Extract text for matching
-        self.job_texts = [job['text'] for job in self.jobs_data]
-        self.cv_texts = [cv['text'] for cv in self.cvs_data]
+        # Reuse the already loaded model (and unchanged embeddings) when reloading for the same model
+        current, current_jobs, current_cvs = self._serving_index()
+        same_model = current is not None and current.model_name == model_name
         
         # Initialize matcher
         try:
-            self.matcher = Matcher(
-                job_texts=self.job_texts,
-                cv_texts=self.cv_texts,
-                model_name=APIConfig.MODEL_NAME
-            )
-            self._initialized = True
-            print(f"Matcher initialized with {len(self.job_texts)} jobs and {len(self.cv_texts)} CVs")
+            t0 = time.perf_counter()
+            job_texts = [job['text'] for job in jobs_data]
+            cv_texts = [cv['text'] for cv in cvs_data]
+            if same_model:
+                matcher = Matcher(
+                    job_texts=job_texts,
+                    cv_texts=cv_texts,
+                    model_name=model_name,
+                    model=current.model,
+                    job_embeddings=self._reuse_embeddings(job_texts, self._text_hashes(current_jobs),
+                                                          current.job_embeddings, current.model),
+                    cv_embeddings=self._reuse_embeddings(cv_texts, self._text_hashes(current_cvs),
+                                                         current.cv_embeddings, current.model)
+                )
+            else:
+                matcher = Matcher(
+                    job_texts=job_texts,
+                    cv_texts=cv_texts,
+                    model_name=model_name
+                )
+            metrics.observe_stage("index_build", time.perf_counter() - t0)
+            with self._lock:
+                # A migration may have cut over to another model or template during the build
+                if self.model_name != model_name or self.text_template != text_template:
+                    print(f"Discarding index built for {model_name}/{text_template}, "
+                          f"now serving {self.model_name}/{self.text_template}")
+                    return
+                self._swap_index(matcher, jobs_data, cvs_data, model_name, text_template)
+            self.last_error = None
+            print(f"Matcher initialized with {len(matcher.job_texts)} jobs and {len(matcher.cv_texts)} CVs")
         except Exception as e:
+            self.last_error = str(e)
             print(f"Error initializing matcher: {e}")
             raise
+        
+        # Only the unfiltered index is worth restoring on the next cold start
+        if user_id is None:
+            self._write_snapshot()
+    
+    def ensure_initialized(self):
+        """Initialize on first use, unless a background warm-up is already doing it."""
+        if self._initialized:
+            return
+        if self.readiness == "warming":
+            raise RuntimeError("Matcher is warming up, retry shortly")
+        self.initialize()
+    
+    @staticmethod
+    def _text_hashes(data: List[Dict]) -> List[str]:
+        """Text hashes of index entries (snapshot CVs carry only the hash)."""
+        return [item.get('text_hash') or text_hash(item['text']) for item in data]
+    
+    @staticmethod
+    def _reuse_embeddings(texts: List[str], old_hashes: List[str], old_embeddings, model) -> np.ndarray:
+        """Build embeddings for texts, encoding only those not present in the old index."""
+        if not texts:
+            return np.array([])
+        
+        old_rows = {h: i for i, h in enumerate(old_hashes)} if old_hashes else {}
+        hashes = [text_hash(t) for t in texts]
+        missing = [i for i, h in enumerate(hashes) if h not in old_rows]
+        if len(missing) == len(texts):
+            return embed_texts(texts, model)
+        
+        dim = old_embeddings.shape[1]
+        embeddings = np.empty((len(texts), dim), dtype=old_embeddings.dtype)
+        for i, h in enumerate(hashes):
+            if h in old_rows:
+                embeddings[i] = old_embeddings[old_rows[h]]
+        if missing:
+            embeddings[missing] = embed_texts([texts[i] for i in missing], model)
+        return embeddings
     
-    def match_cv_to_jobs(self, cv_text: str, top_n: int = 5) -> List[Dict]:
+    def start_background_warmup(self):
+        """
+        Make the service usable quickly after a restart.
+        
+        In a background thread: load the last snapshot (if it matches the
+        configured model and template) and serve from it, then run a full
+        database sync that only re-encodes texts which changed.
+        """
+        if self._warmup_thread is not None and self._warmup_thread.is_alive():
+            return
+        self.readiness = "warming"
+        self._warmup_thread = threading.Thread(target=self._warmup, name="matcher-warmup", daemon=True)
+        self._warmup_thread.start()
+    
+    def _warmup(self):
+        try:
+            self._load_snapshot()
+        except SnapshotError as e:
+            print(f"Snapshot not used: {e}")
+        except Exception as e:
+            print(f"Error loading snapshot: {e}")
+        
+        try:
+            self.initialize(force_reload=True)
+        except Exception as e:
+            self.last_error = str(e)
+            if self.readiness == "warming":
+                self.readiness = "error"
+            print(f"Warning: Could not sync matcher with database: {e}")
+    
+    def _load_snapshot(self) -> bool:
+        """Serve from the on-disk snapshot if it matches the current model and template."""
+        path = APIConfig.SNAPSHOT_PATH
+        if not path.exists():
+            return False
+        
+        snapshot = read_snapshot(path)
+        if snapshot['model_name'] != self.model_name or snapshot['text_template'] != self.text_template:
+            print("Snapshot was built for a different model or template, ignoring it")
+            return False
+        
+        # The snapshot holds no CV texts or metadata; CVs match by id until the sync fills them in
+        cvs_data = [{'text': "", 'metadata': {'id': cv_id} if cv_id is not None else None, 'text_hash': h}
+                    for cv_id, h in zip(snapshot['cvs']['ids'], snapshot['cvs']['text_hashes'])]
+        matcher = Matcher(
+            job_texts=snapshot['jobs']['texts'],
+            cv_texts=[cv['text'] for cv in cvs_data],
+            model_name=snapshot['model_name'],
+            job_embeddings=snapshot['job_embeddings'],
+            cv_embeddings=snapshot['cv_embeddings']
+        )
+        jobs_data = [{'text': t, 'metadata': m} for t, m in zip(snapshot['jobs']['texts'], snapshot['jobs']['metadata'])]
+        
+        with self._lock:
+            # A sync that finished first is fresher than the snapshot
+            if self.readiness != "warming":
+                return False
+            self._swap_index(matcher, jobs_data, cvs_data, snapshot['model_name'], snapshot['text_template'],
+                             readiness="serving_snapshot")
+            self.snapshot_created_at = snapshot['created_at']
+        
+        print(f"Serving from snapshot with {len(jobs_data)} jobs and {len(cvs_data)} CVs")
+        return True
+    
+    def _write_snapshot(self):
+        """Persist the serving index so the next start can skip Mongo and re-encoding."""
+        with self._lock:
+            matcher, jobs_data, cvs_data = self.matcher, self.jobs_data, self.cvs_data
+            model_name, text_template = self.model_name, self.text_template
+        if matcher is None:
+            return
+        if not matcher.job_texts and not matcher.cv_texts:
+            print("Index is empty, keeping the previous snapshot")
+            return
+        
+        try:
+            t0 = time.perf_counter()
+            size = write_snapshot(
+                APIConfig.SNAPSHOT_PATH,
+                model_name=model_name,
+                text_template=text_template,
+                job_texts=matcher.job_texts,
+                job_embeddings=matcher.job_embeddings,
+                job_metadata=[job['metadata'] for job in jobs_data],
+                cv_ids=[(cv['metadata'] or {}).get('id') for cv in cvs_data],
+                cv_text_hashes=self._text_hashes(cvs_data),
+                cv_embeddings=matcher.cv_embeddings
+            )
+            self.snapshot_created_at = time.time()
+            print(f"Wrote index snapshot ({size} bytes) in {time.perf_counter() - t0:.2f}s")
+        except Exception as e:
+            print(f"Warning: Could not write index snapshot: {e}")
+    
+    def _swap_index(self, matcher: Matcher, jobs_data: List[Dict], cvs_data: List[Dict],
+                    model_name: str, text_template: str, readiness: str = "synced"):
+        """Atomically replace the serving index."""
+        with self._lock:
+            self.readiness = readiness
+            self.matcher = matcher
+            self.jobs_data = jobs_data
+            self.cvs_data = cvs_data
+            self.job_texts = matcher.job_texts
+            self.cv_texts = matcher.cv_texts
+            self.model_name = model_name
+            self.text_template = text_template
+            self._initialized = True
+    
+    def _serving_index(self):
+        """Return a consistent (matcher, jobs_data, cvs_data) view of the serving index."""
+        with self._lock:
+            return self.matcher, self.jobs_data, self.cvs_data
+    
+    def match_cv_to_jobs(self, cv_text: str, top_n: int = 5, fields: Optional[List[str]] = None) -> List[Dict]:
         """
         Match a CV text to job descriptions.
         
         Args:
             cv_text: CV text to match
             top_n: Number of top matches to return
+            fields: Optional subset of "metadata", "snippet", "text" (None for all legacy fields)
             
         Returns:
             List of match dictionaries with index, score, text, and metadata
         """
-        if not self.matcher:
-            raise RuntimeError("Matcher not initialized. Call initialize() first.")
-        
-        matches = self.matcher.match_text_to_jobs(cv_text, top_n=top_n)
-        
-        result = []
-        for idx, score, text in matches:
-            match_dict = {
-                'index': idx,
-                'score': round(score, 4),
-                'text': text,
-                'metadata': self.jobs_data[idx]['metadata'] if idx < len(self.jobs_data) else None
-            }
-            result.append(match_dict)
-        
-        return result
+        return self._match(cv_text, top_n, side="job", fields=fields)
     
-    def match_job_to_cvs(self, job_text: str, top_n: int = 5) -> List[Dict]:
+    def match_job_to_cvs(self, job_text: str, top_n: int = 5, fields: Optional[List[str]] = None) -> List[Dict]:
         """
         Match a job description to CVs.
         
         Args:
             job_text: Job description text to match
             top_n: Number of top matches to return
+            fields: Optional subset of "metadata", "snippet", "text" (None for all legacy fields)
             
         Returns:
             List of match dictionaries with index, score, text, and metadata
         """
-        if not self.matcher:
+        return self._match(job_text, top_n, side="cv", fields=fields)
+    
+    def _match(self, text: str, top_n: int, side: str, fields: Optional[List[str]] = None) -> List[Dict]:
+        """Match text against jobs (side="job") or CVs (side="cv"), timing each stage."""
+        matcher, jobs_data, cvs_data = self._serving_index()
+        if not matcher:
             raise RuntimeError("Matcher not initialized. Call initialize() first.")
         
-        matches = self.matcher.match_text_to_cvs(job_text, top_n=top_n)
+        if side == "job":
+            data, texts, embeddings = jobs_data, matcher.job_texts, matcher.job_embeddings
+        else:
+            data, texts, embeddings = cvs_data, matcher.cv_texts, matcher.cv_embeddings
+        if embeddings.size == 0:
+            return []
+        
+        metrics = get_metrics()
+        with metrics.timer("encode"):
+            query = matcher.encode_query(text)
+        with metrics.timer("search"):
+            sims = matcher.search(query, side=side)
+        with metrics.timer("topk"):
+            idxs = matcher.top_k(sims, top_n)
+        
+        with metrics.timer("response_build"):
+            if fields is None:
+                result = []
+                for idx in idxs.tolist():
+                    match_dict = {
+                        'index': idx,
+                        'score': round(float(sims[idx]), 4),
+                        'text': texts[idx],
+                        'metadata': data[idx]['metadata'] if idx < len(data) else None
+                    }
+                    result.append(match_dict)
+            else:
+                result = self._build_compact_items(idxs, sims, texts, data, fields)
+        
+        return result
+    
+    @staticmethod
+    def _build_compact_items(idxs, sims, texts: List[str], data: List[Dict], fields: List[str]) -> List[Dict]:
+        """Build match items with only index, id, score and the selected fields."""
+        want_metadata = "metadata" in fields
+        want_snippet = "snippet" in fields
+        want_text = "text" in fields
+        snippet_length = APIConfig.SNIPPET_LENGTH
         
         result = []
-        for idx, score, text in matches:
-            match_dict = {
+        for idx in idxs.tolist():
+            metadata = data[idx]['metadata'] if idx < len(data) else None
+            item = {
                 'index': idx,
-                'score': round(score, 4),
-                'text': text,
-                'metadata': self.cvs_data[idx]['metadata'] if idx < len(self.cvs_data) else None
+                'id': metadata.get('id') if metadata else None,
+                'score': round(float(sims[idx]), 4)
             }
-            result.append(match_dict)
-        
+            if want_metadata:
+                item['metadata'] = metadata
+            if want_snippet:
+                item['snippet'] = _snippet(texts[idx], snippet_length)
+            if want_text:
+                item['text'] = texts[idx]
+            result.append(item)
         return result
     
+    def compute_assignment(self,
+                           k: int = 10,
+                           default_capacity: int = 1,
+                           capacities: Optional[Dict[str, int]] = None,
+                           repair: bool = False) -> Dict:
+        """
+        Compute a global CV -> job assignment with per-job capacities.
+        
+        Runs on the sparse top-k similarity graph built from the serving
+        index embeddings, so memory stays O(n_cvs * k) instead of n_cvs * n_jobs.
+        
+        Args:
+            k: Candidate jobs kept per CV in the similarity graph
+            default_capacity: Slots per job when not listed in capacities
+            capacities: Optional slots per job ID
+            repair: Place leftover CVs by moving others when it raises the total score
+        
+        Returns:
+            Dictionary with per-CV assignments and totals
+        """
+        matcher, jobs_data, cvs_data = self._serving_index()
+        if not matcher:
+            raise RuntimeError("Matcher not initialized. Call initialize() first.")
+        
+        t0 = time.perf_counter()
+        job_ids = [job['metadata'].get('id') if job.get('metadata') else None for job in jobs_data]
+        slots = np.full(len(job_ids), default_capacity, dtype=np.int64)
+        if capacities:
+            for i, job_id in enumerate(job_ids):
+                if job_id in capacities:
+                    slots[i] = max(0, capacities[job_id])
+        
+        if matcher.cv_embeddings.size == 0 or matcher.job_embeddings.size == 0:
+            indices = np.zeros((len(cvs_data), 0), dtype=np.int32)
+            scores = np.zeros((len(cvs_data), 0), dtype=np.float32)
+        else:
+            indices, scores = topk_graph(matcher.cv_embeddings, matcher.job_embeddings, k=k)
+        assigned_job, assigned_score = assign_greedy(indices, scores, slots, repair=repair)
+        
+        assignments = []
+        for cv_idx in np.flatnonzero(assigned_job >= 0).tolist():
+            job_idx = int(assigned_job[cv_idx])
+            assignments.append({
+                'cv_index': cv_idx,
+                'cv_id': cvs_data[cv_idx]['metadata'].get('id') if cvs_data[cv_idx].get('metadata') else None,
+                'job_index': job_idx,
+                'job_id': job_ids[job_idx],
+                'score': round(float(assigned_score[cv_idx]), 4)
+            })
+        
+        return {
+            'assignments': assignments,
+            'assigned_count': len(assignments),
+            'unassigned_count': len(cvs_data) - len(assignments),
+            'total_score': round(float(assigned_score.sum()), 4),
+            'edges': int(indices.size),
+            'elapsed_seconds': round(time.perf_counter() - t0, 3)
+        }
+    
+    def start_migration(self,
+                        model_name: Optional[str] = None,
+                        text_template: Optional[str] = None,
+                        user_id: Optional[str] = None,
+                        cpu_fraction: Optional[float] = None,
+                        batch_size: Optional[int] = None) -> Dict:
+        """
+        Start building a shadow index for a new model and/or text template.
+        
+        The current index keeps serving until the shadow index is complete,
+        then both are swapped atomically.
+        
+        Args:
+            model_name: Target sentence-transformers model (defaults to current)
+            text_template: Target text template version (defaults to current)
+            user_id: Optional user ID to filter CVs
+            cpu_fraction: Share of wall time the build may spend encoding
+            batch_size: Texts encoded per throttled step
+            
+        Returns:
+            Migration status dictionary
+        """
+        model_name = model_name or self.model_name
+        text_template = text_template or self.text_template
+        if text_template not in JOB_TEXT_TEMPLATES or text_template not in CV_TEXT_TEMPLATES:
+            raise ValueError(f"Unknown text template: {text_template}")
+        
+        with self._lock:
+            if self._migration is not None and self._migration.is_active():
+                raise RuntimeError("A migration is already running")
+            
+            self._migration = IndexMigration(
+                model_name=model_name,
+                text_template=text_template,
+                on_complete=self._complete_migration,
+                user_id=user_id,
+                batch_size=batch_size,
+                cpu_fraction=cpu_fraction
+            )
+            self._migration.start()
+            return self._migration.get_status()
+    
+    def _complete_migration(self, migration: IndexMigration, matcher: Matcher,
+                            jobs_data: List[Dict], cvs_data: List[Dict]):
+        """Cut over to a finished shadow index."""
+        self._swap_index(matcher, jobs_data, cvs_data, migration.model_name, migration.text_template)
+        if migration.user_id is None:
+            self._write_snapshot()
+    
+    def cancel_migration(self) -> bool:
+        """Cancel the running migration. Returns False if none is running."""
+        migration = self._migration
+        if migration is None or not migration.is_active():
+            return False
+        migration.cancel()
+        return True
+    
+    def get_migration_status(self) -> Dict:
+        """Get progress of the current (or last) migration."""
+        status = self._migration.get_status() if self._migration else {'state': 'idle'}
+        status['serving_model'] = self.model_name
+        status['serving_template'] = self.text_template
+        return status
+    
+    def index_size_bytes(self) -> int:
+        """Bytes held by the serving index embeddings."""
+        matcher = self.matcher
+        return matcher.index_nbytes() if matcher is not None else 0
+    
     def get_stats(self) -> Dict:
         """Get statistics about loaded jobs and CVs."""
         return {
             'jobs_count': len(self.job_texts),
             'cvs_count': len(self.cv_texts),
-            'model_loaded': self.matcher is not None
+            'model_loaded': self.matcher is not None,
+            'readiness': self.readiness,
+            'snapshot_created_at': datetime.fromtimestamp(self.snapshot_created_at).isoformat() if self.snapshot_created_at else None,
+            'last_error': self.last_error
         }
 
 
@@ -127,5 +504,3 @@ def get_matcher_service() -> MatcherService:
     if _matcher_service is None:
         _matcher_service = MatcherService()
     return _matcher_service
-
-
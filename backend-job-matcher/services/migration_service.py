@@ -0,0 +1,165 @@
+"""
+Background re-embedding migration for the matcher index.
+
+Builds a shadow index for a new model and/or text template while the current
+index keeps serving queries. Encoding runs in small batches under a duty-cycle
+throttle so live queries keep most of the CPU; once the shadow index is complete
+it is handed back to MatcherService for an atomic cut-over.
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.matcher import Matcher
+from src.utils import load_model, embed_texts
+from services.db_service import get_db_service
+from utils.config import APIConfig
+
+
+class IndexMigration:
+    """Throttled background build of a shadow matcher index."""
+    
+    ACTIVE_STATES = ("pending", "loading", "encoding")
+    
+    def __init__(self,
+                 model_name: str,
+                 text_template: str,
+                 on_complete: Callable[["IndexMigration", Matcher, List[Dict], List[Dict]], None],
+                 user_id: Optional[str] = None,
+                 batch_size: Optional[int] = None,
+                 cpu_fraction: Optional[float] = None):
+        """
+        Args:
+            model_name: sentence-transformers model for the shadow index
+            text_template: DatabaseService text template version for the shadow index
+            on_complete: Called with the finished shadow matcher and its data to cut over
+            user_id: Optional user ID to filter CVs (same meaning as in initialize)
+            batch_size: Texts encoded per throttled step
+            cpu_fraction: Share of wall time spent encoding (0-1], the rest is slept
+        """
+        self.model_name = model_name
+        self.text_template = text_template
+        self.user_id = user_id
+        self.batch_size = batch_size or APIConfig.MIGRATION_BATCH_SIZE
+        self.cpu_fraction = min(1.0, max(0.01, cpu_fraction or APIConfig.MIGRATION_CPU_FRACTION))
+        self._on_complete = on_complete
+        
+        self.state = "pending"
+        self.error: Optional[str] = None
+        self.total = 0
+        self.done = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._encoding_started_at: Optional[float] = None
+        self._encoding_seconds = 0.0
+        
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        """Start building the shadow index in a daemon thread."""
+        self.started_at = time.time()
+        self._thread = threading.Thread(target=self._run, name="index-migration", daemon=True)
+        self._thread.start()
+    
+    def cancel(self):
+        """Request cancellation; the old index keeps serving."""
+        self._cancel.set()
+    
+    def is_active(self) -> bool:
+        """Whether the migration is still building."""
+        return self.state in self.ACTIVE_STATES
+    
+    def _run(self):
+        try:
+            self.state = "loading"
+            db_service = get_db_service()
+            jobs_data = db_service.load_jobs(user_id=self.user_id, template=self.text_template)
+            cvs_data = db_service.load_cvs(user_id=self.user_id, template=self.text_template)
+            job_texts = [job['text'] for job in jobs_data]
+            cv_texts = [cv['text'] for cv in cvs_data]
+            
+            model = load_model(self.model_name)
+            
+            self.total = len(job_texts) + len(cv_texts)
+            self.state = "encoding"
+            self._encoding_started_at = time.time()
+            
+            job_embeddings = self._encode(job_texts, model)
+            cv_embeddings = self._encode(cv_texts, model) if job_embeddings is not None else None
+            if job_embeddings is None or cv_embeddings is None:
+                self.state = "cancelled"
+                return
+            
+            shadow = Matcher(
+                job_texts=job_texts,
+                cv_texts=cv_texts,
+                model_name=self.model_name,
+                model=model,
+                job_embeddings=job_embeddings,
+                cv_embeddings=cv_embeddings
+            )
+            
+            if self._cancel.is_set():
+                self.state = "cancelled"
+                return
+            
+            self._on_complete(self, shadow, jobs_data, cvs_data)
+            self.state = "completed"
+            print(f"Migration completed: now serving {self.model_name} / template {self.text_template}")
+        except Exception as e:
+            self.state = "failed"
+            self.error = str(e)
+            print(f"Error during index migration: {e}")
+        finally:
+            self.finished_at = time.time()
+    
+    def _encode(self, texts: List[str], model) -> Optional[np.ndarray]:
+        """Encode texts in throttled batches. Returns None if cancelled."""
+        if not texts:
+            return np.array([])
+        
+        chunks = []
+        for start in range(0, len(texts), self.batch_size):
+            if self._cancel.is_set():
+                return None
+            
+            batch = texts[start:start + self.batch_size]
+            t0 = time.perf_counter()
+            chunks.append(embed_texts(batch, model, batch_size=self.batch_size))
+            elapsed = time.perf_counter() - t0
+            
+            self._encoding_seconds += elapsed
+            self.done += len(batch)
+            
+            # Duty-cycle throttle: sleep so encoding uses only cpu_fraction of wall time
+            if self.cpu_fraction < 1.0:
+                self._cancel.wait(elapsed * (1.0 - self.cpu_fraction) / self.cpu_fraction)
+        
+        return np.vstack(chunks)
+    
+    def get_status(self) -> Dict:
+        """Progress report with an ETA extrapolated from the encoding rate so far."""
+        now = self.finished_at or time.time()
+        eta_seconds = None
+        if self.state == "encoding" and self.done > 0 and self._encoding_started_at:
+            rate = self.done / max(now - self._encoding_started_at, 1e-6)
+            eta_seconds = round((self.total - self.done) / rate, 1)
+        elif self.state == "completed":
+            eta_seconds = 0.0
+        
+        return {
+            'state': self.state,
+            'model_name': self.model_name,
+            'text_template': self.text_template,
+            'total': self.total,
+            'done': self.done,
+            'progress_pct': round(100.0 * self.done / self.total, 1) if self.total else (100.0 if self.state == "completed" else 0.0),
+            'elapsed_seconds': round(now - self.started_at, 1) if self.started_at else 0.0,
+            'encoding_seconds': round(self._encoding_seconds, 1),
+            'eta_seconds': eta_seconds,
+            'cpu_fraction': self.cpu_fraction,
+            'error': self.error,
+        }
@@ -0,0 +1,147 @@
+"""
+Capacity-constrained CV -> job assignment on a sparse top-k similarity graph.
+
+A dense n_cvs x n_jobs similarity matrix (and the Hungarian algorithm on it)
+does not fit in memory at campaign scale, so the graph keeps only each CV's
+k most similar jobs, computed block by block under a byte budget.
+
+assign_greedy processes edges by descending score and accepts an edge when
+the CV is still free and the job has capacity left. Because both sides rank
+each other by the same similarity, the result is stable on the graph: no CV
+and job would both rather be matched to each other than to what they got.
+The optional repair pass then places CVs left unassigned by moving an
+already-placed CV to one of its free alternatives when that raises the total
+score, trading strict stability for coverage.
+"""
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+
+def _normalize(x):
+    x = np.asarray(x, dtype=np.float32)
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return x / norms
+
+
+def topk_graph(cv_embeddings, job_embeddings, k=10, max_block_bytes=64 * 1024 * 1024) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the sparse top-k graph from CVs to jobs.
+    
+    Memory is bounded by the normalized job matrix plus one block of
+    similarities and partition indices of at most max_block_bytes; the
+    result is O(n_cvs * k).
+    
+    Returns:
+        (indices, scores): int32 and float32 arrays of shape (n_cvs, k),
+        each row sorted by descending score
+    """
+    n_cvs, n_jobs = len(cv_embeddings), len(job_embeddings)
+    k = min(k, n_jobs)
+    if n_cvs == 0 or k == 0:
+        return np.zeros((n_cvs, 0), dtype=np.int32), np.zeros((n_cvs, 0), dtype=np.float32)
+    
+    jobs_t = np.ascontiguousarray(_normalize(job_embeddings).T)
+    # Each block cell costs a float32 similarity plus an int64 argpartition index
+    block = max(1, int(max_block_bytes // (12 * n_jobs)))
+    
+    indices = np.empty((n_cvs, k), dtype=np.int32)
+    scores = np.empty((n_cvs, k), dtype=np.float32)
+    for start in range(0, n_cvs, block):
+        stop = min(start + block, n_cvs)
+        # Negated in place so argpartition's smallest are the most similar
+        neg_sims = _normalize(cv_embeddings[start:stop]) @ jobs_t
+        np.negative(neg_sims, out=neg_sims)
+        if k < n_jobs:
+            part = np.argpartition(neg_sims, k - 1, axis=1)[:, :k]
+        else:
+            part = np.tile(np.arange(n_jobs), (stop - start, 1))
+        part_scores = np.take_along_axis(neg_sims, part, axis=1)
+        del neg_sims
+        order = np.argsort(part_scores, axis=1)
+        indices[start:stop] = np.take_along_axis(part, order, axis=1)
+        scores[start:stop] = -np.take_along_axis(part_scores, order, axis=1)
+    return indices, scores
+
+
+def assign_greedy(indices, scores, capacities, repair=False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assign each CV to at most one job, respecting per-job capacities.
+    
+    Args:
+        indices, scores: top-k graph from topk_graph
+        capacities: int array with the number of slots of each job
+        repair: run the coverage repair pass after the stable greedy pass
+        
+    Returns:
+        (assigned_job, assigned_score): per-CV job index (-1 if unassigned) and score
+    """
+    n_cvs, k = indices.shape
+    remaining = np.array(capacities, dtype=np.int64).copy()
+    assigned_job = np.full(n_cvs, -1, dtype=np.int64)
+    assigned_score = np.zeros(n_cvs, dtype=np.float32)
+    if n_cvs == 0 or k == 0:
+        return assigned_job, assigned_score
+    
+    flat_scores = scores.ravel()
+    order = np.argsort(-flat_scores, kind="stable")
+    cv_of_edge = order // k
+    job_of_edge = indices.ravel()[order]
+    score_of_edge = flat_scores[order]
+    
+    # Plain lists: per-element numpy indexing dominates this loop otherwise
+    free = remaining.tolist()
+    taken = [-1] * n_cvs
+    for cv, job, score in zip(cv_of_edge.tolist(), job_of_edge.tolist(), score_of_edge.tolist()):
+        if taken[cv] == -1 and free[job] > 0:
+            taken[cv] = job
+            assigned_score[cv] = score
+            free[job] -= 1
+    assigned_job[:] = taken
+    remaining[:] = free
+    
+    if repair:
+        _repair(indices, scores, remaining, assigned_job, assigned_score)
+    return assigned_job, assigned_score
+
+
+def _repair(indices, scores, remaining, assigned_job, assigned_score):
+    """Place unassigned CVs through one-hop moves that increase the total score."""
+    occupants: Dict[int, list] = {}
+    for cv, job in enumerate(assigned_job.tolist()):
+        if job >= 0:
+            occupants.setdefault(job, []).append(cv)
+    
+    for cv in np.flatnonzero(assigned_job == -1).tolist():
+        # (gain, job, score, moved_cv, moved_to, moved_score)
+        best: Optional[Tuple[float, int, float, int, int, float]] = None
+        for job, score in zip(indices[cv].tolist(), scores[cv].tolist()):
+            if remaining[job] > 0:
+                # Later jobs score lower, and any move through them gains at most their score
+                if best is None or score > best[0]:
+                    best = (score, job, score, -1, -1, 0.0)
+                break
+            # Job is full: try moving one occupant to a free alternative
+            for other in occupants.get(job, ()):
+                for alt, alt_score in zip(indices[other].tolist(), scores[other].tolist()):
+                    if alt == job or remaining[alt] <= 0:
+                        continue
+                    gain = score + alt_score - float(assigned_score[other])
+                    if gain > 0 and (best is None or gain > best[0]):
+                        best = (gain, job, score, other, alt, alt_score)
+                    break  # alternatives are sorted, the first free one is the best
+        if best is None:
+            continue
+        
+        _, job, score, other, alt, alt_score = best
+        if other >= 0:
+            occupants[job].remove(other)
+            occupants.setdefault(alt, []).append(other)
+            assigned_job[other] = alt
+            assigned_score[other] = alt_score
+            remaining[alt] -= 1
+        else:
+            remaining[job] -= 1
+        occupants.setdefault(job, []).append(cv)
+        assigned_job[cv] = job
+        assigned_score[cv] = score
@@ -4,12 +4,64 @@ from .utils import load_model, embed_texts, cosine_similarity_matrix
 
 
 class Matcher:
-    def __init__(self, job_texts, cv_texts, model_name="all-MiniLM-L6-v2"):
+    def __init__(self, job_texts, cv_texts, model_name="all-MiniLM-L6-v2",
+                 model=None, job_embeddings=None, cv_embeddings=None):
         self.job_texts = job_texts or []
         self.cv_texts = cv_texts or []
-        self.model = load_model(model_name)
-        self.job_embeddings = embed_texts(self.job_texts, self.model) if self.job_texts else np.array([])
-        self.cv_embeddings = embed_texts(self.cv_texts, self.model) if self.cv_texts else np.array([])
+        self.model_name = model_name
+        # A preloaded model and precomputed embeddings let callers (e.g. a
+        # background re-embedding migration) build the index without encoding twice.
+        self.model = model if model is not None else load_model(model_name)
+        if job_embeddings is not None:
+            self.job_embeddings = job_embeddings
+        else:
+            self.job_embeddings = embed_texts(self.job_texts, self.model) if self.job_texts else np.array([])
+        if cv_embeddings is not None:
+            self.cv_embeddings = cv_embeddings
+        else:
+            self.cv_embeddings = embed_texts(self.cv_texts, self.model) if self.cv_texts else np.array([])
+
+    def encode_query(self, text):
+        return embed_texts([text], self.model)
+
+    def _unit(self, side):
+        # Row-normalized embeddings, computed once so queries only pay a dot product
+        cached = getattr(self, f"_{side}_unit", None)
+        embeddings = self.job_embeddings if side == "job" else self.cv_embeddings
+        if cached is None or cached[0] is not embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            cached = (embeddings, embeddings / norms)
+            setattr(self, f"_{side}_unit", cached)
+        return cached[1]
+
+    def search(self, query_embedding, side="job"):
+        """Cosine similarities of one query embedding against all jobs or CVs."""
+        embeddings = self.job_embeddings if side == "job" else self.cv_embeddings
+        if embeddings.size == 0:
+            return np.zeros(0)
+        q = query_embedding[0]
+        q = q / (np.linalg.norm(q) or 1.0)
+        return self._unit(side) @ q
+
+    @staticmethod
+    def top_k(sims, top_n):
+        """Indices of the top_n largest similarities, best first."""
+        if top_n <= 0 or sims.size == 0:
+            return np.zeros(0, dtype=np.int64)
+        if top_n < sims.size:
+            idxs = np.argpartition(-sims, top_n - 1)[:top_n]
+        else:
+            idxs = np.arange(sims.size)
+        return idxs[np.argsort(-sims[idxs], kind="stable")]
+
+    def index_nbytes(self):
+        total = self.job_embeddings.nbytes + self.cv_embeddings.nbytes
+        for side in ("job", "cv"):
+            cached = getattr(self, f"_{side}_unit", None)
+            if cached is not None:
+                total += cached[1].nbytes
+        return total
 
     def match_cv_to_jobs_by_index(self, cv_index, top_n=5):
         if cv_index < 0 or cv_index >= len(self.cv_texts):
@@ -30,19 +82,15 @@ class Matcher:
         return [(int(i), float(sims[i]), self.cv_texts[i]) for i in idxs]
 
     def match_text_to_jobs(self, text, top_n=5):
-        emb = embed_texts([text], self.model)
         if self.job_embeddings.size == 0:
             return []
-        sims = cosine_similarity_matrix(emb, self.job_embeddings)[0]
-        idxs = np.argsort(-sims)[:top_n]
+        sims = self.search(self.encode_query(text), side="job")
+        idxs = self.top_k(sims, top_n)
         return [(int(i), float(sims[i]), self.job_texts[i]) for i in idxs]
 
     def match_text_to_cvs(self, text, top_n=5):
-        emb = embed_texts([text], self.model)
         if self.cv_embeddings.size == 0:
             return []
-        sims = cosine_similarity_matrix(emb, self.cv_embeddings)[0]
-        idxs = np.argsort(-sims)[:top_n]
+        sims = self.search(self.encode_query(text), side="cv")
+        idxs = self.top_k(sims, top_n)
         return [(int(i), float(sims[i]), self.cv_texts[i]) for i in idxs]
-
-
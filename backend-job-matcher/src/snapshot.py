@@ -0,0 +1,140 @@
+"""
+Versioned binary snapshot of a matcher index.
+
+Layout (little-endian):
+    8 bytes   magic  b"JMSNAP\\x00\\x00"
+    uint32    format version
+    uint64    header length in bytes
+    header    UTF-8 JSON: model name, text template, dimension, per-side ids
+              and text hashes, job texts and metadata, and a CRC32 of the
+              embedding block
+    float32   job embeddings (jobs_count x dim), row-major
+    float32   CV embeddings (cvs_count x dim), row-major
+
+Embeddings are stored raw so loading is a single read plus np.frombuffer;
+text hashes let a later sync re-encode only texts that changed.
+
+CV texts and metadata are personal data and are not stored; CVs are kept
+as ids only until the database sync fills them in. The file is still
+readable by its owner only (0600), since embeddings can leak some content.
+"""
+import hashlib
+import json
+import os
+import struct
+import time
+import zlib
+from typing import Dict, List, Optional
+
+import numpy as np
+
+MAGIC = b"JMSNAP\x00\x00"
+FORMAT_VERSION = 2
+_PREFIX = struct.Struct("<8sIQ")
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot is missing, corrupt or of an unsupported version."""
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _as_matrix(embeddings, count: int, dim: int) -> np.ndarray:
+    if count == 0:
+        return np.zeros((0, dim), dtype=np.float32)
+    return np.ascontiguousarray(embeddings, dtype=np.float32)
+
+
+def write_snapshot(path, model_name: str, text_template: str,
+                   job_texts: List[str], job_embeddings, job_metadata: List[Optional[Dict]],
+                   cv_ids: List[Optional[str]], cv_text_hashes: List[str], cv_embeddings) -> int:
+    """Atomically write a snapshot to path. Returns the number of bytes written."""
+    dim = 0
+    for emb in (job_embeddings, cv_embeddings):
+        if emb is not None and getattr(emb, "ndim", 0) == 2:
+            dim = emb.shape[1]
+            break
+    
+    jobs = _as_matrix(job_embeddings, len(job_texts), dim)
+    cvs = _as_matrix(cv_embeddings, len(cv_ids), dim)
+    body = jobs.tobytes() + cvs.tobytes()
+    
+    header = {
+        "model_name": model_name,
+        "text_template": text_template,
+        "created_at": time.time(),
+        "dim": dim,
+        "dtype": "float32",
+        "body_crc32": zlib.crc32(body),
+        "jobs": {
+            "count": len(job_texts),
+            "ids": [(m or {}).get("id") for m in job_metadata],
+            "text_hashes": [text_hash(t) for t in job_texts],
+            "texts": job_texts,
+            "metadata": job_metadata,
+        },
+        "cvs": {
+            "count": len(cv_ids),
+            "ids": cv_ids,
+            "text_hashes": cv_text_hashes,
+        },
+    }
+    header_bytes = json.dumps(header, ensure_ascii=False, default=str).encode("utf-8")
+    
+    tmp_path = f"{path}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.chmod(tmp_path, 0o600)  # a leftover temp file keeps its old mode
+    with os.fdopen(fd, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return _PREFIX.size + len(header_bytes) + len(body)
+
+
+def read_snapshot(path) -> Dict:
+    """
+    Read a snapshot written by write_snapshot.
+    
+    Returns the header dict with "job_embeddings" and "cv_embeddings"
+    float32 arrays added. Raises SnapshotError if the file is unusable.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        raise SnapshotError(f"Cannot read snapshot {path}: {e}")
+    
+    if len(data) < _PREFIX.size:
+        raise SnapshotError("Snapshot is truncated")
+    magic, version, header_len = _PREFIX.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise SnapshotError("Not a matcher snapshot")
+    if version != FORMAT_VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version}")
+    
+    header_end = _PREFIX.size + header_len
+    try:
+        header = json.loads(data[_PREFIX.size:header_end].decode("utf-8"))
+    except ValueError as e:
+        raise SnapshotError(f"Corrupt snapshot header: {e}")
+    
+    body = memoryview(data)[header_end:]
+    if zlib.crc32(body) != header["body_crc32"]:
+        raise SnapshotError("Snapshot embeddings failed checksum")
+    
+    dim = header["dim"]
+    n_jobs = header["jobs"]["count"]
+    n_cvs = header["cvs"]["count"]
+    if len(body) != (n_jobs + n_cvs) * dim * 4:
+        raise SnapshotError("Snapshot embedding block has unexpected size")
+    
+    matrix = np.frombuffer(body, dtype=np.float32)
+    header["job_embeddings"] = matrix[:n_jobs * dim].reshape(n_jobs, dim) if n_jobs else np.array([])
+    header["cv_embeddings"] = matrix[n_jobs * dim:].reshape(n_cvs, dim) if n_cvs else np.array([])
+    return header
@@ -2,6 +2,7 @@
 Configuration for Job Matcher FastAPI backend.
 """
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -36,6 +37,7 @@ class APIConfig:
     
     # Model settings
     MODEL_NAME = "all-MiniLM-L6-v2"  # sentence-transformers model
+    TEXT_TEMPLATE = "v1"  # Text template version used by DatabaseService
     
     # MongoDB settings
     MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017/utopiahire")
@@ -44,6 +46,17 @@ class APIConfig:
     DEFAULT_TOP_N = 5
     MAX_TOP_N = 50
     BATCH_SIZE = 64
+    SNIPPET_LENGTH = 200  # Characters returned for the "snippet" field
+    
+    # Index snapshot written after each build and loaded on startup
+    SNAPSHOT_PATH = Path(os.getenv(
+        "MATCHER_SNAPSHOT_PATH",
+        str(Path(__file__).parent.parent / "data" / "index_snapshot.bin")
+    ))
+    
+    # Re-embedding migration settings
+    MIGRATION_BATCH_SIZE = 32  # Texts encoded per throttled step
+    MIGRATION_CPU_FRACTION = 0.25  # Share of wall time the shadow build may spend encoding
 
 
 # Environment-specific overrides
@@ -0,0 +1,123 @@
+"""
+Lightweight latency metrics with Prometheus text exposition.
+
+Stage timers record into fixed-bucket histograms: one bisect and a few
+additions under a lock per observation, no allocation, so they can stay on
+in the request path.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple
+
+# Seconds; spans sub-millisecond scoring up to multi-minute index builds
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0,
+)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float):
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+            self.count += 1
+    
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self.counts), self.sum, self.count
+
+
+class MetricsRegistry:
+    """Histograms keyed by (metric name, label value) plus callback gauges."""
+    
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str, str], Histogram] = {}
+        self._help: Dict[str, str] = {}
+        self._gauges: Dict[str, Tuple[str, Callable[[], float]]] = {}
+        self._lock = threading.Lock()
+        self.inflight = 0
+    
+    def histogram(self, name: str, label: str, value: str, help_text: str = "") -> Histogram:
+        key = (name, label, value)
+        hist = self._histograms.get(key)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(key, Histogram())
+                if help_text:
+                    self._help.setdefault(name, help_text)
+        return hist
+    
+    def observe_stage(self, stage: str, seconds: float):
+        self.histogram("matcher_stage_duration_seconds", "stage", stage,
+                       "Time spent per matching stage").observe(seconds)
+    
+    @contextmanager
+    def timer(self, stage: str):
+        """Time a block into the per-stage histogram."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage(stage, time.perf_counter() - t0)
+    
+    def gauge(self, name: str, help_text: str, fn: Callable[[], float]):
+        """Register a gauge evaluated at scrape time."""
+        self._gauges[name] = (help_text, fn)
+    
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            items = sorted(self._histograms.items())
+        
+        current = None
+        for (name, label, value), hist in items:
+            if name != current:
+                current = name
+                if name in self._help:
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} histogram")
+            counts, total, count = hist.snapshot()
+            cumulative = 0
+            for bound, n in zip(hist.buckets, counts):
+                cumulative += n
+                lines.append(f'{name}_bucket{{{label}="{value}",le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{label}="{value}",le="+Inf"}} {count}')
+            lines.append(f'{name}_sum{{{label}="{value}"}} {total}')
+            lines.append(f'{name}_count{{{label}="{value}"}} {count}')
+        
+        for name, (help_text, fn) in sorted(self._gauges.items()):
+            try:
+                value = fn()
+            except Exception:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+        
+        return "\n".join(lines) + "\n"
+
+
+# Global instance
+_metrics = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get singleton metrics registry."""
+    global _metrics
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+    return _metrics
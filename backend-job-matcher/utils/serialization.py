@@ -0,0 +1,29 @@
+"""
+Fast JSON responses for match results.
+
+Match payloads are plain dicts of ints, floats and strings, so they can skip
+Pydantic response validation and go straight to orjson when it is installed.
+"""
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (or compact stdlib json as a fallback)."""
+    
+    def render(self, content: Any) -> bytes:
+        return dumps(content)